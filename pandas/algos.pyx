@@ -47,16 +47,22 @@ cdef np.float64_t MAXfloat64 = np.inf
 cdef double NaN = <double> np.NaN
 cdef double nan = NaN
 
+cdef int64_t iNaT = util.get_nat()
+
 
 cdef inline int int_max(int a, int b): return a if a >= b else b
 cdef inline int int_min(int a, int b): return a if a <= b else b
 
 
-cdef extern from "src/headers/math.h":
+cdef extern from "src/headers/math.h" nogil:
     double sqrt(double x)
     double fabs(double)
+    double asin(double x)
+    double sin(double x)
     int signbit(double)
 
+cdef double PI = 3.141592653589793
+
 from pandas import lib
 
 include "skiplist.pyx"
@@ -2129,5 +2135,510 @@ cdef inline float64_t _median_linear(float64_t* a, int n):
 
     return result
 
+#----------------------------------------------------------------------
+# t-digest quantile sketches
+
+cdef inline float64_t _tdigest_q_limit(float64_t q0,
+                                       float64_t compression) nogil:
+    # the largest quantile a centroid starting at quantile q0 may reach:
+    # one unit of the arcsine scale k(q) = compression / (2 pi) asin(2q - 1)
+    cdef float64_t angle = asin(2 * q0 - 1) + 2 * PI / compression
+    if angle >= PI / 2:
+        return 1.
+    return (sin(angle) + 1) / 2
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_tdigest(ndarray[float64_t] values,
+                  ndarray[float64_t] weights,
+                  ndarray[int64_t] labels,
+                  Py_ssize_t ngroups,
+                  double compression=100):
+    '''
+    Compress the weighted values of each group into a t-digest: centroids
+    (mean, weight) in ascending order of mean, sized by the arcsine scale
+    function so that a group keeps at most about compression centroids and
+    the quantiles near 0 and 1 are the most accurate. The smallest and
+    largest value of a group are kept as centroids of their own, so the
+    quantiles 0 and 1 are the group min and max. The values may be the
+    centroids of other digests, which merges them. NaN values and negative
+    labels are skipped
+
+    Returns
+    -------
+    (labels, means, weights) of the centroids, sorted by group and mean
+    '''
+    cdef:
+        Py_ssize_t i, n, N, idx, nidx, lab, cur_lab
+        float64_t val, w, total, wsofar, cur_mean, cur_w, q_limit
+        bint last
+        ndarray[int64_t] sorter, out_labels
+        ndarray[float64_t] totals, out_means, out_weights
+
+    N = len(values)
+    if not (len(weights) == N and len(labels) == N):
+       raise AssertionError("len(index) != len(labels)")
+
+    totals = np.zeros(ngroups, dtype=np.float64)
+    for i in range(N):
+        lab = labels[i]
+        val = values[i]
+        if lab >= 0 and val == val:
+            totals[lab] += weights[i]
+
+    # group by group in ascending order of the values, NaN sort last
+    sorter = np.lexsort((values, labels)).astype(np.int64)
+
+    out_labels = np.empty(N, dtype=np.int64)
+    out_means = np.empty(N, dtype=np.float64)
+    out_weights = np.empty(N, dtype=np.float64)
+
+    n = 0
+    cur_lab = -1
+    cur_mean = cur_w = total = wsofar = q_limit = 0
+
+    with nogil:
+        for i in range(N):
+            idx = sorter[i]
+            lab = labels[idx]
+            val = values[idx]
+            if lab < 0 or val != val:
+                continue
+            w = weights[idx]
+
+            # the last value of the group, NaN sort after it
+            last = i + 1 == N
+            if not last:
+                nidx = sorter[i + 1]
+                last = labels[nidx] != lab or values[nidx] != values[nidx]
+
+            # the first and last value of the group stay on their own
+            if (lab == cur_lab and wsofar > 0 and not last and
+                    (wsofar + cur_w + w) / total <= q_limit):
+                # fits in the current centroid
+                cur_w += w
+                cur_mean += (val - cur_mean) * w / cur_w
+                continue
+
+            if cur_w > 0:
+                out_labels[n] = cur_lab
+                out_means[n] = cur_mean
+                out_weights[n] = cur_w
+                n += 1
+
+            if lab == cur_lab:
+                wsofar += cur_w
+            else:
+                cur_lab = lab
+                total = totals[lab]
+                wsofar = 0
+
+            q_limit = _tdigest_q_limit(wsofar / total, compression)
+            cur_mean = val
+            cur_w = w
+
+        if cur_w > 0:
+            out_labels[n] = cur_lab
+            out_means[n] = cur_mean
+            out_weights[n] = cur_w
+            n += 1
+
+    return out_labels[:n].copy(), out_means[:n].copy(), out_weights[:n].copy()
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_tdigest_quantile(ndarray[float64_t] out,
+                           ndarray[int64_t] labels,
+                           ndarray[float64_t] means,
+                           ndarray[float64_t] weights,
+                           double q):
+    '''
+    Quantile q of each group from its t-digest centroids as returned by
+    group_tdigest, interpolating linearly between the centroid centers.
+    Groups without centroids are NaN
+    '''
+    cdef:
+        Py_ssize_t i, start, end, n, ngroups, lab
+        float64_t total, target, cum, center, prev_center, result
+        bint found
+
+    n = len(means)
+    ngroups = len(out)
+    if not (len(weights) == n and len(labels) == n):
+       raise AssertionError("len(index) != len(labels)")
+
+    with nogil:
+        for i in range(ngroups):
+            out[i] = NaN
+
+        start = 0
+        while start < n:
+            lab = labels[start]
+            total = 0
+            end = start
+            while end < n and labels[end] == lab:
+                total += weights[end]
+                end += 1
+
+            target = q * total
+            prev_center = weights[start] / 2
+            if target <= prev_center:
+                result = means[start]
+            else:
+                found = 0
+                cum = weights[start]
+                for i in range(start + 1, end):
+                    center = cum + weights[i] / 2
+                    if target <= center:
+                        result = (means[i - 1] + (means[i] - means[i - 1]) *
+                                  (target - prev_center) /
+                                  (center - prev_center))
+                        found = 1
+                        break
+                    prev_center = center
+                    cum += weights[i]
+
+                if not found:
+                    result = means[end - 1]
+
+            if 0 <= lab < ngroups:
+                out[lab] = result
+            start = end
+
+
+def group_approx_quantile(ndarray[float64_t, ndim=2] out,
+                          ndarray[int64_t] counts,
+                          ndarray[float64_t, ndim=2] values,
+                          ndarray[int64_t] labels,
+                          double q=0.5, double compression=100):
+    '''
+    Approximate quantile q of each group from a t-digest of its values, see
+    group_tdigest. Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, lab
+        ndarray[float64_t] ones, result
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    ngroups = len(counts)
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab >= 0:
+            counts[lab] += 1
+
+    ones = np.ones(N, dtype=np.float64)
+    result = np.empty(ngroups, dtype=np.float64)
+    for j in range(K):
+        digest_labels, means, weights = group_tdigest(values[:, j], ones,
+                                                      labels, ngroups,
+                                                      compression)
+        group_tdigest_quantile(result, digest_labels, means, weights, q)
+        for i in range(ngroups):
+            out[i, j] = result[i]
+
+#----------------------------------------------------------------------
+# several reductions in a single pass
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_fused_float64(ndarray[float64_t, ndim=2] nobs,
+                        ndarray[float64_t, ndim=2] sumx,
+                        ndarray[float64_t, ndim=2] sumxx,
+                        ndarray[float64_t, ndim=2] prodx,
+                        ndarray[float64_t, ndim=2] minx,
+                        ndarray[float64_t, ndim=2] maxx,
+                        ndarray[int64_t] counts,
+                        ndarray[float64_t, ndim=2] values,
+                        ndarray[int64_t] labels,
+                        bint do_sumsq=1, bint do_prod=1, bint do_minmax=1):
+    '''
+    Accumulate the non-NA count and sum of each group, and the sum of
+    squares, product and min / max when asked for, in one pass over values.
+
+    The accumulators have shape (ngroups, K) and must be initialized by the
+    caller: nobs, sumx and sumxx with 0, prodx with 1, minx with inf and maxx
+    with -inf. Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+                    if do_sumsq:
+                        sumxx[lab, j] += val * val
+                    if do_prod:
+                        prodx[lab, j] *= val
+                    if do_minmax:
+                        if val < minx[lab, j]:
+                            minx[lab, j] = val
+                        if val > maxx[lab, j]:
+                            maxx[lab, j] = val
+
+#----------------------------------------------------------------------
+# group transforms, the output is like-indexed with the values
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum(ndarray[float64_t, ndim=2] out,
+                 ndarray[float64_t, ndim=2] values,
+                 ndarray[int64_t] labels,
+                 Py_ssize_t ngroups):
+    '''
+    Only transforms on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+    accum = np.zeros((ngroups, K), dtype=np.float64)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                for j in range(K):
+                    out[i, j] = NaN
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    accum[lab, j] += val
+                    out[i, j] = accum[lab, j]
+                else:
+                    out[i, j] = NaN
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod(ndarray[float64_t, ndim=2] out,
+                  ndarray[float64_t, ndim=2] values,
+                  ndarray[int64_t] labels,
+                  Py_ssize_t ngroups):
+    '''
+    Only transforms on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+    accum = np.ones((ngroups, K), dtype=np.float64)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                for j in range(K):
+                    out[i, j] = NaN
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    accum[lab, j] *= val
+                    out[i, j] = accum[lab, j]
+                else:
+                    out[i, j] = NaN
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_rank(ndarray[float64_t, ndim=2] out,
+               ndarray[float64_t, ndim=2] values,
+               ndarray[int64_t] labels,
+               Py_ssize_t ngroups,
+               ties_method='average', ascending=True):
+    '''
+    Rank of the values within their group, NaN values are not ranked. Only
+    transforms on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, k, m, N, K, lab, idx, start
+        Py_ssize_t rank_base, dense
+        float64_t val
+        int tiebreak = 0
+        ndarray[int64_t] sorter
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    if ties_method == 'dense':
+        tiebreak = -1
+    else:
+        tiebreak = tiebreakers[ties_method]
+
+    N, K = (<object> values).shape
+
+    for j in range(K):
+        # group by group in ascending order of the values, NaN sort last and
+        # the stable sort keeps ties in the order of appearance
+        if ascending:
+            sorter = np.lexsort((values[:, j], labels)).astype(np.int64)
+        else:
+            sorter = np.lexsort((-values[:, j], labels)).astype(np.int64)
+
+        lab = -1
+        rank_base = dense = 0
+        i = 0
+        while i < N:
+            idx = sorter[i]
+            val = values[idx, j]
+            if labels[idx] < 0 or val != val:
+                out[idx, j] = NaN
+                i += 1
+                continue
+
+            if labels[idx] != lab:
+                lab = labels[idx]
+                rank_base = dense = 0
+
+            # the run [start, k) of tied values
+            start = i
+            k = i + 1
+            while (k < N and labels[sorter[k]] == lab and
+                   fabs(values[sorter[k], j] - val) <= FP_ERR):
+                k += 1
+            dense += 1
+
+            for m in range(start, k):
+                idx = sorter[m]
+                if tiebreak == TIEBREAK_AVERAGE:
+                    out[idx, j] = rank_base + (k - start + 1) / 2.0
+                elif tiebreak == TIEBREAK_MIN:
+                    out[idx, j] = rank_base + 1
+                elif tiebreak == TIEBREAK_MAX:
+                    out[idx, j] = rank_base + k - start
+                elif tiebreak == TIEBREAK_FIRST:
+                    out[idx, j] = rank_base + m - start + 1
+                else:
+                    out[idx, j] = dense
+
+            rank_base += k - start
+            i = k
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_shift_indexer(ndarray[int64_t] out,
+                        ndarray[int64_t] labels,
+                        Py_ssize_t ngroups, Py_ssize_t periods):
+    '''
+    Indexer of the row `periods` rows before (after, if negative) each row
+    within its group, -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i, ii, N, lab, offset, slot
+        ndarray[int64_t] seen
+        ndarray[int64_t, ndim=2] ring
+
+    N = len(labels)
+    offset = periods if periods > 0 else -periods
+
+    if offset == 0:
+        for i in range(N):
+            out[i] = i if labels[i] >= 0 else -1
+        return
+
+    # the last `offset` rows of each group
+    seen = np.zeros(ngroups, dtype=np.int64)
+    ring = np.empty((ngroups, offset), dtype=np.int64)
+
+    with nogil:
+        for ii in range(N):
+            i = ii if periods > 0 else N - 1 - ii
+            lab = labels[i]
+            if lab < 0:
+                out[i] = -1
+                continue
+
+            slot = seen[lab] % offset
+            if seen[lab] >= offset:
+                out[i] = ring[lab, slot]
+            else:
+                out[i] = -1
+            ring[lab, slot] = i
+            seen[lab] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_fillna_indexer(ndarray[int64_t] out,
+                         ndarray[int64_t] labels,
+                         ndarray[uint8_t, cast=True] mask,
+                         Py_ssize_t ngroups,
+                         object limit=None, bint backward=0):
+    '''
+    Indexer propagating the last (next, if backward) valid row of each
+    group into the missing (masked) rows, -1 where nothing can be filled
+    '''
+    cdef:
+        Py_ssize_t i, ii, N, lab, lim
+        ndarray[int64_t] last, nfilled
+
+    N = len(labels)
+    if limit is None:
+        lim = N
+    else:
+        lim = limit
+
+    last = np.empty(ngroups, dtype=np.int64)
+    last.fill(-1)
+    nfilled = np.zeros(ngroups, dtype=np.int64)
+
+    with nogil:
+        for ii in range(N):
+            i = N - 1 - ii if backward else ii
+            lab = labels[i]
+            if lab < 0:
+                out[i] = -1
+            elif not mask[i]:
+                last[lab] = i
+                nfilled[lab] = 0
+                out[i] = i
+            elif last[lab] >= 0 and nfilled[lab] < lim:
+                nfilled[lab] += 1
+                out[i] = last[lab]
+            else:
+                out[i] = -1
+
+
 include "join.pyx"
 include "generated.pyx"
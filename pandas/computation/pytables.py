@@ -6,6 +6,7 @@ import warnings
 from functools import partial
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from pandas.compat import u, string_types, PY3
 from pandas.core.base import StringMixin
@@ -208,6 +209,14 @@ class BinOp(ops.BinOp):
         pass
 
 
+def _filter_isin(axis, vals):
+    return axis.isin(vals)
+
+
+def _filter_notin(axis, vals):
+    return ~axis.isin(vals)
+
+
 class FilterBinOp(BinOp):
 
     def __unicode__(self):
@@ -269,9 +278,9 @@ class FilterBinOp(BinOp):
 
     def generate_filter_op(self, invert=False):
         if (self.op == '!=' and not invert) or (self.op == '==' and invert):
-            return lambda axis, vals: ~axis.isin(vals)
+            return _filter_notin
         else:
-            return lambda axis, vals: axis.isin(vals)
+            return _filter_isin
 
 
 class JointFilterBinOp(FilterBinOp):
@@ -285,6 +294,9 @@ class JointFilterBinOp(FilterBinOp):
 
 class ConditionBinOp(BinOp):
 
+    # the kinds whose converted values compare with the stored values
+    _zone_kinds = set(['integer', 'float', 'datetime64', 'timedelta64'])
+
     def __unicode__(self):
         return com.pprint_thing("[Condition : [{0}]]".format(self.condition))
 
@@ -330,6 +342,43 @@ class ConditionBinOp(BinOp):
 
         return self
 
+    def zone_mask(self, zone_map):
+        """ return a boolean array of the row groups that may hold rows
+        satisfying the condition, or None if any of them may
+
+        Parameters
+        ----------
+        zone_map : callable, return the (mins, maxs) arrays of the row groups
+            of a column, or None if unknown
+        """
+        if self.condition is None or self.op == '!=':
+            return None
+        if _ensure_decoded(self.kind) not in self._zone_kinds:
+            return None
+
+        bounds = zone_map(self.lhs)
+        if bounds is None:
+            return None
+        mins, maxs = bounds
+
+        values = [self.convert_value(v).converted
+                  for v in self.conform(self.rhs)]
+        v = values[0]
+        if self.op == '==':
+            mask = np.zeros(len(mins), dtype=bool)
+            for v in values:
+                mask |= (mins <= v) & (maxs >= v)
+            return mask
+        elif self.op == '<':
+            return mins < v
+        elif self.op == '<=':
+            return mins <= v
+        elif self.op == '>':
+            return maxs > v
+        elif self.op == '>=':
+            return maxs >= v
+        return None
+
 
 class JointConditionBinOp(ConditionBinOp):
 
@@ -340,6 +389,21 @@ class JointConditionBinOp(ConditionBinOp):
             self.rhs.condition)
         return self
 
+    def zone_mask(self, zone_map):
+        left = self.lhs.zone_mask(zone_map)
+        right = self.rhs.zone_mask(zone_map)
+        if self.op == '&':
+            if left is None:
+                return right
+            if right is None:
+                return left
+            return left & right
+        elif self.op == '|':
+            if left is None or right is None:
+                return None
+            return left | right
+        return None
+
 
 class UnaryOp(ops.UnaryOp):
 
@@ -555,10 +619,11 @@ class TermValue(object):
 
     def tostring(self, encoding):
         """ quote the string if not encoded
-            else encode and return """
+            else return the repr of the encoded bytes (a quoted literal on
+            py2, b'...' on py3) """
         if self.kind == u('string'):
             if encoding is not None:
-                return self.converted
+                return repr(self.converted)
             return '"%s"' % self.converted
         return self.converted
 
@@ -281,6 +281,31 @@ with cf.config_prefix('mode'):
                        cb=use_inf_as_null_cb)
 
 
+groupby_threads_doc = """
+: int
+    Number of threads used by the Cython groupby aggregations (sum, mean,
+    etc.) of DataFrames. The blocks and column slices of the frame are
+    aggregated concurrently, the group kernels release the GIL. The default
+    of 1 aggregates on the calling thread only.
+"""
+
+groupby_cache_size_doc = """
+: int
+    Number of factorized groupby keys (group labels, compressed group ids
+    and sort indexers) kept for reuse by later groupby operations on the
+    same frame columns, least recently used first out. Entries are
+    invalidated by any write to the frame; writing into its values array
+    directly is not detected. Other key arrays are not cached. The default
+    of 0 disables the cache.
+"""
+
+with cf.config_prefix('compute'):
+    cf.register_option('groupby_threads', 1, groupby_threads_doc,
+                       validator=is_int)
+    cf.register_option('groupby_cache_size', 0, groupby_cache_size_doc,
+                       validator=is_int)
+
+
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
 : string
@@ -12,13 +12,16 @@ from pandas.util.terminal import get_terminal_size
 from pandas.core.config import get_option, set_option, reset_option
 import pandas.core.common as com
 import pandas.lib as lib
+import pandas.tslib as tslib
 
 import numpy as np
 
 import itertools
 import csv
+import re
 
 from pandas.tseries.period import PeriodIndex
+from pandas.tseries.index import DatetimeIndex
 
 docstring_to_string = """
      Parameters
@@ -787,7 +790,7 @@ class CSVFormatter(object):
                  cols=None, header=True, index=True, index_label=None,
                  mode='w', nanRep=None, encoding=None, quoting=None,
                  line_terminator='\n', chunksize=None, engine=None,
-                 tupleize_cols=False, quotechar='"'):
+                 tupleize_cols=False, quotechar='"', date_format=None):
 
         self.engine = engine  # remove for 0.13
         self.obj = obj
@@ -796,6 +799,7 @@ class CSVFormatter(object):
         self.sep = sep
         self.na_rep = na_rep
         self.float_format = float_format
+        self.date_format = date_format
 
         self.header = header
         self.index = index
@@ -864,6 +868,17 @@ class CSVFormatter(object):
         if not index:
             self.nlevels = 0
 
+        # format the chunks with lib.write_csv_columns rather than the csv
+        # module, for the dialects it implements
+        self.native_float_format = _native_float_format(float_format)
+        self.native = (engine != 'python' and
+                       quoting in (csv.QUOTE_MINIMAL, csv.QUOTE_ALL) and
+                       (compat.PY3 or encoding is None) and
+                       _is_ascii_char(sep) and _is_ascii_char(quotechar) and
+                       _is_ascii(line_terminator) and
+                       len(line_terminator) > 0 and
+                       isinstance(na_rep, compat.string_types))
+
     # original python implem. of df.to_csv
     # invoked by df.to_csv(engine=python)
     def _helper_csv(self, writer, na_rep=None, cols=None,
@@ -962,6 +977,7 @@ class CSVFormatter(object):
                 self.writer = com.UnicodeWriter(f, **writer_kwargs)
             else:
                 self.writer = csv.writer(f, **writer_kwargs)
+            self.f = f
 
             if self.engine == 'python':
             # to be removed in 0.13
@@ -1087,16 +1103,140 @@ class CSVFormatter(object):
         slicer = slice(start_i,end_i)
         for i in range(len(self.blocks)):
             b = self.blocks[i]
-            d = b.to_native_types(slicer=slicer, na_rep=self.na_rep, float_format=self.float_format)
+            if self.native:
+                d = self._native_block_columns(b, slicer)
+            else:
+                d = b.to_native_types(slicer=slicer, na_rep=self.na_rep,
+                                      float_format=self.float_format,
+                                      date_format=self.date_format)
             for i, item in enumerate(b.items):
 
                 # self.data is a preallocated list
                 self.data[self.column_map[b][i]] = d[i]
 
-        ix = data_index.to_native_types(slicer=slicer, na_rep=self.na_rep, float_format=self.float_format)
+        if self.native:
+            # float blocks in a format only Python can apply are already
+            # formatted as CSV_LIST columns
+            float_format = self.native_float_format
+            if float_format is None:
+                float_format = lib.CSV_REPR_FORMAT
+            ix = self._native_index_columns(slicer)
+            lib.write_csv_columns(ix + self.data, end_i - start_i, self.f,
+                                  self.sep, self.quotechar,
+                                  self.line_terminator,
+                                  self.quoting == csv.QUOTE_ALL, self.na_rep,
+                                  float_format)
+            return
+
+        ix = data_index.to_native_types(slicer=slicer, na_rep=self.na_rep,
+                                        float_format=self.float_format,
+                                        date_format=self.date_format)
 
         lib.write_csv_rows(self.data, ix, self.nlevels, self.cols, self.writer)
 
+    def _native_block_columns(self, b, slicer):
+        """
+        The (kind, values) columns of a block passed to lib.write_csv_columns:
+        numeric and datetime values as they are, the other blocks and formats
+        converted by to_native_types.
+        """
+        kind = None
+        if b.is_sparse or b.is_timedelta:
+            pass
+        elif b.is_float:
+            if (self.native_float_format is not None and
+                    not get_option('mode.use_inf_as_null')):
+                kind, dtype = lib.CSV_FLOAT, np.float64
+        elif b.is_integer:
+            if not (b.dtype.kind == 'u' and b.dtype.itemsize == 8):
+                kind, dtype = lib.CSV_INT, np.int64
+        elif b.is_bool:
+            kind, dtype = lib.CSV_BOOL, np.bool_
+        elif b.is_datetime:
+            if self.date_format is None:
+                kind, dtype = lib.CSV_DATETIME, b.dtype
+
+        if kind is None:
+            d = b.to_native_types(slicer=slicer, na_rep=self.na_rep,
+                                  float_format=self.float_format,
+                                  date_format=self.date_format)
+            return [(lib.CSV_LIST, values) for values in d]
+
+        values = b.values[:, slicer]
+        if values.dtype != dtype:
+            values = values.astype(dtype)
+        return [(kind, v) for v in values]
+
+    def _native_index_columns(self, slicer):
+        """
+        The (kind, values) columns of the index levels of a chunk.
+        """
+        if self.nlevels == 0:
+            return []
+
+        index = self.data_index[slicer]
+        if isinstance(index, DatetimeIndex):
+            if index.tz is None and self.date_format is None:
+                # dates only when all the times are midnight
+                values = index.asi8
+                times = values[values != tslib.iNaT] % (86400 * 10 ** 9)
+                if (times == 0).all():
+                    return [(lib.CSV_DATE, index.values)]
+                return [(lib.CSV_DATETIME, index.values)]
+        elif self.nlevels == 1 and index.dtype == np.int64:
+            return [(lib.CSV_INT, index.values)]
+
+        ix = index.to_native_types(na_rep=self.na_rep,
+                                   float_format=self.float_format,
+                                   date_format=self.date_format)
+        if self.nlevels == 1:
+            return [(lib.CSV_LIST, ix)]
+        return [(lib.CSV_LIST, list(level)) for level in zip(*ix)]
+
+
+_native_float_re = re.compile(r'^([^%]*)%([+#]*)(?:\.(\d+))?([eEfFgG])([^%]*)$')
+
+
+def _native_float_format(float_format):
+    """
+    The (prefix, code, precision, flags, suffix) arguments of
+    lib.write_csv_columns formatting floats like float_format, None for the
+    formats only Python can apply.
+    """
+    if float_format is None:
+        return lib.CSV_REPR_FORMAT
+
+    if not isinstance(float_format, compat.string_types):
+        return None
+    match = _native_float_re.match(float_format)
+    if match is None or not _is_ascii(float_format):
+        return None
+
+    prefix, flag_chars, precision, code, suffix = match.groups()
+    flags = 0
+    if '+' in flag_chars:
+        flags |= lib.CSV_FLOAT_SIGN
+    if '#' in flag_chars:
+        flags |= lib.CSV_FLOAT_ALT
+    if precision is None:
+        precision = 6
+    return (prefix.encode('ascii'), code.encode('ascii'), int(precision),
+            flags, suffix.encode('ascii'))
+
+
+def _is_ascii(s):
+    if not isinstance(s, compat.string_types):
+        return False
+    try:
+        s.encode('ascii')
+    except UnicodeError:
+        return False
+    return True
+
+
+def _is_ascii_char(s):
+    return _is_ascii(s) and len(s) == 1
+
 # from collections import namedtuple
 # ExcelCell = namedtuple("ExcelCell",
 #                        'row, col, val, style, mergestart, mergeend')
@@ -59,10 +59,14 @@ class NDFrame(PandasObject):
     copy : boolean, default False
     """
     _internal_names = [
-        '_data', 'name', '_cacher', '_subtyp', '_index', '_default_kind', '_default_fill_value']
+        '_data', 'name', '_cacher', '_subtyp', '_index', '_default_kind', '_default_fill_value',
+        '_version']
     _internal_names_set = set(_internal_names)
     _prop_attributes = []
 
+    # number of writes to the object, see _bump_version
+    _version = 0
+
     def __init__(self, data, axes=None, copy=False, dtype=None, fastpath=False):
 
         if not fastpath:
@@ -824,6 +828,7 @@ class NDFrame(PandasObject):
         """ the object has called back to us saying
         maybe it has changed """
         self._data.set(item, value)
+        self._bump_version()
 
     def _maybe_update_cacher(self, clear=False):
         """ see if we need to update our parent cacher
@@ -839,6 +844,18 @@ class NDFrame(PandasObject):
             self._item_cache.pop(i,None)
         else:
             self._item_cache.clear()
+        self._bump_version()
+
+    def _bump_version(self):
+        """ record a write to the object, and to the object it was
+        taken from (if any), so that results derived from its values
+        can tell they are stale """
+        object.__setattr__(self, '_version', self._version + 1)
+        cacher = self.__dict__.get('_cacher')
+        if cacher is not None:
+            parent = cacher[1]()
+            if parent is not None:
+                parent._bump_version()
 
     def _set_item(self, key, value):
         self._data.set(key, value)
@@ -1303,6 +1320,8 @@ class NDFrame(PandasObject):
         """After regular attribute access, try looking up the name of the info
         This allows simpler access to columns for interactive use."""
         if name in self._internal_names_set:
+            if name == '_data' and value is not self.__dict__.get('_data'):
+                self._bump_version()
             object.__setattr__(self, name, value)
         else:
             try:
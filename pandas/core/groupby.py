@@ -1,13 +1,16 @@
 import types
+import warnings
+import weakref
 import numpy as np
 
 from pandas.compat import(
-    zip, builtins, range, long, lrange, lzip, OrderedDict, callable
+    zip, builtins, range, long, lrange, lzip, OrderedDict, callable, cPickle
 )
 from pandas import compat
 
 from pandas.core.base import PandasObject
 from pandas.core.categorical import Categorical
+from pandas.core.config import get_option
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
 from pandas.core.index import Index, MultiIndex, _ensure_index
@@ -316,6 +319,14 @@ class GroupBy(PandasObject):
         Parameters
         ----------
         func : function
+        apply_n_jobs : int, default 1
+            Number of worker processes to apply func on. The groups are split
+            into batches of about equal size, one per worker, and the sorted
+            data of each batch is sent to its worker once. -1 uses all the
+            CPUs. The result is the same as with the default of 1, which
+            applies func in this process. Where the workers are not forked
+            (Windows), func and its arguments must be picklable. Groups of
+            bins (resample) are always applied in this process
 
         Notes
         -----
@@ -329,12 +340,14 @@ class GroupBy(PandasObject):
         -------
         applied : type depending on grouped object and function
         """
+        n_jobs = kwargs.pop('apply_n_jobs', 1)
         func = _intercept_function(func)
-        f = lambda g: func(g, *args, **kwargs)
-        return self._python_apply_general(f)
+        f = _ApplyFunction(func, args, kwargs)
+        return self._python_apply_general(f, n_jobs=n_jobs)
 
-    def _python_apply_general(self, f):
-        keys, values, mutated = self.grouper.apply(f, self.obj, self.axis)
+    def _python_apply_general(self, f, n_jobs=1):
+        keys, values, mutated = self.grouper.apply(f, self.obj, self.axis,
+                                                   n_jobs=n_jobs)
 
         return self._wrap_applied_output(keys, values,
                                          not_indexed_same=mutated)
@@ -409,6 +422,69 @@ class GroupBy(PandasObject):
             f = lambda x: x.var(ddof=ddof)
             return self._python_agg_general(f)
 
+    def approx_quantile(self, q=0.5, compression=100):
+        """
+        Compute approximate quantile of groups, excluding missing values,
+        from a t-digest of each group (see tdigest)
+
+        For multiple groupings, the result index will be a MultiIndex
+
+        Parameters
+        ----------
+        q : float, default 0.5
+            0 <= q <= 1, the quantile to compute
+        compression : float, default 100
+            Keep at most about this many centroids per group, the rank
+            error is at most about 2 pi sqrt(q (1 - q)) / compression
+        """
+        _check_tdigest_args(q, compression)
+        try:
+            return self._cython_agg_general('approx_quantile', q=q,
+                                            compression=compression)
+        except NotImplementedError:
+            # dtypes without a kernel, e.g. datetime64
+            f = lambda x: x.quantile(q)
+            return self._python_agg_general(f)
+
+    def tdigest(self, compression=100):
+        """
+        Compute a t-digest of each group, excluding missing values: a sketch
+        of at most about compression centroids per group, from which any
+        quantile can be approximated and which can be merged with the
+        digests of other chunks of data
+
+        Parameters
+        ----------
+        compression : float, default 100
+
+        Returns
+        -------
+        digest : GroupedTDigest
+        """
+        _check_tdigest_args(0.5, compression)
+        if isinstance(self.grouper, BinGrouper):
+            raise NotImplementedError('tdigest is not implemented for '
+                                      'bin groupers')
+
+        comp_ids, _, ngroups = self.grouper.group_info
+
+        centroids = OrderedDict()
+        for name, obj in self._iterate_slices():
+            if not _is_numeric_dtype(obj.dtype):
+                continue
+
+            values = com._ensure_float64(obj.values)
+            weights = np.ones(len(values), dtype=np.float64)
+            centroids[name] = _algos.group_tdigest(values, weights, comp_ids,
+                                                   ngroups, compression)
+
+        if len(centroids) == 0:
+            raise DataError('No numeric types to aggregate')
+
+        return GroupedTDigest(self.grouper.result_index, centroids,
+                              compression=compression,
+                              squeeze=isinstance(self, SeriesGroupBy))
+
     def size(self):
         """
         Compute group sizes
@@ -441,6 +517,72 @@ class GroupBy(PandasObject):
                 return np.nan
         return self.agg(picker)
 
+    def cumsum(self):
+        """
+        Compute cumulative sum within each group, skipping missing values
+        """
+        fallback = lambda grouped: grouped._make_wrapper('cumsum')()
+        return self._cython_transform('cumsum', fallback)
+
+    def cumprod(self):
+        """
+        Compute cumulative product within each group, skipping missing values
+        """
+        fallback = lambda grouped: grouped._make_wrapper('cumprod')()
+        return self._cython_transform('cumprod', fallback)
+
+    def shift(self, periods=1, freq=None):
+        """
+        Shift the values of each group by the desired number of periods
+        """
+        fallback = lambda grouped: grouped._make_wrapper('shift')(periods,
+                                                                  freq=freq)
+        if freq is not None:
+            return fallback(self)
+        return self._cython_transform('shift', fallback, numeric_only=False,
+                                      periods=periods)
+
+    def rank(self, method='average', ascending=True, na_option='keep'):
+        """
+        Compute numerical data ranks (1 through n) within each group
+
+        Parameters
+        ----------
+        method : {'average', 'min', 'max', 'first', 'dense'}
+        ascending : boolean, default True
+        na_option : {'keep', 'top', 'bottom'}
+        """
+        fallback = lambda grouped: grouped._make_wrapper('rank')(
+            method=method, ascending=ascending, na_option=na_option)
+        if na_option != 'keep' or method not in _rank_methods:
+            return fallback(self)
+        return self._cython_transform('rank', fallback, ties_method=method,
+                                      ascending=ascending)
+
+    def ffill(self, limit=None):
+        """
+        Forward fill missing values within each group
+        """
+        return self.fillna(method='ffill', limit=limit)
+
+    def bfill(self, limit=None):
+        """
+        Backward fill missing values within each group
+        """
+        return self.fillna(method='bfill', limit=limit)
+
+    def fillna(self, value=None, method=None, limit=None, **kwargs):
+        """
+        Fill missing values within each group, see Series.fillna. Filling
+        forward or backward does not cross the group boundaries.
+        """
+        fallback = lambda grouped: grouped._make_wrapper('fillna')(
+            value=value, method=method, limit=limit, **kwargs)
+        if value is not None or kwargs or method not in _fill_methods:
+            return fallback(self)
+        return self._cython_transform(_fill_methods[method], fallback,
+                                      numeric_only=False, limit=limit)
+
     def _try_cast(self, result, obj):
         """ try to cast the result to our obj original type,
         we may have roundtripped thru object in the mean-time """
@@ -454,7 +596,7 @@ class GroupBy(PandasObject):
 
         return result
 
-    def _cython_agg_general(self, how, numeric_only=True):
+    def _cython_agg_general(self, how, numeric_only=True, **kwargs):
         output = {}
         for name, obj in self._iterate_slices():
             is_numeric = _is_numeric_dtype(obj.dtype)
@@ -462,7 +604,8 @@ class GroupBy(PandasObject):
                 continue
 
             try:
-                result, names = self.grouper.aggregate(obj.values, how)
+                result, names = self.grouper.aggregate(obj.values, how,
+                                                       **kwargs)
             except AssertionError as e:
                 raise GroupByError(str(e))
             output[name] = self._try_cast(result, obj)
@@ -472,6 +615,36 @@ class GroupBy(PandasObject):
 
         return self._wrap_aggregated_output(output, names)
 
+    def _cython_transform(self, how, fallback, numeric_only=True, **kwargs):
+        """
+        Like-indexed group transform in a single Cython pass over the group
+        labels. fallback, called with a GroupBy, is the per-group python path
+        of the method, used for the cases the Cython kernels can not handle
+        """
+        if isinstance(self.grouper, BinGrouper):
+            return fallback(self)
+
+        try:
+            return self._cython_transform_general(
+                how, fallback, numeric_only=numeric_only, **kwargs)
+        except (TypeError, NotImplementedError):
+            return fallback(self)
+
+    def _regroup(self, obj):
+        """
+        Group obj, which shares the grouped axis of self.obj, the same way
+        """
+        return type(self)(obj, grouper=self.grouper, axis=self.axis)
+
+    def _cython_transform_general(self, how, fallback, numeric_only=True,
+                                  **kwargs):
+        obj = self.obj
+        if numeric_only and not _is_numeric_dtype(obj.dtype):
+            raise TypeError('cannot transform non-numeric values')
+
+        result = self.grouper.transform(obj.values, how, **kwargs)
+        return Series(result, index=obj.index, name=obj.name)
+
     def _python_agg_general(self, func, *args, **kwargs):
         func = _intercept_function(func)
         f = lambda x: func(x, *args, **kwargs)
@@ -505,6 +678,44 @@ class GroupBy(PandasObject):
     def _wrap_applied_output(self, *args, **kwargs):
         raise NotImplementedError
 
+    def _filter_by_mask(self, mask, dropna=True):
+        """
+        Filter with a boolean Series indexed by group key (or array of
+        length ngroups), broadcast to the rows through the group labels
+        without looking at the groups themselves
+        """
+        if isinstance(self.grouper, BinGrouper):
+            raise NotImplementedError('filtering with a boolean mask is not '
+                                      'implemented for bin groupers')
+
+        comp_ids, _, ngroups = self.grouper.group_info
+
+        if isinstance(mask, Series):
+            index = self.grouper.result_index
+            if not mask.index.equals(index):
+                # groups missing from the mask are filtered out
+                mask = mask.reindex(index).fillna(False)
+            mask = mask.values
+        mask = np.asarray(mask)
+
+        if len(mask) != ngroups:
+            raise ValueError('boolean mask has length %d, expected one '
+                             'value per group (%d)' % (len(mask), ngroups))
+        if mask.dtype == np.object_ and lib.is_bool_array(mask):
+            mask = mask.astype(bool)
+        elif mask.dtype != np.bool_:
+            raise TypeError("the filter must return a boolean result")
+
+        # rows with a missing key (-1) take the trailing False
+        row_mask = np.append(mask, False).take(comp_ids)
+        filtered = self.obj.take(row_mask.nonzero()[0], axis=self.axis,
+                                 convert=False)
+        if dropna:
+            return filtered
+        else:
+            ax = self.obj._get_axis(self.axis)
+            return filtered.reindex_axis(ax, axis=self.axis)  # Fill with NaNs.
+
     def _concat_objects(self, keys, values, not_indexed_same=False):
         from pandas.tools.merge import concat
 
@@ -562,12 +773,24 @@ class Grouper(object):
     """
 
     """
+    sort = True
+    _cache_entry = None
+
     def __init__(self, axis, groupings, sort=True, group_keys=True):
         self.axis = axis
         self.groupings = groupings
         self.sort = sort
         self.group_keys = group_keys
         self.compressed = True
+        self._cache_entry = _group_info_cache.lookup(groupings, axis, sort)
+
+        if self._cache_entry is not None and 'labels' in self._cache_entry:
+            for ping, (labels, uniques) in zip(groupings,
+                                               self._cache_entry['labels']):
+                if uniques.name != ping.name:
+                    uniques = Index(uniques, name=ping.name)
+                ping._labels = labels
+                ping._group_index = uniques
 
     @property
     def shape(self):
@@ -597,8 +820,16 @@ class Grouper(object):
 
     def _get_splitter(self, data, axis=0, keep_internal=True):
         comp_ids, _, ngroups = self.group_info
-        return get_splitter(data, comp_ids, ngroups, axis=axis,
-                            keep_internal=keep_internal)
+        splitter = get_splitter(data, comp_ids, ngroups, axis=axis,
+                                keep_internal=keep_internal, sort=self.sort)
+
+        entry = self._cache_entry
+        if entry is not None:
+            if 'sort_idx' in entry:
+                splitter.sort_idx = entry['sort_idx']
+            else:
+                entry['sort_idx'] = splitter.sort_idx
+        return splitter
 
     def _get_group_keys(self):
         if len(self.groupings) == 1:
@@ -609,12 +840,19 @@ class Grouper(object):
             mapper = _KeyMapper(comp_ids, ngroups, self.labels, self.levels)
             return [mapper.get_key(i) for i in range(ngroups)]
 
-    def apply(self, f, data, axis=0, keep_internal=False):
+    def apply(self, f, data, axis=0, keep_internal=False, n_jobs=1):
         mutated = False
         splitter = self._get_splitter(data, axis=axis,
                                       keep_internal=keep_internal)
         group_keys = self._get_group_keys()
 
+        n_jobs = _validate_n_jobs(n_jobs)
+        if (n_jobs > 1 and isinstance(data, (Series, DataFrame))
+                and self.ngroups > 1):
+            values, mutated = self._parallel_apply(f, splitter, group_keys,
+                                                   n_jobs)
+            return group_keys, values, mutated
+
         # oh boy
         if hasattr(splitter, 'fast_apply') and axis == 0:
             try:
@@ -638,6 +876,49 @@ class Grouper(object):
 
         return group_keys, result_values, mutated
 
+    def _parallel_apply(self, f, splitter, group_keys, n_jobs):
+        """
+        Apply f to the groups on a pool of n_jobs processes. The groups are
+        cut into contiguous batches holding about the same number of rows,
+        the sorted data of a batch is chopped into its groups by the worker,
+        so the results come back in group order
+        """
+        import multiprocessing
+
+        if not _forks_workers():
+            # f reaches the workers through the pickled pool initializer
+            try:
+                cPickle.dumps(f, cPickle.HIGHEST_PROTOCOL)
+            except Exception:
+                raise TypeError('the function must be picklable to be '
+                                'applied with apply_n_jobs > 1 where worker '
+                                'processes are not forked')
+
+        starts, ends = lib.generate_slices(splitter.slabels, splitter.ngroups)
+        sdata = splitter._get_sorted_data()
+
+        tasks = []
+        for lo, hi in _balanced_batches(ends - starts, n_jobs):
+            offset = starts[lo]
+            chunk = splitter._chop(sdata, slice(offset, ends[hi - 1]))
+            tasks.append((chunk, list(group_keys[lo:hi]),
+                          starts[lo:hi] - offset, ends[lo:hi] - offset,
+                          splitter.axis))
+
+        pool = multiprocessing.Pool(len(tasks), _init_apply_worker, (f,))
+        try:
+            batches = pool.map(_apply_batch, tasks)
+        finally:
+            pool.terminate()
+            pool.join()
+
+        values = []
+        mutated = False
+        for batch_values, batch_mutated in batches:
+            values.extend(batch_values)
+            mutated = mutated or batch_mutated
+        return values, mutated
+
     @cache_readonly
     def indices(self):
         if len(self.groupings) == 1:
@@ -682,11 +963,23 @@ class Grouper(object):
 
     @cache_readonly
     def group_info(self):
+        entry = self._cache_entry
+        if entry is not None and 'group_info' in entry:
+            self.compressed, self._filter_empty_groups = entry['flags']
+            return entry['group_info']
+
         comp_ids, obs_group_ids = self._get_compressed_labels()
 
         ngroups = len(obs_group_ids)
         comp_ids = com._ensure_int64(comp_ids)
-        return comp_ids, obs_group_ids, ngroups
+        result = comp_ids, obs_group_ids, ngroups
+
+        if entry is not None:
+            entry['labels'] = [(ping.labels, ping.group_index)
+                               for ping in self.groupings]
+            entry['flags'] = self.compressed, self._filter_empty_groups
+            entry['group_info'] = result
+        return result
 
     def _get_compressed_labels(self):
         all_labels = [ping.labels for ping in self.groupings]
@@ -701,7 +994,8 @@ class Grouper(object):
         else:
             if len(all_labels) > 1:
                 group_index = get_group_index(all_labels, self.shape)
-                comp_ids, obs_group_ids = _compress_group_index(group_index)
+                comp_ids, obs_group_ids = _compress_group_index(group_index,
+                                                                self.sort)
             else:
                 ping = self.groupings[0]
                 comp_ids = ping.labels
@@ -756,12 +1050,17 @@ class Grouper(object):
         'std'  : 'group_var',
         'first': dict(name = 'group_nth', f = lambda func, a, b, c, d: func(a, b, c, d, 1)),
         'last' : 'group_last',
+        'approx_quantile': 'group_approx_quantile',
     }
 
     _cython_transforms = {
         'std': np.sqrt
     }
 
+    # aggregated on the int64 view of datetime64 / timedelta64 values
+    _cython_datetimelike_functions = frozenset(['first', 'last', 'min',
+                                                'max'])
+
     _cython_arity = {
         'ohlc': 4,  # OHLC
     }
@@ -770,9 +1069,14 @@ class Grouper(object):
 
     _filter_empty_groups = True
 
-    def _get_aggregate_function(self, how, values):
+    def _get_aggregate_function(self, how, values, is_datetimelike=False):
 
-        dtype_str = values.dtype.name
+        # the int64 view of datetime64 / timedelta64 values has kernels of
+        # its own, which treat iNaT as missing
+        if is_datetimelike:
+            dtype_str = 'datetimelike'
+        else:
+            dtype_str = values.dtype.name
         def get_func(fname):
 
             # find the function, or use the object function, or return a generic
@@ -804,7 +1108,7 @@ class Grouper(object):
             raise NotImplementedError("function is not implemented for this dtype: [how->%s,dtype->%s]" % (how,dtype_str))
         return func, dtype_str
 
-    def aggregate(self, values, how, axis=0):
+    def aggregate(self, values, how, axis=0, **kwargs):
 
         arity = self._cython_arity.get(how, 1)
 
@@ -821,13 +1125,21 @@ class Grouper(object):
                 raise NotImplementedError
             out_shape = (self.ngroups,) + values.shape[1:]
 
+        datetimelike_dtype = None
         if _is_numeric_dtype(values.dtype):
             values = com.ensure_float(values)
             is_numeric = True
+        elif com.needs_i8_conversion(values):
+            if how not in self._cython_datetimelike_functions:
+                raise NotImplementedError('function is not implemented for '
+                                          'this dtype: [how->%s,dtype->%s]'
+                                          % (how, values.dtype))
+
+            # aggregate the int64 view, NaT is iNaT
+            datetimelike_dtype = values.dtype
+            values = values.view('i8')
+            is_numeric = True
         else:
-            if issubclass(values.dtype.type, np.datetime64):
-                raise Exception('Cython not able to handle this case')
-
             values = values.astype(object)
             is_numeric = False
 
@@ -835,12 +1147,18 @@ class Grouper(object):
         result = np.empty(out_shape, dtype=values.dtype)
         counts = np.zeros(self.ngroups, dtype=np.int64)
 
-        result = self._aggregate(result, counts, values, how, is_numeric)
+        result = self._aggregate(result, counts, values, how, is_numeric,
+                                 is_datetimelike=datetimelike_dtype is not None,
+                                 **kwargs)
 
         if self._filter_empty_groups:
-            if result.ndim == 2:
+            if datetimelike_dtype is not None:
+                result = result[counts > 0]
+            elif result.ndim == 2:
                 if is_numeric:
-                    result = lib.row_bool_subset(result,
+                    # row_bool_subset only takes float64, upcast the
+                    # results of the float32 kernels
+                    result = lib.row_bool_subset(com._ensure_float64(result),
                                                  (counts > 0).view(np.uint8))
                 else:
                     result = lib.row_bool_subset_object(result,
@@ -860,10 +1178,15 @@ class Grouper(object):
         if swapped:
             result = result.swapaxes(0, axis)
 
+        if datetimelike_dtype is not None:
+            result = result.view(datetimelike_dtype)
+
         return result, names
 
-    def _aggregate(self, result, counts, values, how, is_numeric):
-        agg_func,dtype  = self._get_aggregate_function(how, values)
+    def _aggregate(self, result, counts, values, how, is_numeric,
+                   is_datetimelike=False, **kwargs):
+        agg_func,dtype  = self._get_aggregate_function(how, values,
+                                                       is_datetimelike)
         trans_func      = self._cython_transforms.get(how, lambda x: x)
 
         comp_ids, _, ngroups = self.group_info
@@ -874,12 +1197,161 @@ class Grouper(object):
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
 
                 chunk = chunk.squeeze()
-                agg_func(result[:, :, i], counts, chunk, comp_ids)
+                agg_func(result[:, :, i], counts, chunk, comp_ids, **kwargs)
         else:
-            agg_func(result, counts, values, comp_ids)
+            agg_func(result, counts, values, comp_ids, **kwargs)
 
         return trans_func(result)
 
+    #------------------------------------------------------------
+    # Several reductions in a single pass
+
+    def fused_aggregate(self, values, hows):
+        """
+        Compute each of the reductions in hows (names in
+        _fused_aggregations) of 1-d float64 values in a single pass over the
+        group labels
+
+        Returns
+        -------
+        results : dict of {how -> ndarray}
+        """
+        comp_ids, _, ngroups = self.group_info
+        hows = set(hows)
+
+        do_sumsq = len(hows & set(['var', 'std'])) > 0
+        do_prod = 'prod' in hows
+        do_minmax = len(hows & set(['min', 'max'])) > 0
+
+        shape = (ngroups, 1)
+        unused = np.empty((0, 0), dtype=np.float64)
+
+        def _accumulator(needed, fill_value):
+            if not needed:
+                return unused
+            accum = np.empty(shape, dtype=np.float64)
+            accum.fill(fill_value)
+            return accum
+
+        nobs = _accumulator(True, 0)
+        sumx = _accumulator(True, 0)
+        sumxx = _accumulator(do_sumsq, 0)
+        prodx = _accumulator(do_prod, 1)
+        minx = _accumulator(do_minmax, np.inf)
+        maxx = _accumulator(do_minmax, -np.inf)
+        counts = np.zeros(ngroups, dtype=np.int64)
+
+        values = com._ensure_float64(values)[:, None]
+        _algos.group_fused_float64(nobs, sumx, sumxx, prodx, minx, maxx,
+                                   counts, values, comp_ids,
+                                   do_sumsq=do_sumsq, do_prod=do_prod,
+                                   do_minmax=do_minmax)
+
+        nobs = nobs[:, 0]
+        empty = nobs == 0
+
+        results = {}
+        for how in hows:
+            if how == 'count':
+                result = nobs.astype(np.int64)
+            elif how == 'add':
+                result = np.where(empty, np.nan, sumx[:, 0])
+            elif how == 'prod':
+                result = np.where(empty, np.nan, prodx[:, 0])
+            elif how == 'min':
+                result = np.where(empty, np.nan, minx[:, 0])
+            elif how == 'max':
+                result = np.where(empty, np.nan, maxx[:, 0])
+            elif how == 'mean':
+                result = np.where(empty, np.nan, sumx[:, 0] / nobs)
+            elif how in ('var', 'std'):
+                result = ((nobs * sumxx[:, 0] - sumx[:, 0] * sumx[:, 0]) /
+                          (nobs * nobs - nobs))
+                result[nobs < 2] = np.nan
+                if how == 'std':
+                    result = np.sqrt(result)
+            else:
+                raise ValueError('cannot fuse aggregation: %s' % how)
+
+            if self._filter_empty_groups:
+                result = result[counts > 0]
+            results[how] = result
+
+        return results
+
+    #------------------------------------------------------------
+    # Transform functions
+
+    _cython_transform_functions = {
+        'cumsum' : 'group_cumsum',
+        'cumprod': 'group_cumprod',
+        'rank'   : 'group_rank',
+    }
+
+    def transform(self, values, how, axis=0, **kwargs):
+        """
+        Like-indexed transform of values within each group, using a single
+        pass over the group labels. Rows not belonging to any group are NaN
+        """
+        comp_ids, _, ngroups = self.group_info
+
+        vdim = values.ndim
+        swapped = False
+        if vdim == 1:
+            values = values[:, None]
+        else:
+            if axis > 0:
+                swapped = True
+                values = values.swapaxes(0, axis)
+            if values.ndim > 2:
+                raise NotImplementedError
+
+        if how == 'shift':
+            indexer = np.empty(len(comp_ids), dtype=np.int64)
+            _algos.group_shift_indexer(indexer, comp_ids, ngroups,
+                                       kwargs.get('periods', 1))
+            result = com.take_nd(values, indexer, axis=0)
+        elif how in ('ffill', 'bfill'):
+            result = self._transform_fill(values, comp_ids, ngroups,
+                                          backward=how == 'bfill', **kwargs)
+        else:
+            if not _is_numeric_dtype(values.dtype):
+                raise TypeError('cannot transform non-numeric values')
+
+            dtype = values.dtype
+            func = getattr(_algos, self._cython_transform_functions[how])
+
+            values = com._ensure_float64(values)
+            result = np.empty(values.shape, dtype=np.float64)
+            func(result, values, comp_ids, ngroups, **kwargs)
+
+            if how != 'rank' and issubclass(dtype.type, np.integer):
+                result = _possibly_downcast_to_dtype(result, dtype)
+
+        if swapped:
+            result = result.swapaxes(0, axis)
+
+        if vdim == 1:
+            result = result[:, 0]
+
+        return result
+
+    def _transform_fill(self, values, comp_ids, ngroups, backward=False,
+                        limit=None):
+        indexer = np.empty(len(comp_ids), dtype=np.int64)
+
+        pieces = []
+        for j in range(values.shape[1]):
+            column = values[:, j]
+            _algos.group_fillna_indexer(indexer, comp_ids, com.isnull(column),
+                                        ngroups, limit=limit,
+                                        backward=backward)
+            pieces.append(com.take_nd(column, indexer))
+
+        if len(pieces) == 1:
+            return pieces[0][:, None]
+        return np.column_stack(pieces)
+
     def agg_series(self, obj, func):
         try:
             return self._aggregate_series_fast(obj, func)
@@ -911,7 +1383,8 @@ class Grouper(object):
         counts = np.zeros(ngroups, dtype=int)
         result = None
 
-        splitter = get_splitter(obj, group_index, ngroups, axis=self.axis)
+        splitter = get_splitter(obj, group_index, ngroups, axis=self.axis,
+                                sort=self.sort)
 
         for label, group in splitter:
             res = func(group)
@@ -1025,7 +1498,11 @@ class BinGrouper(Grouper):
                 inds = lrange(start, n)
                 yield self.binlabels[-1], data.take(inds, axis=axis)
 
-    def apply(self, f, data, axis=0, keep_internal=False):
+    def apply(self, f, data, axis=0, keep_internal=False, n_jobs=1):
+        # the bins are applied in this process whatever n_jobs
+        if _validate_n_jobs(n_jobs) > 1:
+            warnings.warn('apply_n_jobs is ignored when grouping by bins, '
+                          'the groups are applied in this process')
         result_keys = []
         result_values = []
         mutated = False
@@ -1076,15 +1553,19 @@ class BinGrouper(Grouper):
         'last' : 'group_last_bin',
     }
 
+    _cython_datetimelike_functions = frozenset()
+
     _name_functions = {
         'ohlc': lambda *args: ['open', 'high', 'low', 'close']
     }
 
     _filter_empty_groups = True
 
-    def _aggregate(self, result, counts, values, how, is_numeric=True):
+    def _aggregate(self, result, counts, values, how, is_numeric=True,
+                   is_datetimelike=False, **kwargs):
 
-        agg_func,dtype = self._get_aggregate_function(how, values)
+        agg_func,dtype = self._get_aggregate_function(how, values,
+                                                      is_datetimelike)
         trans_func     = self._cython_transforms.get(how, lambda x: x)
 
         if values.ndim > 3:
@@ -1092,9 +1573,9 @@ class BinGrouper(Grouper):
             raise NotImplementedError
         elif values.ndim > 2:
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
-                agg_func(result[:, :, i], counts, chunk, self.bins)
+                agg_func(result[:, :, i], counts, chunk, self.bins, **kwargs)
         else:
-            agg_func(result, counts, values, self.bins)
+            agg_func(result, counts, values, self.bins, **kwargs)
 
         return trans_func(result)
 
@@ -1138,6 +1619,12 @@ class Grouping(object):
         if isinstance(grouper, (Series, Index)) and name is None:
             self.name = grouper.name
 
+        # the frame a column key was taken from, see _GroupInfoCache; not
+        # getattr, which would look for '_cacher' in the index of grouper
+        self._cacher = None
+        if isinstance(grouper, Series):
+            self._cacher = grouper.__dict__.get('_cacher')
+
         if isinstance(grouper, MultiIndex):
             self.grouper = grouper.values
 
@@ -1456,6 +1943,7 @@ class SeriesGroupBy(GroupBy):
                     columns.append(f.__name__)
             arg = lzip(columns, arg)
 
+        fused = self._fused_aggregate(arg)
         results = {}
 
         for name, func in arg:
@@ -1463,10 +1951,52 @@ class SeriesGroupBy(GroupBy):
                 raise SpecificationError('Function names must be unique, '
                                          'found multiple named %s' % name)
 
-            results[name] = self.aggregate(func)
+            if name in fused:
+                results[name] = fused[name]
+            else:
+                results[name] = self.aggregate(func)
 
         return DataFrame(results, columns=columns)
 
+    def _fused_aggregate(self, arg):
+        """
+        Compute the built-in reductions among the (name, func) pairs of arg
+        in a single pass over the values, returning a dict of
+        {name -> Series}. Empty if fewer than two of them can be fused
+        """
+        if isinstance(self.grouper, BinGrouper):
+            return {}
+
+        values = self.obj.values
+        if not _is_numeric_dtype(values.dtype):
+            return {}
+
+        values = com.ensure_float(values)
+        if values.dtype != np.float64:
+            return {}
+
+        hows = {}
+        for name, func in arg:
+            if not isinstance(func, compat.string_types):
+                func = _intercept_cython(func)
+            if func in _fused_aggregations:
+                hows[name] = _fused_aggregations[func]
+
+        if len(hows) < 2:
+            return {}
+
+        output = self.grouper.fused_aggregate(values, hows.values())
+        index = self.grouper.result_index
+
+        results = {}
+        for name, how in compat.iteritems(hows):
+            result = output[how]
+            if how != 'count':
+                result = self._try_cast(result, self.obj)
+            results[name] = Series(result, index=index, name=self.name)
+
+        return results
+
     def _wrap_aggregated_output(self, output, names=None):
         # sort of a kludge
         output = output[self.name]
@@ -1533,6 +2063,10 @@ class SeriesGroupBy(GroupBy):
         -------
         transformed : Series
         """
+        name = _intercept_cython_transform(func, args, kwargs)
+        if name is not None:
+            return getattr(self, name)(*args, **kwargs)
+
         result = self.obj.copy()
         if hasattr(result,'values'):
             result = result.values
@@ -1569,19 +2103,26 @@ class SeriesGroupBy(GroupBy):
 
         Parameters
         ----------
-        func : function
-            To apply to each group. Should return True or False.
+        func : function or boolean Series
+            To apply to each group. Should return True or False. A boolean
+            Series indexed by group key, typically an aggregation compared
+            to a value, selects the groups directly in a single pass over
+            the group labels; the rows are then kept in their original order
         dropna : Drop groups that do not pass the filter. True by default;
             if False, groups that evaluate False are filled with NaNs.
 
         Example
         -------
         >>> grouped.filter(lambda x: x.mean() > 0)
+        >>> grouped.filter(grouped.mean() > 0)
 
         Returns
         -------
         filtered : Series
         """
+        if isinstance(func, (Series, np.ndarray)):
+            return self._filter_by_mask(func, dropna=dropna)
+
         if isinstance(func, compat.string_types):
             wrapper = lambda x: getattr(x, func)(*args, **kwargs)
         else:
@@ -1618,8 +2159,9 @@ class NDFrameGroupBy(GroupBy):
                 continue
             yield val, slicer(val)
 
-    def _cython_agg_general(self, how, numeric_only=True):
-        new_blocks = self._cython_agg_blocks(how, numeric_only=numeric_only)
+    def _cython_agg_general(self, how, numeric_only=True, **kwargs):
+        new_blocks = self._cython_agg_blocks(how, numeric_only=numeric_only,
+                                             **kwargs)
         return self._wrap_agged_blocks(new_blocks)
 
     def _wrap_agged_blocks(self, blocks):
@@ -1641,10 +2183,10 @@ class NDFrameGroupBy(GroupBy):
 
     _block_agg_axis = 0
 
-    def _cython_agg_blocks(self, how, numeric_only=True):
+    def _cython_agg_blocks(self, how, numeric_only=True, **kwargs):
         data, agg_axis = self._get_data_to_aggregate()
 
-        new_blocks = []
+        blocks = []
 
         for block in data.blocks:
             values = block.values
@@ -1657,7 +2199,22 @@ class NDFrameGroupBy(GroupBy):
             if is_numeric:
                 values = com.ensure_float(values)
 
-            result, _ = self.grouper.aggregate(values, how, axis=agg_axis)
+            blocks.append((block, values))
+
+        if len(blocks) == 0:
+            raise DataError('No numeric types to aggregate')
+
+        n_threads = get_option('compute.groupby_threads')
+        if n_threads > 1:
+            results = self._threaded_agg_values([v for _, v in blocks], how,
+                                                agg_axis, n_threads, **kwargs)
+        else:
+            results = [self.grouper.aggregate(values, how, axis=agg_axis,
+                                              **kwargs)[0]
+                       for _, values in blocks]
+
+        new_blocks = []
+        for (block, _), result in zip(blocks, results):
 
             # see if we can cast the block back to the original dtype
             result = block._try_cast_result(result)
@@ -1665,10 +2222,104 @@ class NDFrameGroupBy(GroupBy):
             newb = make_block(result, block.items, block.ref_items)
             new_blocks.append(newb)
 
+        return new_blocks
+
+    def _threaded_agg_values(self, values_list, how, agg_axis, n_threads,
+                             **kwargs):
+        """
+        Aggregate the values of each block on a pool of threads, splitting
+        2-d blocks into column slices. The Cython group kernels release the
+        GIL so the slices are aggregated concurrently.
+        """
+        from multiprocessing.pool import ThreadPool
+
+        # the group info is cached on first access, so compute it here rather
+        # than racing in the workers
+        self.grouper.group_info
+        self.grouper.ngroups
+
+        tasks = []
+        for i, values in enumerate(values_list):
+            if values.ndim == 2:
+                split_axis = 1 - agg_axis
+                nslices = min(n_threads, values.shape[split_axis])
+                for piece in np.array_split(values, nslices, axis=split_axis):
+                    tasks.append((i, piece))
+            else:
+                tasks.append((i, values))
+
+        def _aggregate(task):
+            i, piece = task
+            return i, self.grouper.aggregate(piece, how, axis=agg_axis,
+                                             **kwargs)[0]
+
+        pool = ThreadPool(min(n_threads, len(tasks)))
+        try:
+            agged = pool.map(_aggregate, tasks)
+        finally:
+            pool.close()
+            pool.join()
+
+        pieces = [[] for _ in values_list]
+        for i, result in agged:
+            pieces[i].append(result)
+
+        results = []
+        for values, block_pieces in zip(values_list, pieces):
+            if len(block_pieces) == 1:
+                results.append(block_pieces[0])
+            else:
+                results.append(np.concatenate(block_pieces, axis=1 - agg_axis))
+        return results
+
+    def _cython_transform_general(self, how, fallback, numeric_only=True,
+                                  **kwargs):
+        # the whole object, group keys included, as the methods have always
+        # been applied to it
+        obj = self.obj
+        if self.axis != 0 or not isinstance(obj, DataFrame):
+            raise NotImplementedError
+
+        new_blocks = []
+        other_items = []
+        for block in obj._data.blocks:
+            values = block.values
+            if numeric_only and not _is_numeric_dtype(values.dtype):
+                other_items.extend(block.items)
+                continue
+
+            result = self.grouper.transform(values, how, axis=1, **kwargs)
+            new_blocks.append(make_block(result, block.items,
+                                         block.ref_items))
+
         if len(new_blocks) == 0:
-            raise DataError('No numeric types to aggregate')
+            raise TypeError('No numeric types to transform')
+
+        # the kernels only take numbers, the other columns go through the
+        # per-group python path
+        if other_items:
+            other = obj.loc[:, obj.columns.isin(other_items)]
+            other = fallback(self._regroup(other))
+            if (not isinstance(other, DataFrame) or
+                    not other.index.equals(obj.index)):
+                raise TypeError('cannot transform non-numeric values')
+
+            for block in other._data.blocks:
+                new_blocks.append(make_block(block.values, block.items,
+                                             obj.columns))
+
+        items = obj.columns
+        if sum(len(b.items) for b in new_blocks) != len(items):
+            all_items = []
+            for b in new_blocks:
+                all_items.extend(b.items)
+            items = items[items.isin(all_items)]
 
-        return new_blocks
+            for blk in new_blocks:
+                blk.set_ref_items(items, maybe_rename=False)
+
+        mgr = BlockManager(new_blocks, [items, obj.index])
+        return DataFrame(mgr)
 
     def _get_data_to_aggregate(self):
         obj = self._obj_with_exclusions
@@ -1964,6 +2615,12 @@ class NDFrameGroupBy(GroupBy):
         """
         from pandas.tools.merge import concat
 
+        name = _intercept_cython_transform(func, args, kwargs)
+        if name is not None:
+            # unlike the methods, transform leaves out the group keys
+            grouped = self._regroup(self._obj_with_exclusions)
+            return getattr(grouped, name)(*args, **kwargs)
+
         applied = []
 
         obj = self._obj_with_exclusions
@@ -2059,8 +2716,12 @@ class NDFrameGroupBy(GroupBy):
 
         Parameters
         ----------
-        f : function
+        f : function or boolean Series
             Function to apply to each subframe. Should return True or False.
+            A boolean Series indexed by group key, typically an aggregation
+            compared to a value, selects the groups directly in a single
+            pass over the group labels; the rows are then kept in their
+            original order
         dropna : Drop groups that do not pass the filter. True by default;
             if False, groups that evaluate False are filled with NaNs.
 
@@ -2073,9 +2734,13 @@ class NDFrameGroupBy(GroupBy):
         --------
         >>> grouped = df.groupby(lambda x: mapping[x])
         >>> grouped.filter(lambda x: x['A'].sum() + x['B'].sum() > 0)
+        >>> grouped.filter(grouped.size() > 10)
         """
         from pandas.tools.merge import concat
 
+        if isinstance(func, (Series, np.ndarray)):
+            return self._filter_by_mask(func, dropna=dropna)
+
         indexers = []
 
         obj = self._obj_with_exclusions
@@ -2340,16 +3005,493 @@ class NDArrayGroupBy(GroupBy):
     pass
 
 
+#----------------------------------------------------------------------
+# Out-of-core aggregation over a stream of chunks
+
+
+class StreamingGroupBy(object):
+    """
+    Group and aggregate a stream of DataFrame chunks, for example the
+    TextFileReader returned by read_csv(..., chunksize=n), without holding
+    more than one chunk in memory.
+
+    Each chunk is reduced with the Cython group aggregations to a small
+    partial state per group, which is merged into the running state. Memory
+    is therefore bounded by the number of groups, not the number of rows.
+
+    Parameters
+    ----------
+    by : column name or list of column names
+        Columns of each chunk to group by
+    how : string or list of strings
+        Aggregations to compute; any of sum, count, mean, var, std, min, max,
+        first or last
+    sort : boolean, default True
+        Sort the group keys of the result
+
+    Examples
+    --------
+    >>> grouped = StreamingGroupBy('key', ['sum', 'mean'])
+    >>> for chunk in read_csv('big.csv', chunksize=1000000):
+    ...     grouped.update(chunk)
+    >>> result = grouped.finalize()
+
+    Returns
+    -------
+    **Attributes**
+    nchunks : int
+        Number of chunks aggregated so far
+    """
+
+    # partial states needed to finalize each aggregation
+    _partial_states = {
+        'sum'  : ['add'],
+        'count': ['count'],
+        'mean' : ['add', 'count'],
+        'var'  : ['moments'],
+        'std'  : ['moments'],
+        'min'  : ['min'],
+        'max'  : ['max'],
+        'first': ['first'],
+        'last' : ['last'],
+    }
+
+    # groupby method computing a partial state on a chunk, which is also
+    # the method merging the partial states of two chunks. The moments state
+    # is the (count, mean, M2) triple of each group, merged with the
+    # pairwise update of Chan et al. rather than from sums of squares, which
+    # lose precision when the mean is large relative to the spread
+    _state_functions = {
+        'add'  : 'sum',
+        'count': 'sum',
+        'min'  : 'min',
+        'max'  : 'max',
+        'first': 'first',
+        'last' : 'last',
+    }
+
+    _numeric_states = frozenset(['add', 'moments'])
+
+    def __init__(self, by, how, sort=True):
+        if not isinstance(by, (list, tuple)):
+            by = [by]
+        if isinstance(how, compat.string_types):
+            how = [how]
+            self._single = True
+        else:
+            self._single = False
+
+        for h in how:
+            if h not in self._partial_states:
+                raise ValueError('cannot aggregate %r over chunks' % h)
+
+        self.by = list(by)
+        self.how = list(how)
+        self.sort = sort
+        self.nchunks = 0
+
+        states = []
+        for h in self.how:
+            for state in self._partial_states[h]:
+                if state not in states:
+                    states.append(state)
+        self._state_names = states
+        self._states = {}
+        self._columns = []
+
+    def update(self, chunk):
+        """
+        Aggregate a chunk into the running per-group state
+
+        Parameters
+        ----------
+        chunk : DataFrame
+            Must contain the group by columns
+
+        Returns
+        -------
+        self : StreamingGroupBy
+        """
+        if not isinstance(chunk, DataFrame):
+            raise TypeError('can only aggregate DataFrame chunks')
+
+        for col in chunk.columns:
+            if col not in self.by and col not in self._columns:
+                self._columns.append(col)
+
+        keys = [chunk[k] for k in self.by]
+        data = chunk.drop(self.by, axis=1)
+
+        for state in self._state_names:
+            partial = self._chunk_state(state, data, keys)
+            if partial is None:
+                continue
+
+            previous = self._states.get(state)
+            if previous is not None:
+                partial = self._merge_states(state, previous, partial)
+            self._states[state] = partial
+
+        self.nchunks += 1
+        return self
+
+    def _chunk_state(self, state, data, keys):
+        if state in self._numeric_states:
+            data = data._get_numeric_data()
+        elif state == 'count':
+            data = _notnull_frame(data)
+
+        if len(data.columns) == 0:
+            return None
+
+        grouped = data.groupby(keys, sort=self.sort)
+        if state == 'moments':
+            # M2 is summed from the deviations from the group means, the
+            # sums of squares behind var lose the precision of large values
+            nobs = _notnull_frame(data).groupby(keys, sort=self.sort).sum()
+            mean = grouped.mean().reindex(columns=data.columns)
+            comp_ids, _, _ = grouped.grouper.group_info
+            deviations = (com._ensure_float64(data.values) -
+                          mean.values.take(comp_ids, axis=0))
+            m2 = DataFrame(deviations ** 2, index=data.index,
+                           columns=data.columns)
+            m2 = m2.groupby(keys, sort=self.sort).sum()
+            return nobs, mean, m2
+
+        return getattr(grouped, self._state_functions[state])()
+
+    def _merge_states(self, state, previous, partial):
+        if state == 'moments':
+            return self._merge_moments(previous, partial)
+
+        return self._combine(state, [previous, partial])
+
+    def _combine(self, state, frames):
+        from pandas.tools.merge import concat
+
+        combined = concat(frames)
+        nlevels = combined.index.nlevels
+        level = 0 if nlevels == 1 else lrange(nlevels)
+
+        grouped = combined.groupby(level=level, sort=self.sort)
+        return getattr(grouped, self._state_functions[state])()
+
+    def _merge_moments(self, previous, partial):
+        nobs = self._combine('count', [previous[0], partial[0]])
+
+        def _align(frame):
+            return frame.reindex(index=nobs.index,
+                                 columns=nobs.columns).fillna(0)
+
+        na, mean_a, m2_a = [_align(frame) for frame in previous]
+        nb, mean_b, m2_b = [_align(frame) for frame in partial]
+
+        delta = mean_b - mean_a
+        mean = mean_a + delta * nb / nobs
+        m2 = m2_a + m2_b + delta * delta * na * nb / nobs
+        return nobs, mean, m2
+
+    def finalize(self):
+        """
+        Compute the aggregations from the per-group state of all chunks seen
+
+        Returns
+        -------
+        aggregated : DataFrame
+            With a column MultiIndex of (column, aggregation) if a list of
+            aggregations was passed
+        """
+        from pandas.tools.merge import concat
+
+        if self.nchunks == 0:
+            raise ValueError('No chunks have been aggregated')
+
+        results = [self._finalize_one(h) for h in self.how]
+        if self._single:
+            return results[0]
+
+        result = concat(results, keys=self.how, axis=1)
+        result = result.swaplevel(0, 1, axis=1)
+
+        # order like agg with a list of functions
+        columns = [(col, h) for col in self._columns for h in self.how
+                   if (col, h) in result.columns]
+        return result.reindex(columns=MultiIndex.from_tuples(columns))
+
+    def _finalize_one(self, how):
+        states = self._states
+        for state in self._partial_states[how]:
+            if state not in states:
+                raise DataError('No numeric types to aggregate')
+
+        if how == 'sum':
+            return states['add']
+        elif how == 'count':
+            return states['count'].fillna(0).astype(np.int64)
+        elif how == 'mean':
+            sumx = states['add']
+            return sumx / states['count'].reindex(columns=sumx.columns)
+        elif how in ('var', 'std'):
+            nobs, _, m2 = states['moments']
+            result = (m2 / (nobs - 1)).where(nobs >= 2)
+            if how == 'std':
+                result = np.sqrt(result)
+            return result
+        else:
+            return states[how]
+
+
+def _notnull_frame(data):
+    return DataFrame(com.notnull(data.values).astype(np.float64),
+                     index=data.index, columns=data.columns)
+
+
+class GroupedTDigest(object):
+    """
+    t-digests of the values of each group, one per column, as computed by
+    GroupBy.tdigest
+
+    A t-digest summarizes the values of a group with at most about
+    compression weighted centroids, so its memory is bounded by the number
+    of groups, not rows. Quantile q of a group is accurate to about
+    2 pi sqrt(q (1 - q)) / compression of the group size in rank, which is
+    best in the tails. Merging two digests gives the digest of all of their
+    values, so chunks of data can be summarized one at a time.
+
+    Parameters
+    ----------
+    index : Index
+        The group keys
+    centroids : dict of {column -> (labels, means, weights)}
+        Centroids as returned by algos.group_tdigest, labels index into
+        index
+    compression : float, default 100
+    squeeze : boolean, default False
+        Digest of a single column (from a SeriesGroupBy)
+
+    Examples
+    --------
+    >>> digest = None
+    >>> for chunk in read_csv('requests.csv', chunksize=1000000):
+    ...     d = chunk.groupby('endpoint')['latency'].tdigest()
+    ...     digest = d if digest is None else digest.merge(d)
+    >>> digest.quantile([0.5, 0.95, 0.99])
+    """
+
+    def __init__(self, index, centroids, compression=100, squeeze=False):
+        self.index = index
+        self.centroids = centroids
+        self.compression = compression
+        self.squeeze = squeeze
+
+    def __repr__(self):
+        return 'GroupedTDigest(%d groups, columns=%s)' % (
+            len(self.index), com.pprint_thing(list(self.centroids)))
+
+    def merge(self, other):
+        """
+        Merge with the digests of other, computed on other data with the
+        same columns
+
+        Returns
+        -------
+        merged : GroupedTDigest
+            Covering the union of the groups of both
+        """
+        if not isinstance(other, GroupedTDigest):
+            raise TypeError('can only merge with another GroupedTDigest')
+        if list(self.centroids) != list(other.centroids):
+            raise ValueError('cannot merge the digests of different columns')
+
+        index = self.index.union(other.index)
+        left_indexer = index.get_indexer(self.index)
+        right_indexer = index.get_indexer(other.index)
+
+        centroids = OrderedDict()
+        for name, (llabels, lmeans, lweights) in compat.iteritems(
+                self.centroids):
+            rlabels, rmeans, rweights = other.centroids[name]
+            labels = np.concatenate([left_indexer.take(llabels),
+                                     right_indexer.take(rlabels)])
+            means = np.concatenate([lmeans, rmeans])
+            weights = np.concatenate([lweights, rweights])
+            centroids[name] = _algos.group_tdigest(means, weights,
+                                                   com._ensure_int64(labels),
+                                                   len(index),
+                                                   self.compression)
+
+        return GroupedTDigest(index, centroids, compression=self.compression,
+                              squeeze=self.squeeze)
+
+    def quantile(self, q=0.5):
+        """
+        Approximate quantile(s) of each group
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5
+            0 <= q <= 1
+
+        Returns
+        -------
+        quantiles : Series or DataFrame
+            Indexed by group. With an array-like q the columns are the
+            (column, q) pairs, or the q for the digest of a single column
+        """
+        scalar = np.isscalar(q)
+        qs = [q] if scalar else list(q)
+        for x in qs:
+            _check_tdigest_args(x, self.compression)
+
+        results = []
+        keys = []
+        for name, (labels, means, weights) in compat.iteritems(
+                self.centroids):
+            for x in qs:
+                out = np.empty(len(self.index), dtype=np.float64)
+                _algos.group_tdigest_quantile(out, labels, means, weights, x)
+                results.append(out)
+
+                if self.squeeze:
+                    keys.append(x)
+                elif scalar:
+                    keys.append(name)
+                else:
+                    keys.append((name, x))
+
+        if self.squeeze and scalar:
+            return Series(results[0], index=self.index,
+                          name=list(self.centroids)[0])
+
+        if self.squeeze or scalar:
+            columns = Index(keys)
+        else:
+            columns = MultiIndex.from_tuples(keys)
+        return DataFrame(np.column_stack(results), index=self.index,
+                         columns=columns)
+
+
+def _check_tdigest_args(q, compression):
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1, got %s' % q)
+    if compression <= 0:
+        raise ValueError('compression must be positive, got %s'
+                         % compression)
+
+
 #----------------------------------------------------------------------
 # Splitting / application
 
 
+#----------------------------------------------------------------------
+# Process pool workers for GroupBy.apply(func, n_jobs=...)
+
+# set in each worker process by _init_apply_worker
+_apply_worker_func = None
+
+
+class _ApplyFunction(object):
+    """
+    func applied to a group with the extra arguments of apply; unlike a
+    closure it can be pickled for the worker processes
+    """
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self, group):
+        return self.func(group, *self.args, **self.kwargs)
+
+
+def _forks_workers():
+    import multiprocessing
+
+    # Python 3.4+ can be told to spawn the workers on any platform
+    get_start_method = getattr(multiprocessing, 'get_start_method', None)
+    if get_start_method is not None:
+        return get_start_method() == 'fork'
+    return sys.platform != 'win32'
+
+
+def _validate_n_jobs(n_jobs):
+    if n_jobs is None:
+        return 1
+    if not com.is_integer(n_jobs) or n_jobs == 0 or n_jobs < -1:
+        raise ValueError('n_jobs must be a positive integer or -1, got %s'
+                         % com.pprint_thing(n_jobs))
+    if n_jobs == -1:
+        import multiprocessing
+        n_jobs = multiprocessing.cpu_count()
+    return n_jobs
+
+
+def _balanced_batches(sizes, nbatches):
+    """
+    Cut the groups with the passed sizes into at most nbatches contiguous
+    (start, stop) ranges of group positions holding about the same number
+    of rows
+    """
+    ngroups = len(sizes)
+    nbatches = min(nbatches, ngroups)
+    cumsizes = np.cumsum(sizes)
+    targets = cumsizes[-1] * np.arange(1, nbatches) / float(nbatches)
+    cuts = np.searchsorted(cumsizes, targets, side='left') + 1
+
+    bounds = np.unique(np.concatenate(([0], cuts, [ngroups])))
+    bounds = bounds[bounds <= ngroups]
+    return lzip(bounds[:-1], bounds[1:])
+
+
+def _init_apply_worker(f):
+    global _apply_worker_func
+    _apply_worker_func = f
+
+
+def _apply_batch(task):
+    chunk, keys, starts, ends, axis = task
+    f = _apply_worker_func
+
+    results = []
+    mutated = False
+    for key, start, end in zip(keys, starts, ends):
+        slice_obj = slice(start, end)
+        if isinstance(chunk, Series):
+            group = chunk._get_values(slice_obj).to_dense()
+        elif axis == 0:
+            group = chunk[slice_obj]
+        else:
+            group = chunk._slice(slice_obj, axis=1)
+
+        object.__setattr__(group, 'name', key)
+
+        # group might be modified
+        group_axes = _get_axes(group)
+        res = f(group)
+        if not _is_indexed_like(res, group_axes):
+            mutated = True
+        results.append(res)
+
+    return results, mutated
+
+
 class DataSplitter(object):
+    """
+    Iterate over the groups of data given the group labels
+
+    With sort=True the data is put in group order with a single take and
+    the groups are sliced out of it. With sort=False the groups are taken a
+    batch of about _split_batch_rows rows at a time and sliced out of the
+    batch, so a sorted copy of the whole object is never materialized
+    """
 
-    def __init__(self, data, labels, ngroups, axis=0, keep_internal=False):
+    def __init__(self, data, labels, ngroups, axis=0, keep_internal=False,
+                 sort=True):
         self.data = data
         self.labels = com._ensure_int64(labels)
         self.ngroups = ngroups
+        self.sort = sort
 
         self.axis = axis
 
@@ -2358,19 +3500,34 @@ class DataSplitter(object):
         # Sorted labels
         return com.take_nd(self.labels, self.sort_idx, allow_fill=False)
 
-    @cache_readonly
+    @cache_readonly(allow_setting=True)
     def sort_idx(self):
         # Counting sort indexer
         return _algos.groupsort_indexer(self.labels, self.ngroups)[0]
 
     def __iter__(self):
-        sdata = self._get_sorted_data()
-
         if self.ngroups == 0:
             raise StopIteration
 
         starts, ends = lib.generate_slices(self.slabels, self.ngroups)
 
+        if not self.sort:
+            i = 0
+            while i < len(starts):
+                # the groups ending within the batch, at least one
+                first = starts[i]
+                j = ends.searchsorted(first + _split_batch_rows, side='right')
+                j = max(j, i + 1)
+
+                sdata = self._take(self.sort_idx[first:ends[j - 1]])
+                for k in range(i, j):
+                    yield k, self._chop(sdata, slice(starts[k] - first,
+                                                     ends[k] - first))
+                i = j
+            return
+
+        sdata = self._get_sorted_data()
+
         for i, (start, end) in enumerate(zip(starts, ends)):
             # Since I'm now compressing the group ids, it's now not "possible"
             # to produce empty slices because such groups would not be observed
@@ -2386,6 +3543,10 @@ class DataSplitter(object):
     def _chop(self, sdata, slice_obj):
         return sdata[slice_obj]
 
+    def _take(self, indexer):
+        # the rows at indexer, in the form _chop slices
+        return self.data.take(indexer, axis=self.axis, convert=False)
+
     def apply(self, f):
         raise NotImplementedError
 
@@ -2399,12 +3560,16 @@ class SeriesSplitter(DataSplitter):
     def _chop(self, sdata, slice_obj):
         return sdata._get_values(slice_obj).to_dense()
 
+    def _take(self, indexer):
+        return self.data.take(indexer, convert=False).to_dense()
+
 
 class FrameSplitter(DataSplitter):
 
-    def __init__(self, data, labels, ngroups, axis=0, keep_internal=False):
+    def __init__(self, data, labels, ngroups, axis=0, keep_internal=False,
+                 sort=True):
         DataSplitter.__init__(self, data, labels, ngroups, axis=axis,
-                              keep_internal=keep_internal)
+                              keep_internal=keep_internal, sort=sort)
 
     def fast_apply(self, f, names):
         # must return keys::list, values::list, mutated::bool
@@ -2428,26 +3593,32 @@ class FrameSplitter(DataSplitter):
 
 class NDFrameSplitter(DataSplitter):
 
-    def __init__(self, data, labels, ngroups, axis=0, keep_internal=False):
+    def __init__(self, data, labels, ngroups, axis=0, keep_internal=False,
+                 sort=True):
         DataSplitter.__init__(self, data, labels, ngroups, axis=axis,
-                              keep_internal=keep_internal)
+                              keep_internal=keep_internal, sort=sort)
 
         self.factory = data._constructor
 
     def _get_sorted_data(self):
+        return self._take(self.sort_idx)
+
+    def _take(self, indexer):
         # this is the BlockManager
         data = self.data._data
 
         # this is sort of wasteful but...
-        sorted_axis = data.axes[self.axis].take(self.sort_idx)
-        sorted_data = data.reindex_axis(sorted_axis, axis=self.axis)
-
-        return sorted_data
+        sorted_axis = data.axes[self.axis].take(indexer)
+        return data.reindex_axis(sorted_axis, axis=self.axis)
 
     def _chop(self, sdata, slice_obj):
         return self.factory(sdata.get_slice(slice_obj, axis=self.axis))
 
 
+# rows taken at once when iterating over groups with sort=False
+_split_batch_rows = 65536
+
+
 def get_splitter(data, *args, **kwargs):
     if isinstance(data, Series):
         klass = SeriesSplitter
@@ -2459,6 +3630,92 @@ def get_splitter(data, *args, **kwargs):
     return klass(data, *args, **kwargs)
 
 
+class _GroupInfoCache(object):
+    """
+    LRU cache of factorized groupby keys, enabled by setting the
+    ``compute.groupby_cache_size`` option to the number of entries to keep
+
+    An entry holds the labels and uniques of each Grouping, the Grouper's
+    group_info and the counting sort indexer of the splitter. Only columns
+    of a frame (passed by name or as the column Series) are cached: entries
+    are keyed on the frame, the column and the axis grouped and are valid
+    while the frame's write version is unchanged. Other key arrays are left
+    out as writes into them cannot be detected. The frame and axis are held
+    by weak reference so a recycled ``id`` never produces a hit. Writing
+    into the ``values`` of a frame directly is not detected either, call
+    ``clear`` after doing so
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def lookup(self, groupings, axis, sort):
+        """
+        Return the (possibly empty) entry dict for the groupings, or None if
+        caching is disabled or the groupings are not all frame columns
+        """
+        maxsize = get_option('compute.groupby_cache_size')
+        if maxsize <= 0:
+            if len(self._entries):
+                self.clear()
+            return None
+
+        sources = []
+        for ping in groupings:
+            cacher = ping._cacher
+            if ping._was_factor or cacher is None:
+                return None
+            frame = cacher[1]()
+            if frame is None:
+                return None
+            sources.append((cacher[0], frame))
+
+        key = (tuple((id(frame), item) for item, frame in sources) +
+               (id(axis), sort))
+        versions = [frame._version for _, frame in sources]
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            if (entry['axis']() is axis and entry['versions'] == versions and
+                    all(ref() is frame
+                        for ref, (_, frame) in zip(entry['refs'], sources))):
+                self._entries[key] = entry
+                return entry
+
+        self._purge(maxsize - 1)
+
+        entry = {'refs': [weakref.ref(frame) for _, frame in sources],
+                 'axis': weakref.ref(axis), 'versions': versions}
+        self._entries[key] = entry
+        return entry
+
+    def _purge(self, maxsize):
+        # drop entries whose keys are gone, then the least recently used
+        for key, entry in list(self._entries.items()):
+            if (entry['axis']() is None or
+                    any(ref() is None for ref in entry['refs'])):
+                del self._entries[key]
+
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+
+_group_info_cache = _GroupInfoCache()
+
+
+def clear_group_info_cache():
+    """
+    Discard all factorized groupby keys kept by the
+    ``compute.groupby_cache_size`` cache
+    """
+    _group_info_cache.clear()
+
+
 #----------------------------------------------------------------------
 # Misc utilities
 
@@ -2659,6 +3916,38 @@ _cython_table = {
 }
 
 
+# agg names / functions that Grouper.fused_aggregate computes in one pass
+_fused_aggregations = {
+    'sum': 'add',
+    'prod': 'prod',
+    'min': 'min',
+    'max': 'max',
+    'mean': 'mean',
+    'var': 'var',
+    'std': 'std',
+    'count': 'count',
+}
+
+
+_cython_transform_table = {
+    np.cumsum: 'cumsum',
+    np.cumprod: 'cumprod',
+}
+
+# transforms computed by GroupBy methods in a single Cython pass
+_cython_transform_methods = frozenset(['cumsum', 'cumprod', 'shift', 'rank',
+                                       'ffill', 'bfill', 'fillna'])
+
+_rank_methods = frozenset(['average', 'min', 'max', 'first', 'dense'])
+
+_fill_methods = {
+    'ffill': 'ffill',
+    'pad': 'ffill',
+    'bfill': 'bfill',
+    'backfill': 'bfill',
+}
+
+
 def _is_numeric_dtype(dt):
     typ = dt.type
     return (issubclass(typ, (np.number, np.bool_))
@@ -2673,6 +3962,21 @@ def _intercept_cython(func):
     return _cython_table.get(func)
 
 
+def _intercept_cython_transform(func, args, kwargs):
+    if isinstance(func, compat.string_types):
+        if func in _cython_transform_methods:
+            return func
+        return None
+
+    if args or kwargs:
+        return None
+
+    try:
+        return _cython_transform_table.get(func)
+    except TypeError:  # unhashable
+        return None
+
+
 def _groupby_indices(values):
     return _algos.groupby_indices(com._ensure_object(values))
 
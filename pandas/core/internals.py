@@ -1147,6 +1147,25 @@ class ObjectBlock(Block):
         """ we can be a bool if we have only bool values but are of type object """
         return lib.is_bool_array(self.values.ravel())
 
+    def to_native_types(self, slicer=None, na_rep='', date_format=None,
+                        **kwargs):
+        """ convert to our native types format, slicing if desired """
+
+        values = self.values
+        if slicer is not None:
+            values = values[:, slicer]
+        values = np.array(values, dtype=object)
+        mask = isnull(values)
+        values[mask] = na_rep
+        if date_format is not None:
+            # datetimes held as objects, e.g. next to missing values
+            dmask = np.array([isinstance(val, datetime)
+                              for val in values.ravel()], dtype=bool)
+            values.flat[dmask] = np.array(
+                [Timestamp(val).strftime(date_format)
+                 for val in values.ravel()[dmask]], dtype=object)
+        return values.tolist()
+
     def convert(self, convert_dates=True, convert_numeric=True, copy=True, by_item=True):
         """ attempt to coerce any object types to better types
             return a copy of the block (if copy = True)
@@ -1363,7 +1382,8 @@ class DatetimeBlock(Block):
         return [self if inplace else make_block(values, self.items,
                                                 self.ref_items, fastpath=True)]
 
-    def to_native_types(self, slicer=None, na_rep=None, **kwargs):
+    def to_native_types(self, slicer=None, na_rep=None, date_format=None,
+                        **kwargs):
         """ convert to our native types format, slicing if desired """
 
         values = self.values
@@ -1376,8 +1396,13 @@ class DatetimeBlock(Block):
             na_rep = 'NaT'
         rvalues[mask] = na_rep
         imask = (-mask).ravel()
-        rvalues.flat[imask] = np.array(
-            [Timestamp(val)._repr_base for val in values.ravel()[imask]], dtype=object)
+        if date_format is None:
+            rvalues.flat[imask] = np.array(
+                [Timestamp(val)._repr_base for val in values.ravel()[imask]], dtype=object)
+        else:
+            rvalues.flat[imask] = np.array(
+                [Timestamp(val).strftime(date_format)
+                 for val in values.ravel()[imask]], dtype=object)
 
         return rvalues.tolist()
 
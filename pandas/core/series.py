@@ -1015,6 +1015,7 @@ class Series(generic.NDFrame):
             return self.values[indexer]
 
     def __setitem__(self, key, value):
+        self._bump_version()
         try:
             self._set_with_engine(key, value)
             return
@@ -1222,6 +1223,7 @@ class Series(generic.NDFrame):
         """
         try:
             self.index._engine.set_value(self.values, label, value)
+            self._bump_version()
             return self
         except KeyError:
 
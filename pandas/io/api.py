@@ -2,7 +2,7 @@
 Data IO api
 """
 
-from pandas.io.parsers import read_csv, read_table, read_fwf
+from pandas.io.parsers import read_csv, read_table, read_fwf, CSVSchema
 from pandas.io.clipboard import read_clipboard
 from pandas.io.excel import ExcelFile, ExcelWriter, read_excel
 from pandas.io.pytables import HDFStore, Term, get_store, read_hdf
@@ -4,26 +4,35 @@ Module contains tools for processing files into DataFrames or other objects
 from __future__ import print_function
 from pandas.compat import range, lrange, StringIO, lzip, zip
 from pandas import compat
+import os
 import re
 import csv
+import glob
+import codecs
 from warnings import warn
 
 import numpy as np
 
 from pandas.core.index import Index, MultiIndex
 from pandas.core.frame import DataFrame
+from pandas.core.categorical import Categorical
+from pandas.core.base import StringMixin
+from pandas.computation.eval import eval as _eval
+from pandas.computation.expressions import _NUMEXPR_INSTALLED
 import datetime
 import pandas.core.common as com
 from pandas.core.config import get_option
 from pandas import compat
 from pandas.io.date_converters import generic_parser
-from pandas.io.common import get_filepath_or_buffer
+from pandas.io.common import get_filepath_or_buffer, _is_url, _is_s3_url
+from pandas.tools.merge import concat
 
 from pandas.util.decorators import Appender
 
 import pandas.lib as lib
 import pandas.tslib as tslib
 import pandas.parser as _parser
+import pandas.json as _json
 from pandas.tseries.period import Period
 
 _parser_params = """Also supports optionally iterating or breaking of the file
@@ -35,6 +44,8 @@ filepath_or_buffer : string or file handle / StringIO. The string could be
     a URL. Valid URL schemes include http, ftp, s3, and file. For file URLs, a host
     is expected. For instance, a local file could be
     file ://localhost/path/to/table.csv
+    A list of paths or a glob pattern (e.g. 'data/2013-*.csv') reads each of
+    the files with the same options and concatenates them into one DataFrame
 %s
 lineterminator : string (length 1), default None
     Character to break file into lines. Only valid with C parser
@@ -49,6 +60,11 @@ skipinitialspace : boolean, default False
 escapechar : string
 dtype : Type name or dict of column -> type
     Data type for data or columns. E.g. {'a': np.float64, 'b': np.int32}
+    ``'category'`` (for all columns or per column, e.g. {'state':
+    'category'}) is accepted by the C parser, which dictionary-encodes the
+    columns inferred as strings. A DataFrame can not hold a Categorical, so
+    these come out as the object columns of a default read; the codes and
+    levels are returned by pandas.parser.TextReader
 compression : {'gzip', 'bz2', None}, default None
     For on-the-fly decompression of on-disk data
 dialect : string or csv.Dialect instance, default None
@@ -94,6 +110,11 @@ date_parser : function
     Function to use for converting a sequence of string columns to an
     array of datetime instances. The default uses dateutil.parser.parser
     to do the conversion.
+date_format : string, default None
+    strftime format of the parse_dates columns, e.g. "%%d/%%m/%%Y %%H:%%M".
+    With the C parser, single date columns in ISO 8601 or in a format made
+    of %%Y, %%m, %%d, %%H, %%M, %%S and %%f are converted directly from the
+    tokenized text
 dayfirst : boolean, default False
     DD/MM format dates, international and European format
 thousands : str, default None
@@ -129,6 +150,30 @@ na_filter: boolean, default True
 usecols : array-like
     Return a subset of the columns.
     Results in much faster parsing time and lower memory usage.
+schema : CSVSchema or dict of column -> dtype, default None
+    Column dtypes known from an earlier read of the same layout (see
+    :class:`CSVSchema`). The C parser converts each column with its known
+    type first, falling back to inference only for the values that do not
+    fit it
+where : string, default None
+    Boolean expression (see :func:`~pandas.eval`) evaluated on the parsed
+    columns of each chunk, e.g. ``'a > 0 and b == "x"'``. Rows for which it
+    is False are dropped before the DataFrame is built, so only matching rows
+    are kept in memory when iterating with ``chunksize``
+threads : int, default 1
+    Number of threads used to tokenize and convert the file with the C
+    parser. The input is split into blocks at row boundaries and each block
+    is parsed by its own thread. Only applies when reading the whole file
+    (no nrows, chunksize or skip_footer) with the default line terminator
+    and without delim_whitespace; otherwise the file is parsed serially.
+    The tokens of all the blocks are held in memory until the end of the
+    read, as with low_memory=False, so peak memory use is well above that
+    of the default serial read of a large file.
+    When reading a list or glob of files, the number of files parsed
+    concurrently instead
+source_key : string, default None
+    When reading a list or glob of files, name of a column added to the
+    result holding the path each row was read from
 mangle_dupe_cols: boolean, default True
     Duplicate columns will be specified as 'X.0'...'X.N', rather than 'X'...'X'
 tupleize_cols: boolean, default False
@@ -180,6 +225,13 @@ fields if it is not spaces (e.g., '~').
 
 def _read(filepath_or_buffer, kwds):
     "Generic reader of line files."
+    source_key = kwds.pop('source_key', None)
+    paths = _expand_paths(filepath_or_buffer)
+    if paths is not None:
+        return _read_multiple(paths, kwds, source_key=source_key)
+    elif source_key is not None:
+        raise ValueError('source_key requires a list or glob of paths')
+
     encoding = kwds.get('encoding', None)
     skipfooter = kwds.pop('skipfooter', None)
     if skipfooter is not None:
@@ -206,6 +258,73 @@ def _read(filepath_or_buffer, kwds):
 
     return parser.read()
 
+
+_glob_magic = re.compile('[*?[]')
+
+
+def _expand_paths(filepath_or_buffer):
+    """
+    The sorted paths matching a glob pattern or those of a list of paths,
+    None for a single path, URL or buffer.
+    """
+    if isinstance(filepath_or_buffer, (list, tuple)):
+        if len(filepath_or_buffer) == 0:
+            raise ValueError('No paths to read')
+        return list(filepath_or_buffer)
+
+    if (isinstance(filepath_or_buffer, compat.string_types) and
+            _glob_magic.search(filepath_or_buffer) and
+            not _is_url(filepath_or_buffer) and
+            not _is_s3_url(filepath_or_buffer) and
+            not os.path.exists(filepath_or_buffer)):
+        paths = sorted(glob.glob(filepath_or_buffer))
+        if len(paths) == 0:
+            raise IOError('No files match %s' % filepath_or_buffer)
+        return paths
+
+    return None
+
+
+def _read_multiple(paths, kwds, source_key=None):
+    """
+    Read each of the files with the same options, ``threads`` files at a time
+    on a pool of threads, and concatenate them. The frames are concatenated
+    in a single pass, allocating each block of the result once.
+    """
+    from multiprocessing.pool import ThreadPool
+
+    if kwds.get('iterator') or kwds.get('chunksize'):
+        raise ValueError('iterator and chunksize are not supported when '
+                         'reading several files')
+    if source_key is not None and kwds.get('squeeze'):
+        raise ValueError('source_key is not supported with squeeze')
+
+    n_threads = kwds.get('threads') or 1
+    kwds = dict(kwds, threads=1)
+
+    def _read_file(path):
+        return _read(path, kwds.copy())
+
+    if n_threads > 1 and len(paths) > 1:
+        pool = ThreadPool(min(n_threads, len(paths)))
+        try:
+            frames = pool.map(_read_file, paths)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        frames = [_read_file(path) for path in paths]
+
+    index_col = kwds.get('index_col')
+    result = concat(frames, ignore_index=index_col is None or
+                    index_col is False)
+
+    if source_key is not None:
+        lengths = [len(frame) for frame in frames]
+        result[source_key] = np.repeat(np.array(paths, dtype=object), lengths)
+
+    return result
+
 _parser_defaults = {
     'delimiter': None,
 
@@ -236,8 +355,10 @@ _parser_defaults = {
     'keep_date_col': False,
     'dayfirst': False,
     'date_parser': None,
+    'date_format': None,
 
     'usecols': None,
+    'where': None,
 
     # 'nrows': None,
     # 'iterator': False,
@@ -260,6 +381,8 @@ _c_parser_defaults = {
     'low_memory': True,
     'memory_map': False,
     'buffer_lines': None,
+    'threads': 1,
+    'schema': None,
     'error_bad_lines': True,
     'warn_bad_lines': True,
     'factorize': True,
@@ -305,6 +428,8 @@ def _make_parser_function(name, sep=','):
                  converters=None,
                  dtype=None,
                  usecols=None,
+                 where=None,
+                 source_key=None,
 
                  engine='c',
                  delim_whitespace=False,
@@ -314,6 +439,8 @@ def _make_parser_function(name, sep=','):
                  use_unsigned=False,
                  low_memory=_c_parser_defaults['low_memory'],
                  buffer_lines=None,
+                 threads=1,
+                 schema=None,
                  warn_bad_lines=True,
                  error_bad_lines=True,
 
@@ -326,6 +453,7 @@ def _make_parser_function(name, sep=','):
                  keep_date_col=False,
                  dayfirst=False,
                  date_parser=None,
+                 date_format=None,
 
                  memory_map=False,
                  nrows=None,
@@ -373,6 +501,7 @@ def _make_parser_function(name, sep=','):
                     keep_date_col=keep_date_col,
                     dayfirst=dayfirst,
                     date_parser=date_parser,
+                    date_format=date_format,
 
                     nrows=nrows,
                     iterator=iterator,
@@ -381,6 +510,8 @@ def _make_parser_function(name, sep=','):
                     converters=converters,
                     dtype=dtype,
                     usecols=usecols,
+                    where=where,
+                    source_key=source_key,
                     verbose=verbose,
                     encoding=encoding,
                     squeeze=squeeze,
@@ -395,6 +526,8 @@ def _make_parser_function(name, sep=','):
                     error_bad_lines=error_bad_lines,
                     low_memory=low_memory,
                     buffer_lines=buffer_lines,
+                    threads=threads,
+                    schema=schema,
                     mangle_dupe_cols=mangle_dupe_cols,
                     tupleize_cols=tupleize_cols,
             )
@@ -429,10 +562,148 @@ def read_fwf(filepath_or_buffer, colspecs=None, widths=None, **kwds):
             col += w
 
     kwds['colspecs'] = colspecs
-    kwds['engine'] = 'python-fwf'
+    if kwds.pop('engine', 'c') == 'c' and _c_fwf_supported(colspecs, kwds):
+        kwds['engine'] = 'c-fwf'
+    else:
+        kwds['engine'] = 'python-fwf'
     return _read(filepath_or_buffer, kwds)
 
 
+# encodings in which the C tokenizer can count the characters of a line
+_fwf_c_encodings = set(['utf-8', 'ascii', 'iso8859-1', 'cp1252'])
+
+
+def _c_fwf_supported(colspecs, kwds):
+    """
+    Whether the fixed-width fields can be sliced by the C tokenizer: sorted
+    and non-overlapping extents, a single filler character, no comments and
+    an encoding in which the character positions can be counted.
+    """
+    prev_end = 0
+    for colspec in colspecs:
+        if not (isinstance(colspec, (tuple, list)) and len(colspec) == 2 and
+                com.is_integer(colspec[0]) and com.is_integer(colspec[1])):
+            return False
+        start, end = colspec
+        if start < prev_end or end < start:
+            return False
+        prev_end = end
+
+    if len(kwds.get('delimiter') or ' ') != 1:
+        return False
+    if kwds.get('comment') is not None:
+        return False
+    if kwds.get('skipfooter') or kwds.get('skip_footer'):
+        return False
+
+    encoding = kwds.get('encoding')
+    if encoding is not None:
+        if codecs.lookup(encoding).name not in _fwf_c_encodings:
+            return False
+
+    return True
+
+
+class CSVSchema(StringMixin):
+    """
+    Column dtypes of a delimited file, to be inferred once and passed as
+    ``schema`` to later reads of the same layout: the C parser then converts
+    each column with its known type rather than trying int64, float64, bool
+    and object in turn on every chunk.
+
+    Parameters
+    ----------
+    dtypes : list of (column, dtype) pairs or dict
+        A dtype of None leaves the column to inference
+
+    Examples
+    --------
+    >>> schema = CSVSchema.infer('feed_20131001.csv', nrows=10000)
+    >>> schema.save('feed.schema')
+    >>> schema = CSVSchema.load('feed.schema')
+    >>> df = read_csv('feed_20131002.csv', schema=schema)
+    """
+
+    def __init__(self, dtypes):
+        if isinstance(dtypes, dict):
+            dtypes = list(compat.iteritems(dtypes))
+
+        self.dtypes = [(name, None if dtype is None else np.dtype(dtype))
+                       for name, dtype in dtypes]
+
+    @classmethod
+    def infer(cls, filepath_or_buffer, nrows=None, **kwds):
+        """
+        Read the first `nrows` rows (all if None) with :func:`read_csv` and
+        keep the dtypes of the columns, and of the named index levels.
+        Additional keywords are passed to :func:`read_csv`.
+        """
+        return cls.from_frame(read_csv(filepath_or_buffer, nrows=nrows,
+                                       **kwds))
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        Schema of the columns and named index levels of a DataFrame
+        """
+        dtypes = []
+        for i, name in enumerate(frame.index.names):
+            if name is not None:
+                dtypes.append((name, _schema_dtype(
+                    frame.index.get_level_values(i).values)))
+        for name, col in compat.iteritems(frame):
+            dtypes.append((name, _schema_dtype(col.values)))
+        return cls(dtypes)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a schema written by :meth:`save`
+        """
+        with open(path, 'r') as f:
+            return cls(_json.loads(f.read())['columns'])
+
+    def save(self, path):
+        """
+        Write the schema to a JSON file
+        """
+        with open(path, 'w') as f:
+            f.write(_json.dumps({'columns': self._columns()}))
+
+    def _columns(self):
+        return [[name, None if dtype is None else dtype.str]
+                for name, dtype in self.dtypes]
+
+    @property
+    def dtype_hints(self):
+        return dict((name, dtype) for name, dtype in self.dtypes
+                    if dtype is not None)
+
+    def __eq__(self, other):
+        return (isinstance(other, CSVSchema) and
+                self._columns() == other._columns())
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __unicode__(self):
+        lines = ['%s: %s' % (com.pprint_thing(name),
+                             'inferred' if dtype is None else dtype)
+                 for name, dtype in self.dtypes]
+        return '\n'.join(['%s' % type(self)] + lines)
+
+
+def _schema_dtype(values):
+    # object columns that are not strings (e.g. booleans with missing
+    # values) are left to inference, as reading them as strings would not
+    # give the same values
+    if values.dtype == np.object_:
+        if lib.infer_dtype(values[com.notnull(values)]) not in ('string',
+                                                               'unicode'):
+            return None
+    return values.dtype
+
+
 # common NA values
 # no longer excluding inf representations
 # '1.#INF','-1.#INF', '1.#INF000000',
@@ -474,6 +745,10 @@ class TextFileReader(object):
 
         self.chunksize = options.pop('chunksize', None)
         self.squeeze = options.pop('squeeze', False)
+        self.where = options.pop('where', None)
+
+        if self.where is not None and options.get('as_recarray'):
+            raise ValueError('where is not supported with as_recarray')
 
         # might mutate self.engine
         self.options, self.engine = self._clean_options(options, engine)
@@ -497,15 +772,19 @@ class TextFileReader(object):
         for argname, default in compat.iteritems(_c_parser_defaults):
             if argname in kwds:
                 value = kwds[argname]
-                if engine != 'c' and value != default:
+                if engine not in ('c', 'c-fwf') and value != default:
                     raise ValueError('%s is not supported with %s parser' %
                                      (argname, engine))
+            else:
+                value = default
             options[argname] = value
 
-        if engine == 'python-fwf':
+        if engine in ('c-fwf', 'python-fwf'):
             for argname, default in compat.iteritems(_fwf_defaults):
                 if argname in kwds:
                     value = kwds[argname]
+                else:
+                    value = default
                 options[argname] = value
 
         return options
@@ -527,7 +806,7 @@ class TextFileReader(object):
             if options['skip_footer'] > 0:
                 engine = 'python'
 
-        if engine == 'c':
+        if engine in ('c', 'c-fwf'):
             for arg in _c_unsupported:
                 del result[arg]
 
@@ -586,7 +865,7 @@ class TextFileReader(object):
             pass
 
     def _make_engine(self, engine='c'):
-        if engine == 'c':
+        if engine in ('c', 'c-fwf'):
             self._engine = CParserWrapper(self.f, **self.options)
         else:
             if engine == 'python':
@@ -617,6 +896,10 @@ class TextFileReader(object):
         # May alter columns / col_dict
         index, columns, col_dict = self._create_index(ret)
 
+        if self.where is not None:
+            index, col_dict = _filter_rows(self.where, index, columns,
+                                           col_dict)
+
         df = DataFrame(col_dict, columns=columns, index=index)
 
         if self.squeeze and len(df.columns) == 1:
@@ -636,6 +919,42 @@ def _is_index_col(col):
     return col is not None and col is not False
 
 
+def _filter_rows(expr, index, columns, col_dict):
+    """
+    Evaluate the boolean expression ``expr`` against the parsed columns (and
+    named index levels) of a chunk and drop the rows for which it is False.
+    """
+    namespace = {}
+    if index is not None:
+        for i, name in enumerate(index.names):
+            if isinstance(name, compat.string_types):
+                namespace[name] = index.get_level_values(i).values
+    for name in columns:
+        if isinstance(name, compat.string_types) and name in col_dict:
+            namespace[name] = col_dict[name]
+
+    if not namespace:
+        raise ValueError('where requires named columns')
+
+    # numexpr is optional
+    engine = 'numexpr' if _NUMEXPR_INSTALLED else 'python'
+    mask = _eval(expr, local_dict=namespace, engine=engine)
+    mask = np.asarray(mask)
+
+    nrows = len(next(iter(compat.itervalues(namespace))))
+    if mask.dtype != np.bool_ or mask.shape != (nrows,):
+        raise ValueError('where expression %r must evaluate to a boolean '
+                         'array with one value per row' % (expr,))
+
+    if mask.all():
+        return index, col_dict
+
+    if index is not None:
+        index = index[mask]
+    col_dict = dict((k, v[mask]) for k, v in compat.iteritems(col_dict))
+    return index, col_dict
+
+
 class ParserBase(object):
 
     def __init__(self, kwds):
@@ -650,6 +969,7 @@ class ParserBase(object):
         self.parse_dates = kwds.pop('parse_dates', False)
         self.date_parser = kwds.pop('date_parser', None)
         self.dayfirst = kwds.pop('dayfirst', False)
+        self.date_format = kwds.pop('date_format', None)
         self.keep_date_col = kwds.pop('keep_date_col', False)
 
         self.na_values = kwds.get('na_values')
@@ -659,7 +979,8 @@ class ParserBase(object):
         self.tupleize_cols = kwds.get('tupleize_cols',False)
 
         self._date_conv = _make_date_converter(date_parser=self.date_parser,
-                                               dayfirst=self.dayfirst)
+                                               dayfirst=self.dayfirst,
+                                               date_format=self.date_format)
 
         # validate header options for mi
         self.header = kwds.get('header')
@@ -958,6 +1279,24 @@ class CParserWrapper(ParserBase):
         # #2442
         kwds['allow_leading_cols'] = self.index_col is not False
 
+        # for the date columns parsed by the reader
+        kwds['date_format'] = self.date_format
+
+        if kwds.get('colspecs') is not None:
+            # fixed-width fields, the delimiter is the filler
+            kwds.pop('widths', None)
+            if kwds.get('delimiter') is None:
+                kwds['delimiter'] = ' '
+        else:
+            kwds.pop('colspecs', None)
+            kwds.pop('widths', None)
+
+        schema = kwds.pop('schema', None)
+        if schema is not None:
+            if not isinstance(schema, CSVSchema):
+                schema = CSVSchema(schema)
+            kwds['dtype_hints'] = schema.dtype_hints
+
         self._reader = _parser.TextReader(src, **kwds)
 
         # XXX
@@ -1006,11 +1345,21 @@ class CParserWrapper(ParserBase):
     def _set_noconvert_columns(self):
         names = self.names
 
-        def _set(x):
-            if com.is_integer(x):
-                self._reader.set_noconvert(x)
+        # single date columns are parsed by the reader when it would give
+        # the same result as the date converter
+        parse_in_reader = (self.date_parser is None and
+                           not self.as_recarray and
+                           (self.date_format is None or
+                            _fast_date_format(self.date_format)))
+
+        def _set(x, is_date=False):
+            if not com.is_integer(x):
+                x = names.index(x)
+
+            if is_date and parse_in_reader:
+                self._reader.set_date_column(x)
             else:
-                self._reader.set_noconvert(names.index(x))
+                self._reader.set_noconvert(x)
 
         if isinstance(self.parse_dates, list):
             for val in self.parse_dates:
@@ -1018,7 +1367,7 @@ class CParserWrapper(ParserBase):
                     for k in val:
                         _set(k)
                 else:
-                    _set(val)
+                    _set(val, is_date=True)
 
     def set_error_bad_lines(self, status):
         self._reader.set_error_bad_lines(int(status))
@@ -1036,6 +1385,12 @@ class CParserWrapper(ParserBase):
             else:
                 raise
 
+        # a DataFrame can not hold a Categorical, dictionary-encoded columns
+        # become the object arrays of a default read
+        for k, v in compat.iteritems(data):
+            if isinstance(v, Categorical):
+                data[k] = np.asarray(v)
+
         names = self.names
 
         if self._reader.leading_cols:
@@ -1689,10 +2044,20 @@ class PythonParser(ParserBase):
         return self._check_thousands(lines)
 
 
-def _make_date_converter(date_parser=None, dayfirst=False):
+def _make_date_converter(date_parser=None, dayfirst=False,
+                         date_format=None):
     def converter(*date_cols):
         if date_parser is None:
+            if len(date_cols) == 1 and com.is_datetime64_dtype(date_cols[0]):
+                # parsed by the C reader
+                return date_cols[0]
+
             strs = _concat_date_cols(date_cols)
+            if date_format is not None:
+                try:
+                    return _strptime_dates(strs, date_format)
+                except Exception:
+                    pass
             try:
                 return tslib.array_to_datetime(com._ensure_object(strs),
                                                utc=None, dayfirst=dayfirst)
@@ -1715,6 +2080,25 @@ def _make_date_converter(date_parser=None, dayfirst=False):
     return converter
 
 
+_date_directive = re.compile('%(.)')
+
+
+def _fast_date_format(date_format):
+    # formats that the C reader parses itself
+    return all(d in 'YmdHMSf%' for d in _date_directive.findall(date_format))
+
+
+def _strptime_dates(strs, date_format):
+    strs = com._ensure_object(strs)
+    mask = np.array([x == '' or x in tslib._nat_strings for x in strs],
+                    dtype=bool)
+
+    result = np.empty(len(strs), dtype='M8[ns]')
+    result.view('i8')[mask] = tslib.iNaT
+    result[~mask] = tslib.array_strptime(strs[~mask], date_format)
+    return result
+
+
 def _process_date_conversion(data_dict, converter, parse_spec,
                              index_col, index_names, columns,
                              keep_date_col=False):
@@ -197,12 +197,20 @@ format_doc = """
     default format writing format, if None, then
     put will default to 'fixed' and append will default to 'table'
 """
+zone_size_doc = """
+: int
+    number of rows of the row groups of which the min and max of the
+    queryable numeric columns are stored when creating a table, to skip
+    the row groups that cannot match a where; 0 to not store them
+"""
 
 with config.config_prefix('io.hdf'):
     config.register_option('dropna_table', True, dropna_doc,
                            validator=config.is_bool)
     config.register_option('default_format', None, format_doc,
                            validator=config.is_one_of_factory(['fixed','table',None]))
+    config.register_option('zone_size', 100000, zone_size_doc,
+                           validator=config.is_int)
 
 # oh the troubles to reduce import time
 _table_mod = None
@@ -352,6 +360,13 @@ class HDFStore(StringMixin):
             in the store wherever possible
     fletcher32 : bool, default False
             If applying compression use the fletcher32 checksum
+    cache_size : int, default 0
+            If > 0, keep the results of up to cache_size selects in a least
+            recently used cache, keyed by the node, the (parsed) where, the
+            columns and start/stop. Putting, appending to or removing a node
+            drops its results; changes made outside of this store are not
+            seen. The cache_hits and cache_misses attributes count the
+            selects served from and missing in the cache
 
     Examples
     --------
@@ -365,7 +380,7 @@ class HDFStore(StringMixin):
     """
 
     def __init__(self, path, mode=None, complevel=None, complib=None,
-                 fletcher32=False, **kwargs):
+                 fletcher32=False, cache_size=0, **kwargs):
         try:
             import tables
         except ImportError:  # pragma: no cover
@@ -380,6 +395,10 @@ class HDFStore(StringMixin):
         self._complib = complib
         self._fletcher32 = fletcher32
         self._filters = None
+        self._cache_size = cache_size
+        self._cache = compat.OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.open(mode=mode)
 
     @property
@@ -491,6 +510,7 @@ class HDFStore(StringMixin):
         # close and reopen the handle
         if self.is_open:
             self.close()
+        self._cache.clear()
 
         if self._complib is not None:
             if self._complevel is None:
@@ -515,6 +535,7 @@ class HDFStore(StringMixin):
         if self._handle is not None:
             self._handle.close()
         self._handle = None
+        self._cache.clear()
 
     @property
     def is_open(self):
@@ -562,6 +583,8 @@ class HDFStore(StringMixin):
         start : integer (defaults to None), row number to start selection
         stop  : integer (defaults to None), row number to stop selection
         columns : a list of columns that if not None, will limit the return columns
+            (columns and start/stop also apply to fixed format frames and
+            panels, only the selected rows and blocks are read)
         iterator : boolean, return an iterator, default False
         chunksize : nrows to include in iteration, return an iterator
         auto_close : boolean, should automatically close the store when finished, default is False
@@ -593,8 +616,77 @@ class HDFStore(StringMixin):
                                  stop=stop, chunksize=chunksize,
                                  auto_close=auto_close)
 
-        return TableIterator(self, func, nrows=s.nrows, start=start, stop=stop,
-                             auto_close=auto_close).get_values()
+        # a cached result (a copy, as the caller may modify it)
+        cache_key = self._cache_key(s, where, start, stop, columns, kwargs)
+        if cache_key is not None:
+            result = self._cache.pop(cache_key, None)
+            if result is not None:
+                self._cache[cache_key] = result
+                self.cache_hits += 1
+                if auto_close:
+                    self.close()
+                return result.copy()
+            self.cache_misses += 1
+
+        if s.is_table:
+            result = TableIterator(self, func, nrows=s.nrows, start=start,
+                                   stop=stop, auto_close=auto_close).get_values()
+        else:
+            # a fixed store does not know its nrows, pass the selection as is
+            result = func(start, stop)
+            if auto_close:
+                self.close()
+
+        if cache_key is not None and self.is_open:
+            self._cache[cache_key] = result.copy()
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def _cache_key(self, s, where, start, stop, columns, kwargs):
+        """ return the key of a select of the storer s in the cache: the node,
+        the condition and filter of the parsed where, columns and
+        start/stop; None if the select is not cached """
+        if not self._cache_size or kwargs:
+            return None
+
+        condition = filt = None
+        if where is not None:
+            if not s.is_table:
+                return None
+
+            selection = Selection(s, where=where, start=start, stop=stop)
+            if selection.coordinates is not None:
+                return None
+            if selection.condition is not None:
+                condition = selection.condition.format()
+            if selection.filter is not None:
+                try:
+                    filt = tuple((field, op.__name__, tuple(values))
+                                 for field, op, values in selection.filter.format())
+                except NotImplementedError:
+                    return None
+
+        if columns is not None:
+            columns = tuple(columns)
+
+        key = (s.group._v_pathname, condition, filt, columns, start, stop)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _invalidate_cache(self, key):
+        """ drop the cached selects of the node key (and of its children) """
+        if not len(self._cache):
+            return
+
+        path = '/' + key.strip('/')
+        for k in list(self._cache.keys()):
+            if k[0] == path or k[0].startswith(path.rstrip('/') + '/'):
+                del self._cache[k]
 
     def select_as_coordinates(
             self, key, where=None, start=None, stop=None, **kwargs):
@@ -707,8 +799,14 @@ class HDFStore(StringMixin):
             # axis is the concentation axes
             axis = list(set([t.non_index_axes[0][0] for t in tbls]))[0]
 
-            # concat and return
-            return concat(objs, axis=axis, verify_integrity=False).consolidate()
+            # combine the blocks and return; the combined blocks are left
+            # unconsolidated, as consolidating would copy the same-dtype
+            # blocks of the different tables into one
+            result = _concat_blocks(objs, axis)
+            if result is None:
+                result = concat(objs, axis=axis,
+                                verify_integrity=False).consolidate()
+            return result
 
         if iterator or chunksize is not None:
             return TableIterator(self, func, nrows=nrows, start=start, stop=stop, chunksize=chunksize, auto_close=auto_close)
@@ -761,6 +859,7 @@ class HDFStore(StringMixin):
 
         """
         where = _ensure_term(where)
+        self._invalidate_cache(key)
         try:
             s = self.get_storer(key)
         except:
@@ -812,6 +911,10 @@ class HDFStore(StringMixin):
         encoding     : default None, provide an encoding for strings
         dropna       : boolean, default True, do not write an ALL nan row to the store
                        settable by the option 'io.hdf.dropna_table'
+        zone_size    : rows of the row groups of which the min and max of the
+                       numeric data columns and indexes are stored when the
+                       table is created, 0 to not store them, default is the
+                       option 'io.hdf.zone_size'
         Notes
         -----
         Does *not* check if data being appended overlaps with existing
@@ -1114,6 +1217,7 @@ class HDFStore(StringMixin):
     def _write_to_group(
         self, key, value, format, index=True, append=False,
                         complib=None, encoding=None, **kwargs):
+        self._invalidate_cache(key)
         group = self.get_node(key)
 
         # remove the node if we are not appending
@@ -1192,6 +1296,7 @@ class TableIterator(object):
                  chunksize=None, auto_close=False):
         self.store = store
         self.func = func
+
         self.nrows = nrows or 0
         self.start = start or 0
 
@@ -1664,16 +1769,18 @@ class DataCol(IndexCol):
 
     def set_atom_string(
             self, block, existing_col, min_itemsize, nan_rep, encoding):
-        # fill nan items with myself
-        block = block.fillna(nan_rep)[0]
         data = block.values
 
-        # see if we have a valid string type
-        inferred_type = lib.infer_dtype(data.ravel())
-        if inferred_type != 'string':
+        # encode the strings (filling the nan items with nan_rep) and find
+        # the itemsize, the maximum length of them (along any dimension)
+        try:
+            encoded, itemsize = lib.encode_string_array(
+                com._ensure_object(data.ravel()), encoding, nan_rep)
+        except TypeError:
 
             # we cannot serialize this data, so report an exception on a column
             # by column basis
+            block = block.fillna(nan_rep)[0]
             for item in block.items:
 
                 col = block.get(item)
@@ -1682,9 +1789,7 @@ class DataCol(IndexCol):
                     raise TypeError("Cannot serialize the column [%s] because\n"
                                     "its data contents are [%s] object dtype" %
                                     (item, inferred_type))
-
-        # itemsize is the maximum length of a string (along any dimension)
-        itemsize = lib.max_len_string_array(com._ensure_object(data.ravel()))
+            raise
 
         # specified min_itemsize?
         if isinstance(min_itemsize, dict):
@@ -1701,10 +1806,10 @@ class DataCol(IndexCol):
         self.itemsize = itemsize
         self.kind = 'string'
         self.typ = self.get_atom_string(block, itemsize)
-        self.set_data(self.convert_string_data(data, itemsize, encoding))
+        self.set_data(self.convert_string_data(encoded, itemsize).reshape(data.shape))
 
-    def convert_string_data(self, data, itemsize, encoding):
-        return _convert_string_array(data, encoding, itemsize)
+    def convert_string_data(self, encoded, itemsize):
+        return lib.string_array_to_fixed(encoded, itemsize)
 
     def get_atom_coltype(self):
         """ return the PyTables column class for this column """
@@ -2054,6 +2159,9 @@ class GenericFixed(Fixed):
         if kwargs.get('where') is not None:
             raise TypeError("cannot pass a where specification when reading from a Fixed format store."
                             "this store must be selected in its entirety")
+        if kwargs.get('start') is not None or kwargs.get('stop') is not None:
+            raise TypeError("cannot pass start or stop when reading this Fixed format store, "
+                            "only frames, panels and series can be sliced")
 
     @property
     def is_exists(self):
@@ -2072,17 +2180,18 @@ class GenericFixed(Fixed):
     def write(self, obj, **kwargs):
         self.set_attrs()
 
-    def read_array(self, key):
-        """ read an array for the specified node (off of group """
+    def read_array(self, key, slicer=None):
+        """ read an array for the specified node (off of group), optionally
+        only the slicer tuple of slices (of the returned array), which is
+        read from disk for the numeric arrays """
         import tables
         node = getattr(self.group, key)
-        data = node[:]
         attrs = node._v_attrs
 
         transposed = getattr(attrs, 'transposed', False)
 
         if isinstance(node, tables.VLArray):
-            ret = data[0]
+            ret = node[:][0]
         else:
             dtype = getattr(attrs, 'value_type', None)
             shape = getattr(attrs, 'shape', None)
@@ -2090,8 +2199,13 @@ class GenericFixed(Fixed):
             if shape is not None:
                 # length 0 axis
                 ret = np.empty(shape, dtype=dtype)
+            elif slicer is not None:
+                # the slices of the stored (transposed) axes
+                slicer = tuple(slicer) + (slice(None),) * (node.ndim - len(slicer))
+                ret = node[slicer[::-1] if transposed else slicer]
+                slicer = None
             else:
-                ret = data
+                ret = node[:]
 
             if dtype == u('datetime64'):
                 ret = np.array(ret, dtype='M8[ns]')
@@ -2102,9 +2216,10 @@ class GenericFixed(Fixed):
                 ret = np.array(ret, dtype='m8[ns]')
 
         if transposed:
-            return ret.T
-        else:
-            return ret
+            ret = ret.T
+        if slicer is not None:
+            ret = ret[tuple(slicer)]
+        return ret
 
     def read_index(self, key):
         variety = _ensure_decoded(getattr(self.attrs, '%s_variety' % key))
@@ -2358,11 +2473,16 @@ class SeriesFixed(GenericFixed):
         except:
             return None
 
-    def read(self, **kwargs):
+    def read(self, start=None, stop=None, **kwargs):
         self.validate_read(kwargs)
         index = self.read_index('index')
+        slicer = None
+        if start is not None or stop is not None:
+            index = index[start:stop]
+            slicer = (slice(start, stop),)
+
         if len(index) > 0:
-            values = self.read_array('values')
+            values = self.read_array('values', slicer=slicer)
         else:
             values = []
 
@@ -2499,24 +2619,78 @@ class BlockManagerFixed(GenericFixed):
         except:
             return None
 
-    def read(self, **kwargs):
+    def read(self, columns=None, start=None, stop=None, **kwargs):
+        """ read the object, limited to the columns (items of a panel) and
+        the start:stop rows (major_axis of a panel) if given; the blocks
+        without any of the columns are not read """
         self.validate_read(kwargs)
 
+        rows = None
+        if start is not None or stop is not None:
+            rows = slice(start, stop)
+
         axes = []
         for i in range(self.ndim):
             ax = self.read_index('axis%d' % i)
+            if i == 1 and rows is not None:
+                ax = ax[rows]
             axes.append(ax)
 
+        if columns is not None:
+            columns = _ensure_index(columns)
+            axes[0] = axes[0][axes[0].isin(columns)]
+
         items = axes[0]
         blocks = []
         for i in range(self.nblocks):
             blk_items = self.read_index('block%d_items' % i)
-            values = self.read_array('block%d_values' % i)
+            positions = None
+            if columns is not None:
+                positions = np.flatnonzero(blk_items.isin(columns))
+                if len(positions) == 0:
+                    continue
+                blk_items = blk_items.take(positions)
+
+            values = self.read_block_values('block%d_values' % i,
+                                            positions=positions, rows=rows)
             blk = make_block(values, blk_items, items)
             blocks.append(blk)
 
         return self.obj_type(BlockManager(blocks, axes))
 
+    def read_block_values(self, key, positions=None, rows=None):
+        """ read the values of a block, only the items at positions (sorted)
+        and the rows slice if given; each run of consecutive items is a
+        single read """
+        slicer = [slice(None)] * self.ndim
+        if rows is not None:
+            slicer[1] = rows
+
+        if positions is None:
+            if rows is None:
+                return self.read_array(key)
+            return self.read_array(key, slicer=slicer)
+
+        if isinstance(getattr(self.group, key), _tables().VLArray):
+            # pickled objects are read in their entirety
+            values = self.read_array(key, slicer=slicer)
+            return values.take(positions, axis=0)
+
+        # the first and last + 1 positions of each run
+        breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+        run_starts = positions[np.concatenate([[0], breaks])]
+        run_stops = positions[np.concatenate([breaks - 1,
+                                              [len(positions) - 1]])] + 1
+
+        pieces = []
+        for run_start, run_stop in zip(run_starts, run_stops):
+            slicer[0] = slice(run_start, run_stop)
+            pieces.append(self.read_array(key, slicer=slicer))
+
+        if len(pieces) == 1:
+            return pieces[0]
+        return np.concatenate(pieces, axis=0)
+
     def write(self, obj, **kwargs):
         super(BlockManagerFixed, self).write(obj, **kwargs)
         data = obj._data
@@ -2691,6 +2865,23 @@ class Table(Fixed):
         """ return a tuple of my permutated axes, non_indexable at the front """
         return tuple(itertools.chain([int(a[0]) for a in self.non_index_axes], [int(a.axis) for a in self.index_axes]))
 
+    @property
+    def zone_size(self):
+        """ the rows of the row groups of the zone maps """
+        return getattr(self.attrs, 'zone_size', None)
+
+    def read_zone_map(self, column):
+        """ return the (mins, maxs) of the row groups of the column, or None
+        if there is no (up-to-date) zone map for it """
+        columns = getattr(self.attrs, 'zone_columns', None) or []
+        if column not in columns:
+            return None
+        if getattr(self.attrs, 'zone_nrows', None) != self.nrows:
+            return None
+
+        zones = getattr(self.group, 'zone_map%d' % columns.index(column))[:]
+        return zones[:, 0], zones[:, 1]
+
     def queryables(self):
         """ return a dict of the kinds allowable columns for this object """
 
@@ -3344,10 +3535,11 @@ class AppendableTable(LegacyTable):
 
     def write(self, obj, axes=None, append=False, complib=None,
               complevel=None, fletcher32=None, min_itemsize=None, chunksize=None,
-              expectedrows=None, dropna=True, **kwargs):
+              expectedrows=None, dropna=True, zone_size=None, **kwargs):
 
         if not append and self.is_exists:
             self._handle.removeNode(self.group, 'table')
+            self.remove_zone_maps()
 
         # create the axes
         self.create_axes(axes=axes, obj=obj, validate=append,
@@ -3368,6 +3560,12 @@ class AppendableTable(LegacyTable):
             # create the table
             table = self._handle.createTable(self.group, **options)
 
+            # create the zone maps
+            if zone_size is None:
+                zone_size = get_option('io.hdf.zone_size')
+            if zone_size:
+                self.create_zone_maps(zone_size)
+
         else:
             table = self.table
 
@@ -3489,6 +3687,78 @@ class AppendableTable(LegacyTable):
         except Exception as detail:
             raise TypeError("tables cannot write this data -> %s" % detail)
 
+        if len(rows):
+            self.write_zone_maps(rows)
+
+    def create_zone_maps(self, zone_size):
+        """ create the (empty) zone maps of the numeric queryable columns: the
+        min and max of each row group of zone_size rows, which a Selection
+        uses to skip the row groups that cannot match its condition """
+        coldtypes = self.table.coldtypes
+        queryables = self.queryables()
+
+        columns = []
+        for c in self.table.colnames:
+            dtype = coldtypes[c]
+            if queryables.get(c) is None or dtype.kind not in 'iuf' or dtype.shape:
+                continue
+            self._handle.createEArray(self.group, 'zone_map%d' % len(columns),
+                                      _tables().Atom.from_dtype(dtype),
+                                      shape=(0, 2))
+            columns.append(c)
+
+        self.attrs.zone_columns = columns
+        self.attrs.zone_size = zone_size
+        self.attrs.zone_nrows = 0
+
+    def write_zone_maps(self, rows):
+        """ update the zone maps with the rows just appended to the table """
+        columns = getattr(self.attrs, 'zone_columns', None)
+        if not columns:
+            return
+
+        # the table was appended to without the zone maps
+        start = self.attrs.zone_nrows
+        if start + len(rows) != self.nrows:
+            self.remove_zone_maps()
+            return
+
+        # the starts of the row groups in rows; the first one may continue
+        # the last row group of the table
+        zone_size = self.attrs.zone_size
+        offset = start % zone_size
+        starts = np.arange(-offset, len(rows), zone_size)
+        starts[0] = 0
+
+        for i, c in enumerate(columns):
+            values = rows[c]
+            zones = np.column_stack([np.fmin.reduceat(values, starts),
+                                     np.fmax.reduceat(values, starts)])
+
+            node = getattr(self.group, 'zone_map%d' % i)
+            if offset:
+                last = node[node.nrows - 1]
+                zones[0] = [np.fmin(zones[0, 0], last[0]),
+                            np.fmax(zones[0, 1], last[1])]
+                node[node.nrows - 1] = zones[0]
+                zones = zones[1:]
+            if len(zones):
+                node.append(zones)
+
+        self.attrs.zone_nrows = start + len(rows)
+
+    def remove_zone_maps(self):
+        """ remove the zone maps (they are not updated when deleting rows) """
+        columns = getattr(self.attrs, 'zone_columns', None)
+        if not columns:
+            return
+
+        for i in range(len(columns)):
+            key = 'zone_map%d' % i
+            if key in self.group:
+                self._handle.removeNode(self.group, key)
+        self.attrs.zone_columns = []
+
     def delete(self, where=None, **kwargs):
 
         # delete all rows (and return the nrows)
@@ -3528,6 +3798,9 @@ class AppendableTable(LegacyTable):
             if groups[0] != 0:
                 groups.insert(0, 0)
 
+            # the row groups of the zone maps shift
+            self.remove_zone_maps()
+
             # we must remove in reverse order!
             pg = groups.pop()
             for g in reversed(groups):
@@ -3793,6 +4066,30 @@ def _reindex_axis(obj, axis, labels, other=None):
         obj = obj.loc[tuple(slicer)]
     return obj
 
+def _concat_blocks(objs, axis):
+    """ concatenate the objs along their info axis by combining their blocks
+    into a single BlockManager (the block values are not copied); return None
+    if axis is not the info axis or the other axes differ """
+    first = objs[0]
+    if axis != first._info_axis_number:
+        return None
+
+    other_axes = first._data.axes[1:]
+    for obj in objs[1:]:
+        if type(obj) != type(first):
+            return None
+        if not all(ax.equals(oax) for ax, oax in zip(other_axes, obj._data.axes[1:])):
+            return None
+
+    items = _ensure_index(np.concatenate([obj._data.items.values for obj in objs]))
+    if not items.is_unique:
+        return None
+
+    blocks = [make_block(blk.values, blk.items, items)
+              for obj in objs for blk in obj._data.blocks]
+    return first._constructor(BlockManager(blocks, [items] + list(other_axes)))
+
+
 def _get_info(info, name):
     """ get/create the info for this name """
     try:
@@ -3905,35 +4202,45 @@ def _unconvert_index_legacy(data, kind, legacy=False, encoding=None):
 
 
 def _convert_string_array(data, encoding, itemsize=None):
-
-    # encode if needed
-    if encoding is not None and len(data):
-        f = np.vectorize(lambda x: x.encode(encoding), otypes=[np.object])
-        data = f(data)
+    """ serialize a string array to fixed width bytes, possibly encoding """
+    encoded, length = lib.encode_string_array(
+        com._ensure_object(data.ravel()), encoding)
 
     # create the sized dtype
     if itemsize is None:
-        itemsize = lib.max_len_string_array(com._ensure_object(data.ravel()))
+        itemsize = length
 
-    data = np.array(data, dtype="S%d" % itemsize)
-    return data
+    return lib.string_array_to_fixed(encoded, itemsize).reshape(data.shape)
 
 
 def _unconvert_string_array(data, nan_rep=None, encoding=None):
     """ deserialize a string array, possibly decoding """
     shape = data.shape
-    data = np.array(data.ravel(), dtype=object)
 
     # guard against a None encoding in PY3 (because of a legacy
     # where the passed encoding is actually None)
     encoding = _ensure_encoding(encoding)
-    if encoding is not None and len(data):
-        f = np.vectorize(lambda x: x.decode(encoding), otypes=[np.object])
-        data = f(data)
 
     if nan_rep is None:
         nan_rep = 'nan'
 
+    # fixed width bytes are decoded and compared to the (encoded) nan_rep
+    # in a single pass
+    if data.dtype.kind == 'S':
+        if encoding is not None:
+            nan_bytes = nan_rep.encode(encoding)
+        elif isinstance(nan_rep, bytes):
+            nan_bytes = nan_rep
+        else:
+            nan_bytes = None
+        data = lib.decode_string_array(data.ravel(), encoding, nan_bytes)
+        return data.reshape(shape)
+
+    data = np.array(data.ravel(), dtype=object)
+    if encoding is not None and len(data):
+        f = np.vectorize(lambda x: x.decode(encoding), otypes=[np.object])
+        data = f(data)
+
     data = lib.string_array_replace_from_nan_rep(data, nan_rep)
     return data.reshape(shape)
 
@@ -4261,6 +4568,10 @@ class Selection(object):
         generate the selection
         """
         if self.condition is not None:
+            ranges = self.zone_ranges()
+            if ranges is not None:
+                return np.concatenate([self.table.table.readWhere(self.condition.format(), start=start, stop=stop)
+                                       for start, stop in ranges])
             return self.table.table.readWhere(self.condition.format(), start=self.start, stop=self.stop)
         elif self.coordinates is not None:
             return self.table.table.readCoordinates(self.coordinates)
@@ -4273,8 +4584,34 @@ class Selection(object):
         if self.condition is None:
             return np.arange(self.table.nrows)
 
+        ranges = self.zone_ranges()
+        if ranges is not None:
+            return np.concatenate([self.table.table.getWhereList(self.condition.format(), start=start, stop=stop, sort=True)
+                                   for start, stop in ranges])
         return self.table.table.getWhereList(self.condition.format(), start=self.start, stop=self.stop, sort=True)
 
+    def zone_ranges(self):
+        """
+        return the list of (start, stop) row ranges of the selection that
+        the zone maps of the table do not exclude, or None if they exclude
+        no row group
+        """
+        mask = self.condition.zone_mask(self.table.read_zone_map)
+        if mask is None or mask.all():
+            return None
+
+        # the runs of row groups, clipped to the selection
+        start, stop, _ = slice(self.start, self.stop).indices(self.table.nrows)
+        zone_size = self.table.zone_size
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], mask.astype('i1'), [0]])))
+        starts = np.clip(edges[::2] * zone_size, start, stop)
+        stops = np.clip(edges[1::2] * zone_size, start, stop)
+
+        ranges = [(int(s), int(e)) for s, e in zip(starts, stops) if s < e]
+        if not len(ranges):
+            ranges = [(0, 0)]
+        return ranges
+
 
 # utilities ###
 
@@ -281,6 +281,52 @@ one,two
         self.assert_(result[0].dtype == 'u1')
         self.assert_(result[1].dtype == 'O')
 
+    def test_categorical(self):
+        data = 'a,b\n' + '\n'.join('%s,%d' % (['x', 'yy', '', 'zzz'][i % 4], i)
+                                   for i in range(50))
+
+        # the empty fields are missing, not a level
+        def _make_reader(**kwds):
+            return TextReader(StringIO(data), delimiter=',', na_values=[''],
+                              na_fvalues=set(), **kwds)
+
+        expected = _make_reader().read()[0]
+
+        result = _make_reader(dtype={'a': 'category'}).read()
+        cat = result[0]
+        self.assert_(isinstance(cat, parser.Categorical))
+        self.assertEqual(len(cat.levels), 3)
+        self.assert_((cat.labels[2::4] == -1).all())
+        assert_almost_equal(np.asarray(cat), expected)
+        self.assert_(result[1].dtype == np.int64)
+
+        # levels are merged across chunks
+        result = _make_reader(dtype='category', low_memory=True,
+                              buffer_lines=6).read()
+        self.assertEqual(len(result[0].levels), 3)
+        assert_almost_equal(np.asarray(result[0]), expected)
+
+        # only the columns inferred as strings are encoded
+        self.assert_(result[1].dtype == np.int64)
+
+        # strings in the later chunks only
+        chunks = [{0: np.array([1, 2])},
+                  {0: parser.Categorical([0, -1, 1], Index(['x', 'y']))}]
+        result = parser._concatenate_chunks(chunks)
+        self.assertEqual(list(result[0][:2]), [1, 2])
+        self.assertEqual(list(result[0][[2, 4]]), ['x', 'y'])
+        self.assert_(isnull(result[0][3]))
+
+        # threaded, strings in the later blocks only
+        data = 'a,b\n' + '\n'.join('%s,%d' % (i if i < 400 else 'x%d' % i, i)
+                                    for i in range(500))
+        expected = TextReader(StringIO(data), delimiter=',').read()
+        result = TextReader(StringIO(data), delimiter=',', dtype='category',
+                            threads=4, tokenize_chunksize=64).read()
+        self.assert_(isinstance(result[0], parser.Categorical))
+        assert_almost_equal(np.asarray(result[0]), expected[0])
+        self.assert_(result[1].dtype == np.int64)
+
     def test_usecols(self):
         data = """\
 a,b,c
@@ -300,6 +346,42 @@ a,b,c
         self.assertTrue((result[1] == exp[1]).all())
         self.assertTrue((result[2] == exp[2]).all())
 
+    def test_usecols_wide(self):
+        # only the selected fields are kept by the tokenizer
+        ncols = 40
+        lines = [','.join('c%d' % j for j in range(ncols))]
+        for i in range(200):
+            fields = ['%d' % (i * ncols + j) for j in range(ncols)]
+            if i % 13 == 0:
+                fields = fields[:25]
+            elif i % 17 == 0:
+                fields[7] = '"a,\n%d"' % i
+            lines.append(','.join(fields))
+        lines.insert(50, ','.join(['x'] * (ncols + 2)))
+        data = '\n'.join(lines)
+
+        def _test(usecols, **kwds):
+            expected = TextReader(StringIO(data), delimiter=',',
+                                  error_bad_lines=False,
+                                  warn_bad_lines=False, **kwds).read()
+            result = TextReader(StringIO(data), delimiter=',',
+                                error_bad_lines=False, warn_bad_lines=False,
+                                usecols=usecols, **kwds).read()
+            self.assertEqual(sorted(result), sorted(usecols))
+            for i in usecols:
+                self.assert_(np.array_equal(result[i], expected[i]))
+
+        _test([1, 7, 30])
+        _test([0, 39])
+        _test([1, 7, 30], low_memory=True, buffer_lines=16)
+        _test([1, 7, 30], skiprows=[3, 4, 100])
+
+        reader = TextReader(StringIO(data), delimiter=',',
+                            error_bad_lines=False, warn_bad_lines=False,
+                            usecols=['c3', 'c30'])
+        result = reader.read()
+        self.assertEqual(sorted(result), [3, 30])
+
     def test_cr_delimited(self):
         def _test(text, **kwargs):
             nice_text = text.replace('\r', '\r\n')
@@ -334,6 +416,89 @@ a,b,c
                     2: np.array(['3', ''], dtype=object)}
         assert_array_dicts_equal(result, expected)
 
+    def test_threads(self):
+        lines = ['a,b,c,d']
+        for i in range(500):
+            if i % 7 == 0:
+                lines.append('%d,"x\n%d",%.3f,"q,r"' % (i, i, i / 3.))
+            elif i % 11 == 0:
+                lines.append('%d,,%.3f,# not a comment' % (i, i / 3.))
+            else:
+                lines.append('%d,y%d,%.3f,z' % (i, i, i / 3.))
+        data = '\n'.join(lines)
+
+        def _test(**kwds):
+            expected = TextReader(StringIO(data), **kwds).read()
+            result = TextReader(StringIO(data), threads=4,
+                                tokenize_chunksize=64, **kwds).read()
+            self.assertEqual(sorted(result), sorted(expected))
+            assert_array_dicts_equal(result, expected)
+
+        _test(delimiter=',')
+        _test(delimiter=',', low_memory=False)
+        _test(delimiter=',', skiprows=[1, 2, 100, 101, 499])
+        _test(delimiter=',', header=None)
+
+        self.assertRaises(ValueError, TextReader, StringIO(data), threads=0)
+
+    def test_threads_bad_lines(self):
+        lines = ['a,b,c']
+        for i in range(300):
+            if i in (50, 250):
+                lines.append('%d,%d,%d,%d' % (i, i, i, i))
+            else:
+                lines.append('%d,%d,%d' % (i, i, i))
+        data = '\n'.join(lines)
+
+        reader = TextReader(StringIO(data), delimiter=',', threads=4,
+                            tokenize_chunksize=64)
+        self.assertRaises(parser.CParserError, reader.read)
+
+        stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            reader = TextReader(StringIO(data), delimiter=',', threads=4,
+                                tokenize_chunksize=64,
+                                error_bad_lines=False, warn_bad_lines=True)
+            result = reader.read()
+            val = sys.stderr.getvalue()
+            self.assertTrue('Skipping line 52' in val)
+            self.assertTrue('Skipping line 252' in val)
+        finally:
+            sys.stderr = stderr
+
+        expected = [i for i in range(300) if i not in (50, 250)]
+        self.assert_(np.array_equal(result[0], expected))
+
+    def test_colspecs(self):
+        data = ('a   bb  c\n'
+                '1   2.5 x\n'
+                '10  3   yy\r\n'
+                '100 4.5\n'
+                '7   1e3 zzz')
+
+        def _make_reader(**kwds):
+            return TextReader(StringIO(data), delimiter=' ',
+                              colspecs=[(0, 3), (4, 7), (8, 10)],
+                              na_filter=False, **kwds)
+
+        result = _make_reader().read()
+        expected = {0: np.array([1, 10, 100, 7]),
+                    1: np.array([2.5, 3, 4.5, 1000]),
+                    2: np.array(['x', 'yy', '', 'zz'], dtype=object)}
+        self.assertEqual(sorted(result), [0, 1, 2])
+        assert_array_dicts_equal(result, expected)
+
+        result = _make_reader(usecols=[0, 2], low_memory=True,
+                              buffer_lines=2).read()
+        self.assertEqual(sorted(result), [0, 2])
+        assert_array_dicts_equal(result, expected)
+
+        self.assertRaises(ValueError, TextReader, StringIO(data),
+                          colspecs=[(0, 3), (2, 5)])
+        self.assertRaises(ValueError, TextReader, StringIO(data),
+                          colspecs=[(4, 7), (0, 3)])
+
 
 def assert_array_dicts_equal(left, right):
     for k, v in compat.iteritems(left):
@@ -6,6 +6,8 @@ import csv
 import os
 import sys
 import re
+import shutil
+import tempfile
 import unittest
 import nose
 
@@ -841,6 +843,40 @@ c,4,5
                         'C': [2, 4, 5]}, idx)
         tm.assert_frame_equal(rs, xp)
 
+    def test_parse_dates_iso8601(self):
+        dates = ['2012-01-03', '2012-01-04 10:30:00', '',
+                 '2012-01-06T00:00:01.5', '2012-01-07']
+        data = 'a,b\n' + '\n'.join('%s,%d' % (d, i)
+                                   for i, d in enumerate(dates))
+
+        expected = tools.to_datetime([d or None for d in dates]).asi8
+        rs = self.read_csv(StringIO(data), parse_dates=['a'])
+        self.assert_(np.array_equal(rs['a'].values.view('i8'), expected))
+
+        # a value that only dateutil parses
+        data += '\nJan 8 2012,5'
+        expected = np.append(expected, Timestamp('2012-01-08').value)
+        rs = self.read_csv(StringIO(data), parse_dates=['a'])
+        self.assert_(np.array_equal(rs['a'].values.view('i8'), expected))
+
+    def test_parse_dates_date_format(self):
+        data = ('a,b\n'
+                '03/01/2012 10:00,1\n'
+                '04/01/2012 11:30,2\n'
+                ',3\n'
+                '15/01/2012 09:05,4')
+
+        rs = self.read_csv(StringIO(data), parse_dates=['a'],
+                           date_format='%d/%m/%Y %H:%M')
+        expected = tools.to_datetime(['2012-01-03 10:00', '2012-01-04 11:30',
+                                      None, '2012-01-15 09:05']).asi8
+        self.assert_(np.array_equal(rs['a'].values.view('i8'), expected))
+
+        # not one of the directives parsed in C
+        rs = self.read_csv(StringIO(data.replace('/01/', '/Jan/')),
+                           parse_dates=['a'], date_format='%d/%b/%Y %H:%M')
+        self.assert_(np.array_equal(rs['a'].values.view('i8'), expected))
+
     def test_yy_format(self):
         data = """date,time,B,C
 090131,0010,1,2
@@ -1154,6 +1190,72 @@ baz,7,8,9
         self.assert_(len(result) == 3)
         tm.assert_frame_equal(pd.concat(result), expected)
 
+    def test_where(self):
+        self._check_where()
+
+    def test_where_python_engine(self):
+        # evaluated by the python engine when numexpr is not installed
+        installed = parsers._NUMEXPR_INSTALLED
+        parsers._NUMEXPR_INSTALLED = False
+        try:
+            self._check_where()
+        finally:
+            parsers._NUMEXPR_INSTALLED = installed
+
+    def _check_where(self):
+        df = self.read_csv(StringIO(self.data1), index_col=0)
+
+        result = self.read_csv(StringIO(self.data1), index_col=0,
+                               where='A > 5 and D < 15')
+        tm.assert_frame_equal(result, df[(df.A > 5) & (df.D < 15)])
+
+        # named index levels can be referenced
+        result = self.read_csv(StringIO(self.data1), index_col=0,
+                               where='index == "qux" or B == 3')
+        tm.assert_frame_equal(result, df[(df.index == 'qux') | (df.B == 3)])
+
+        # filtered per chunk
+        reader = self.read_csv(StringIO(self.data1), index_col=0,
+                               chunksize=2, where='A == 12')
+        chunks = list(reader)
+        self.assertEqual([len(chunk) for chunk in chunks], [0, 2, 2])
+        tm.assert_frame_equal(pd.concat(chunks), df[df.A == 12])
+
+        self.assertRaises(ValueError, self.read_csv, StringIO(self.data1),
+                          where='A + 1')
+
+    def test_multiple_files(self):
+        df = self.read_csv(StringIO(self.data1), index_col=0)
+        dirpath = tempfile.mkdtemp()
+        pattern = os.path.join(dirpath, '__multi_*__.csv')
+        paths = [os.path.join(dirpath, '__multi_%d__.csv' % i)
+                 for i in range(3)]
+        try:
+            for piece, path in zip([df[:2], df[2:3], df[3:]], paths):
+                piece.to_csv(path)
+
+            result = self.read_csv(paths, index_col=0)
+            tm.assert_frame_equal(result, df)
+
+            result = self.read_csv(pattern, index_col=0, threads=2,
+                                   source_key='file')
+            tm.assert_frame_equal(result[df.columns], df)
+            self.assertEqual(list(result['file']),
+                             paths[:1] * 2 + paths[1:2] + paths[2:] * 3)
+
+            # the default indexes are renumbered
+            result = self.read_csv(paths)
+            self.assert_(result.index.equals(Index(lrange(6))))
+            self.assertEqual(list(result['index']), list(df.index))
+
+            self.assertRaises(ValueError, self.read_csv, paths, chunksize=2)
+        finally:
+            shutil.rmtree(dirpath)
+
+        self.assertRaises(IOError, self.read_csv, pattern)
+        self.assertRaises(ValueError, self.read_csv, StringIO(self.data1),
+                          source_key='file')
+
     def test_header_not_first_line(self):
         data = """got,to,ignore,this,line
 got,to,ignore,this,line
@@ -2054,6 +2156,67 @@ c   1   2   3   4
                                   compression=comp_name)
                 tm.assert_frame_equal(result, expected)
 
+    def test_fwf_c_engine(self):
+        # multibyte characters count as one position
+        names = ['ab', u('\u00e9t\u00e9') if PY3 else 'ete', '', 'NA']
+        lines = ['id   name      value']
+        for i in range(100):
+            name = names[i % 4]
+            lines.append(u('%-5d%-10s%s') % (i, name, i / 4.))
+        lines[50] = lines[50][:12]
+        data = '\n'.join(lines)
+        colspecs = [(0, 5), (5, 15), (15, 25)]
+
+        # the truncated line has no value and a partial name
+        ids = lrange(100)
+        fields = [names[i % 4] for i in ids]
+        values = [i / 4. for i in ids]
+        values[49] = np.nan
+
+        def _frame(fields, values=values):
+            return DataFrame({'id': ids, 'name': fields, 'value': values},
+                             columns=['id', 'name', 'value'])
+
+        def _test(expected, **kwds):
+            result = read_fwf(StringIO(data), colspecs=colspecs, **kwds)
+            tm.assert_frame_equal(result, expected)
+
+        expected = _frame([np.nan if f in ('', 'NA') else f for f in fields])
+        _test(expected)
+        _test(expected.set_index('id'), index_col=0)
+        _test(expected[['id', 'value']], usecols=['id', 'value'])
+        # without the default NA values the empty value is kept as text
+        strings = ['%s' % (i / 4.) for i in ids]
+        strings[49] = ''
+        _test(_frame([np.nan if f == 'ab' else f for f in fields], strings),
+              na_values=['ab'], keep_default_na=False)
+
+        rows = [['id', 'name', 'value']] + [[str(i), fields[i],
+                                             str(values[i])]
+                                            for i in ids[2:]]
+        header = DataFrame(rows, dtype=object)
+        header[1][header[1].isin(['', 'NA'])] = np.nan
+        header[2][header[2] == 'nan'] = np.nan
+        _test(header, header=None, skiprows=[1, 2])
+
+        reader = read_fwf(StringIO(data), colspecs=colspecs, chunksize=7)
+        tm.assert_frame_equal(pd.concat(list(reader), ignore_index=True),
+                              expected)
+
+        # the other names of utf-8 count characters as well, which bytes
+        # would split here
+        name = u('a') + u('\u00e9') * 9
+        text = u('\n').join([u('id   name      value'),
+                             u('%-5d%-10s%s') % (1, name, 0.5),
+                             u('%-5d%-10s%s') % (2, u('ab'), 1.0)])
+        expected = DataFrame({'id': [1, 2], 'name': [name, u('ab')],
+                              'value': [0.5, 1.0]},
+                             columns=['id', 'name', 'value'])
+        for encoding in ['utf-8', 'utf8', 'UTF8', 'utf_8']:
+            result = read_fwf(BytesIO(text.encode('utf-8')),
+                              colspecs=colspecs, encoding=encoding)
+            tm.assert_frame_equal(result, expected)
+
     def test_BytesIO_input(self):
         if not compat.PY3:
             raise nose.SkipTest("Bytes-related test - only needs to work on Python 3")
@@ -2169,6 +2332,29 @@ class TestCParserHighMemory(ParserTests, unittest.TestCase):
         result = pd.read_csv(s, parse_dates=["Date"], na_filter=False)
         self.assertTrue(result['Date'].isnull()[1])
 
+    def test_threads(self):
+        df = DataFrame({'a': np.arange(1000),
+                        'b': np.random.randn(1000),
+                        'c': ['foo\n%d' % i for i in range(1000)]})
+        buf = StringIO()
+        df.to_csv(buf, index=False)
+        data = buf.getvalue()
+
+        expected = self.read_csv(StringIO(data))
+        result = self.read_csv(StringIO(data), threads=4)
+        tm.assert_frame_equal(result, expected)
+
+        # serial fallbacks
+        result = self.read_csv(StringIO(data), threads=4, nrows=100)
+        tm.assert_frame_equal(result, expected[:100])
+
+        reader = self.read_csv(StringIO(data), threads=4, chunksize=300)
+        tm.assert_frame_equal(pd.concat(list(reader), ignore_index=True),
+                              expected)
+
+        self.assertRaises(ValueError, read_csv, StringIO(data),
+                          threads=4, engine='python')
+
 
 class TestCParserLowMemory(ParserTests, unittest.TestCase):
 
@@ -2281,6 +2467,66 @@ a,b,c
         self.assertTrue((result.dtypes == [object, np.int, np.float]).all())
         self.assertTrue((result2.dtypes == [object, np.float]).all())
 
+    def test_dtype_category(self):
+        data = 'a,b,c\n' + '\n'.join('%s,%d,%s' % (['foo', 'bar', 'NA'][i % 3],
+                                                   i, ['x', 'y'][i % 2])
+                                     for i in range(100))
+        expected = self.read_csv(StringIO(data))
+
+        # each chunk is numbered from its first row
+        result = self.read_csv(StringIO(data), dtype={'a': 'category'},
+                               chunksize=7)
+        result = pd.concat(list(result), ignore_index=True)
+        tm.assert_frame_equal(result, expected)
+
+        result = self.read_csv(StringIO(data), index_col='c',
+                               dtype={'a': 'category', 'c': 'category'})
+        tm.assert_frame_equal(result, expected.set_index('c'))
+
+        # the rows share one object per level
+        col = result['a'].values
+        self.assert_(col[0] is col[3])
+
+        # numeric columns are left alone
+        result = self.read_csv(StringIO(data), dtype='category')
+        tm.assert_frame_equal(result, expected)
+        self.assertEqual(result['b'].dtype, np.int64)
+
+    def test_schema(self):
+        data = ('a,b,c,d,e\n'
+                '1,2.5,x,True,2013-01-01\n'
+                '2,,y,,2013-01-02\n'
+                '3,4.5,z,False,2013-01-03\n')
+        expected = self.read_csv(StringIO(data), index_col='a',
+                                 parse_dates=['e'])
+
+        schema = parsers.CSVSchema.infer(StringIO(data), index_col='a',
+                                         parse_dates=['e'])
+        self.assertEqual(schema.dtypes[0], ('a', np.dtype('i8')))
+        self.assertEqual([dtype for name, dtype in schema.dtypes[1:]],
+                         [np.dtype('f8'), np.dtype('O'), None,
+                          np.dtype('M8[ns]')])
+
+        result = self.read_csv(StringIO(data), index_col='a',
+                               parse_dates=['e'], schema=schema)
+        tm.assert_frame_equal(result, expected)
+
+        with tm.ensure_clean() as path:
+            schema.save(path)
+            self.assertEqual(parsers.CSVSchema.load(path), schema)
+
+        # columns read with the known type across chunks
+        reader = self.read_csv(StringIO('a,b\n1,2\n3,4.5\n'), chunksize=1,
+                               schema={'b': 'f8'})
+        result = pd.concat(list(reader))
+        self.assert_(result['b'].dtype == np.float64)
+        self.assert_(result['a'].dtype == np.int64)
+
+        # values that do not fit the known type are inferred
+        result = self.read_csv(StringIO('a,b\n1,x\n'),
+                               schema={'a': 'f8', 'b': 'i8'})
+        self.assert_(result['a'].dtype == np.float64)
+        self.assert_(result['b'].dtype == np.object_)
 
     def test_usecols_implicit_index_col(self):
         # #2654
@@ -2355,6 +2601,46 @@ a,b,c
             self.assertRaises(ValueError, self.read_csv,
                               path, compression='bz3')
 
+    def test_decompression_multiple_buffers(self):
+        try:
+            import gzip
+            import bz2
+        except ImportError:
+            raise nose.SkipTest
+
+        # several reads of the decompressed stream, over two gzip members
+        df = DataFrame({'a': np.arange(200000),
+                        'b': ['x%d' % (i % 10) for i in range(200000)]})
+        buf = StringIO()
+        df.to_csv(buf, index=False)
+        data = buf.getvalue().encode('utf-8')
+        half = len(data) // 2
+
+        for compression, klass, parts in [
+                ('gzip', gzip.GzipFile, [data[:half], data[half:]]),
+                ('bz2', bz2.BZ2File, [data])]:
+            with tm.ensure_clean() as path:
+                for i, part in enumerate(parts):
+                    tmp = klass(path + str(i), mode='wb')
+                    tmp.write(part)
+                    tmp.close()
+                with open(path, 'wb') as f:
+                    for i in range(len(parts)):
+                        with open(path + str(i), 'rb') as part:
+                            f.write(part.read())
+                        os.remove(path + str(i))
+
+                result = self.read_csv(path, compression=compression)
+                tm.assert_frame_equal(result, df)
+
+                # truncated file
+                with open(path, 'rb') as f:
+                    compressed = f.read()
+                with open(path, 'wb') as f:
+                    f.write(compressed[:-100])
+                self.assertRaises(Exception, self.read_csv, path,
+                                  compression=compression)
+
     def test_decompression_regex_sep(self):
         try:
             import gzip
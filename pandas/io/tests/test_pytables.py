@@ -14,7 +14,8 @@ from pandas import (Series, DataFrame, Panel, MultiIndex, bdate_range,
 from pandas.io.pytables import (HDFStore, get_store, Term, read_hdf,
                                 IncompatibilityWarning, PerformanceWarning,
                                 AttributeConflictWarning, DuplicateWarning,
-                                PossibleDataLossError, ClosedFileError)
+                                PossibleDataLossError, ClosedFileError,
+                                Selection)
 import pandas.util.testing as tm
 from pandas.util.testing import (assert_panel4d_equal,
                                  assert_panel_equal,
@@ -761,6 +762,36 @@ class TestHDFStore(unittest.TestCase):
             result = store.select('df',Term('columns=A',encoding='ascii'))
             tm.assert_frame_equal(result,expected)
 
+    def test_append_strings_nan_rep(self):
+
+        with ensure_clean(self.path) as store:
+            df = DataFrame(dict(A=['cafe', 'foo', np.nan, '', 'bar'],
+                                B=['x', None, 'yy', 'nan', 'zzz']),
+                           index=range(5))
+
+            # the nan_rep is the (encoded) missing value marker
+            store.append('df', df, data_columns=['B'], nan_rep='missing',
+                         encoding='utf-8', min_itemsize={'B': 10})
+            result = store.select('df')
+            expected = df.copy()
+            expected.loc[1, 'B'] = np.nan
+            tm.assert_frame_equal(result, expected)
+            self.assert_(store.get_storer('df').table.coldtypes['B'].itemsize == 10)
+
+            result = store.select('df', Term('B="yy"'))
+            tm.assert_frame_equal(result, expected.loc[[2]])
+
+            # the default nan_rep reads back 'nan' as NaN
+            store.append('df2', df, encoding='utf-8')
+            result = store.select('df2')
+            expected.loc[3, 'B'] = np.nan
+            tm.assert_frame_equal(result, expected)
+
+            # non-strings report the column
+            df['C'] = 'foo'
+            df.loc[2, 'C'] = 1
+            self.assertRaises(TypeError, store.append, 'df3', df)
+
     def test_append_some_nans(self):
 
         with ensure_clean(self.path) as store:
@@ -1480,9 +1511,65 @@ class TestHDFStore(unittest.TestCase):
 
         with ensure_clean(self.path) as store:
             store.put('df',df)
-            self.assertRaises(TypeError, store.select, 'df', columns=['A'])
             self.assertRaises(TypeError, store.select, 'df',where=[('columns=A')])
 
+            s = tm.makeTimeSeries()
+            store.put('s',s)
+            self.assertRaises(TypeError, store.select, 's', columns=['A'])
+
+    def test_select_fixed(self):
+
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+        df['int'] = 1
+        df = df.consolidate()
+
+        with ensure_clean(self.path) as store:
+            store.put('df',df)
+
+            # columns
+            result = store.select('df', columns=['A','int','C'])
+            expected = df.reindex(columns=['A','C','int'])
+            tm.assert_frame_equal(result, expected)
+
+            result = store.select('df', columns=['string','B'])
+            tm.assert_frame_equal(result, df[['B','string']])
+
+            # rows
+            result = store.select('df', start=5, stop=17)
+            tm.assert_frame_equal(result, df[5:17])
+
+            result = store.select('df', start=-10)
+            tm.assert_frame_equal(result, df[-10:])
+
+            # both
+            result = store.select('df', columns=['B','D','string'], stop=3)
+            tm.assert_frame_equal(result, df[['B','D','string']][:3])
+
+            result = store.select('df', columns=['missing'])
+            self.assert_(len(result.columns) == 0)
+            self.assert_(result.index.equals(df.index))
+
+            # series
+            s = df['A']
+            store.put('s',s)
+            tm.assert_series_equal(store.select('s', start=3, stop=8), s[3:8])
+
+            # panel
+            p = tm.makePanel()
+            store.put('p',p)
+            result = store.select('p', columns=['ItemC','ItemA'], start=2, stop=10)
+            expected = p.reindex(items=['ItemA','ItemC'])
+            expected = expected.reindex(major=p.major_axis[2:10])
+            tm.assert_panel_equal(result, expected)
+
+            # where is still not supported
+            self.assertRaises(TypeError, store.select, 'df', where=[('columns=A')])
+
+            # nor is iterating
+            self.assertRaises(TypeError, store.select, 'df', start=5, iterator=True)
+            self.assertRaises(TypeError, store.select, 'df', chunksize=5)
+
     def test_append_misc(self):
 
         with ensure_clean(self.path) as store:
@@ -3301,6 +3388,19 @@ class TestHDFStore(unittest.TestCase):
             expected = expected[5:]
             tm.assert_frame_equal(result, expected)
 
+            # the blocks of the tables are combined into one frame
+            result = store.select_as_multiple(
+                ['df1', 'df2'], where=['A>0', 'B>0'], selector='df1')
+            expected = concat([df1, df2], axis=1)
+            expected = expected[(expected.A > 0) & (expected.B > 0)]
+            tm.assert_frame_equal(result, expected)
+            self.assert_(result._data.is_consolidated())
+
+            result = store.select_as_multiple(
+                ['df1', 'df2'], where=['A>0', 'B>0'], selector='df1',
+                chunksize=7)
+            tm.assert_frame_equal(concat(list(result)), expected)
+
             # test excpection for diff rows
             store.append('df3', tm.makeTimeDataFrame(nper=50))
             self.assertRaises(ValueError, store.select_as_multiple,
@@ -3324,6 +3424,130 @@ class TestHDFStore(unittest.TestCase):
             assert(len(result) == 0)
             assert(type(result) == DataFrame)
 
+    def test_zone_maps(self):
+
+        df = DataFrame(dict(A=np.arange(1000), B=np.random.randn(1000),
+                            C=np.random.randn(1000)),
+                       index=date_range('20130101', periods=1000, freq='s'))
+        df.ix[100:200, 'B'] = np.nan
+
+        with ensure_clean(self.path) as store:
+
+            # appended in pieces not aligned with the row groups
+            store.append('df', df[:150], data_columns=['A','B'], zone_size=64)
+            store.append('df', df[150:600])
+            store.append('df', df[600:])
+
+            s = store.get_storer('df')
+            mins, maxs = s.read_zone_map('A')
+            tm.assert_almost_equal(mins, np.arange(0, 1000, 64))
+            tm.assert_almost_equal(maxs, np.minimum(np.arange(63, 1063, 64), 999))
+            mins, maxs = s.read_zone_map('index')
+            tm.assert_almost_equal(mins, df.index.values[::64].view('i8'))
+            self.assert_(s.read_zone_map('C') is None)
+
+            # the row groups are skipped
+            ranges = Selection(s, where='A>=100 & A<300').zone_ranges()
+            self.assert_(ranges == [(64, 320)])
+            ranges = Selection(s, where='A<100 | A>900', start=10, stop=950).zone_ranges()
+            self.assert_(ranges == [(10, 128), (896, 950)])
+            self.assert_(Selection(s, where='A>=100 | A!=5').zone_ranges() is None)
+
+            result = store.select('df', where='A>=100 & A<300')
+            tm.assert_frame_equal(result, df[(df.A >= 100) & (df.A < 300)])
+            result = store.select('df', where='A<100 | A>900', start=10, stop=950)
+            expected = df[10:950]
+            tm.assert_frame_equal(result, expected[(expected.A < 100) | (expected.A > 900)])
+            result = store.select('df', where='B>0 & A<400')
+            tm.assert_frame_equal(result, df[(df.B > 0) & (df.A < 400)])
+            result = store.select('df', where='A=[5,500,995]')
+            tm.assert_frame_equal(result, df.take([5, 500, 995]))
+            result = store.select('df', where='A>5000')
+            self.assert_(len(result) == 0)
+            result = store.select('df', where=[Term('index>=df.index[500]'),
+                                               Term('index<df.index[520]')])
+            tm.assert_frame_equal(result, df[500:520])
+            coords = store.select_as_coordinates('df', where='A>=100 & A<300')
+            tm.assert_almost_equal(coords.values, np.arange(100, 300))
+
+            # deleting rows removes the zone maps
+            store.remove('df', where='A<100')
+            self.assert_(store.get_storer('df').read_zone_map('A') is None)
+            result = store.select('df', where='A>=100 & A<300')
+            tm.assert_frame_equal(result, df[(df.A >= 100) & (df.A < 300)])
+
+            # not stored
+            store.append('df2', df, data_columns=['A'], zone_size=0)
+            self.assert_(store.get_storer('df2').read_zone_map('A') is None)
+
+    def test_select_cache(self):
+
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+
+        with tm.ensure_clean(self.path) as path:
+
+            store = HDFStore(path, cache_size=2)
+            try:
+                store.append('df', df, data_columns=['A','string'])
+                store.put('df_fixed', df)
+                expected = df[df.A > 0]
+
+                result = store.select('df', where='A>0')
+                tm.assert_frame_equal(result, expected)
+                self.assert_(store.cache_misses == 1 and store.cache_hits == 0)
+
+                # an equivalent where
+                result = store.select('df', where=['A > 0'])
+                tm.assert_frame_equal(result, expected)
+                self.assert_(store.cache_misses == 1 and store.cache_hits == 1)
+
+                # modifying a result does not change the cache
+                result['A'] = 0
+                tm.assert_frame_equal(store.select('df', where='A>0'), expected)
+                self.assert_(store.cache_hits == 2)
+
+                # the variables are part of the where
+                for v in [0, 1]:
+                    result = store.select('df', where='A>v')
+                    tm.assert_frame_equal(result, df[df.A > v])
+                self.assert_(store.cache_hits == 3)
+
+                # columns and start/stop
+                result = store.select('df', where='A>0', columns=['A','B'], start=5)
+                tm.assert_frame_equal(result, df[5:][df[5:].A > 0][['A','B']])
+                self.assert_(store.cache_misses == 3)
+
+                # the least recently used is dropped
+                store.select('df_fixed')
+                self.assert_(len(store._cache) == 2)
+                store.select('df', where='A>0')
+                self.assert_(store.cache_misses == 5)
+
+                # appending drops the results of the node
+                store.select('df_fixed')
+                store.append('df', df)
+                result = store.select('df', where='A>0')
+                tm.assert_frame_equal(result, concat([expected, expected]))
+                store.select('df_fixed')
+                self.assert_(store.cache_misses == 6 and store.cache_hits == 5)
+
+                # put and remove too
+                store.put('df_fixed', df[:5])
+                tm.assert_frame_equal(store.select('df_fixed'), df[:5])
+                store.remove('df', where=Term('index>df.index[10]'))
+                expected = expected[expected.index <= df.index[10]]
+                tm.assert_frame_equal(store.select('df', where='A>0'), concat([expected, expected]))
+            finally:
+                store.close()
+
+        # not cached by default
+        with ensure_clean(self.path) as store:
+            store.append('df', df)
+            store.select('df')
+            store.select('df')
+            self.assert_(store.cache_hits == 0 and store.cache_misses == 0)
+
     def test_select_filter_corner(self):
 
         df = DataFrame(np.random.randn(50, 100))
@@ -15,6 +15,11 @@ from cpython cimport (PyDict_New, PyDict_GetItem, PyDict_SetItem,
                       PyList_Check, PyFloat_Check,
                       PyString_Check,
 		      PyBytes_Check,
+                      PyBytes_AS_STRING,
+                      PyBytes_GET_SIZE,
+                      PyBytes_FromStringAndSize,
+                      PyUnicode_AsEncodedString,
+                      PyUnicode_Decode,
                       PyTuple_SetItem,
                       PyTuple_New,
                       PyObject_SetAttrString)
@@ -81,6 +86,7 @@ cpdef map_indices_list(list index):
 
 
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy, memcmp
 
 def ismember(ndarray arr, set values):
     '''
@@ -805,6 +811,131 @@ def string_array_replace_from_nan_rep(ndarray[object, ndim=1] arr, object nan_re
 
     return arr
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def encode_string_array(ndarray[object, ndim=1] arr, object encoding=None,
+                        object nan_rep=None):
+    """
+    encode the strings of a 1-dim array to bytes in a single pass, replacing
+    the null values with nan_rep if it is not None
+
+    Returns
+    -------
+    (object array of the bytes, the maximum length of them)
+
+    Raises TypeError on a value that is not a string
+    """
+    cdef:
+        Py_ssize_t i, n = len(arr), l, m = 0
+        ndarray[object] result = np.empty(n, dtype=object)
+        object v, nan_bytes = None
+        bytes benc
+        char *enc = NULL
+
+    if encoding is not None:
+        benc = encoding.encode('ascii') if PyUnicode_Check(encoding) else encoding
+        enc = benc
+
+    if nan_rep is not None:
+        nan_bytes = _encode_string(nan_rep, enc)
+
+    for i in range(n):
+        v = arr[i]
+        if PyString_Check(v):
+            v = _encode_string(v, enc)
+        elif nan_bytes is not None and _checknull(v):
+            v = nan_bytes
+        else:
+            raise TypeError("cannot encode a non-string value [%s] of type "
+                            "[%s]" % (v, type(v).__name__))
+
+        result[i] = v
+        l = PyBytes_GET_SIZE(v)
+        if l > m:
+            m = l
+
+    return result, m
+
+cdef inline object _encode_string(object v, char *encoding):
+    """ return the bytes of the (native) string v """
+    if encoding != NULL:
+        if PyUnicode_Check(v):
+            return PyUnicode_AsEncodedString(v, encoding, NULL)
+        return v.encode(encoding)
+    if not PyBytes_Check(v):
+        return v.encode('ascii')
+    return v
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def string_array_to_fixed(ndarray[object, ndim=1] arr, Py_ssize_t itemsize):
+    """ copy the bytes of a 1-dim array into a fixed width (itemsize) bytes
+    array, null padded and truncated like a numpy string conversion """
+    cdef:
+        Py_ssize_t i, n = len(arr), l
+        ndarray result
+        char *data
+        object v
+
+    if itemsize < 1:
+        itemsize = 1
+    result = np.zeros(n, dtype='S%d' % itemsize)
+    data = <char *> result.data
+
+    for i in range(n):
+        v = arr[i]
+        l = PyBytes_GET_SIZE(v)
+        if l > itemsize:
+            l = itemsize
+        memcpy(data + i * itemsize, PyBytes_AS_STRING(v), l)
+
+    return result
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def decode_string_array(ndarray arr, object encoding=None,
+                        object nan_bytes=None):
+    """
+    return the values of a 1-dim fixed width bytes array as an object array
+    of strings (without the null padding), decoded if encoding is not None;
+    the values equal to the bytes nan_bytes are replaced with NaN
+    """
+    cdef:
+        Py_ssize_t i, n = len(arr), itemsize = arr.dtype.itemsize, l
+        Py_ssize_t nan_len = -1
+        ndarray[object] result = np.empty(n, dtype=object)
+        ndarray values = np.ascontiguousarray(arr)
+        char *data = <char *> values.data
+        char *p
+        char *nan_data = NULL
+        bytes benc
+        char *enc = NULL
+
+    if encoding is not None:
+        benc = encoding.encode('ascii') if PyUnicode_Check(encoding) else encoding
+        enc = benc
+
+    if nan_bytes is not None:
+        nan_len = PyBytes_GET_SIZE(nan_bytes)
+        nan_data = PyBytes_AS_STRING(nan_bytes)
+
+    for i in range(n):
+        p = data + i * itemsize
+
+        # strip the null padding
+        l = itemsize
+        while l > 0 and p[l - 1] == 0:
+            l -= 1
+
+        if l == nan_len and memcmp(p, nan_data, l) == 0:
+            result[i] = NaN
+        elif enc != NULL:
+            result[i] = PyUnicode_Decode(p, l, enc, NULL)
+        else:
+            result[i] = PyBytes_FromStringAndSize(p, l)
+
+    return result
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def write_csv_rows(list data, list data_index, int nlevels, list cols, object writer):
@@ -1209,3 +1340,4 @@ def indices_fast(object index, ndarray[int64_t] labels, list keys,
 include "reduce.pyx"
 include "properties.pyx"
 include "inference.pyx"
+include "writers.pyx"
@@ -2,13 +2,14 @@
 # See LICENSE for the license
 
 from libc.stdio cimport fopen, fclose
-from libc.stdlib cimport malloc, free
+from libc.stdlib cimport malloc, calloc, realloc, free
 from libc.string cimport strncpy, strlen, strcmp, strcasecmp
 cimport libc.stdio as stdio
 
 from cpython cimport (PyObject, PyBytes_FromString,
                       PyBytes_AsString, PyBytes_Check,
-                      PyUnicode_Check, PyUnicode_AsUTF8String)
+                      PyUnicode_Check, PyUnicode_AsUTF8String,
+                      PyErr_Clear)
 
 
 cdef extern from "Python.h":
@@ -19,16 +20,20 @@ cdef extern from "Python.h":
 
 cdef extern from "stdlib.h":
     void memcpy(void *dst, void *src, size_t n)
+    void memmove(void *dst, void *src, size_t n)
 
 cimport numpy as cnp
 
-from numpy cimport ndarray, uint8_t, uint64_t
+from numpy cimport ndarray, int32_t, uint8_t, uint64_t
 
 import numpy as np
 cimport util
 
 import pandas.lib as lib
+from pandas.core.categorical import Categorical
+from pandas.core.index import Index
 
+import codecs
 import time
 import os
 
@@ -36,6 +41,10 @@ cnp.import_array()
 
 from khash cimport *
 
+from datetime cimport (pandas_datetimestruct, PANDAS_FR_ns,
+                       pandas_datetimestruct_to_datetime, _cstring_to_dts,
+                       parse_fixed_format_datetime)
+
 import sys
 
 cdef bint PY3 = (sys.version_info[0] >= 3)
@@ -43,6 +52,8 @@ cdef bint PY3 = (sys.version_info[0] >= 3)
 cdef double INF = <double> np.inf
 cdef double NEGINF = -INF
 
+cdef object _NS_DTYPE = np.dtype('M8[ns]')
+
 cdef extern from "headers/stdint.h":
     enum: UINT8_MAX
     enum: UINT16_MAX
@@ -81,6 +92,8 @@ cdef extern from "parser/tokenizer.h":
         FINISHED
 
     enum: ERROR_OVERFLOW
+    enum: REACHED_EOF
+    enum: DECOMPRESSION_FAILED
 
     ctypedef void* (*io_callback)(void *src, size_t nbytes, size_t *bytes_read,
                                  int *status)
@@ -152,6 +165,8 @@ cdef extern from "parser/tokenizer.h":
         void *skipset
         int skip_footer
 
+        int *colspecs
+
         #  error handling
         char *warn_msg
         char *error_msg
@@ -161,14 +176,17 @@ cdef extern from "parser/tokenizer.h":
         int *line_start
         int col
 
-    void coliter_setup(coliter_t *it, parser_t *parser, int i, int start)
-    char* COLITER_NEXT(coliter_t it)
+    void coliter_setup(coliter_t *it, parser_t *parser, int i, int start) nogil
+    char* COLITER_NEXT(coliter_t it) nogil
 
     parser_t* parser_new()
 
     int parser_init(parser_t *self) nogil
     void parser_free(parser_t *self) nogil
     int parser_add_skiprow(parser_t *self, int64_t row)
+    int parser_set_usecols(parser_t *self, int *cols, int ncols)
+    int parser_set_colspecs(parser_t *self, int *colspecs, int ncolspecs,
+                            char filler, int utf8)
 
     void parser_set_default_options(parser_t *self)
 
@@ -181,12 +199,19 @@ cdef extern from "parser/tokenizer.h":
     int tokenize_all_rows(parser_t *self)
     int tokenize_nrows(parser_t *self, size_t nrows)
 
+    int parser_find_breaks(parser_t *self, char *data, int datalen,
+                           int nchunks, int *breaks, int *records)
+    parser_t* parser_new_chunk(parser_t *self, char *data, int datalen,
+                               int file_lines, int prev_fields)
+    int tokenize_chunk(parser_t *self, int eof) nogil
+    void parser_free_chunk(parser_t *self)
+
     int64_t str_to_int64(char *p_item, int64_t int_min,
-                         int64_t int_max, int *error, char tsep)
+                         int64_t int_max, int *error, char tsep) nogil
     uint64_t str_to_uint64(char *p_item, uint64_t uint_max, int *error)
 
     inline int to_double(char *item, double *p_value,
-                         char sci, char decimal, char thousands)
+                         char sci, char decimal, char thousands) nogil
     inline int to_complex(char *item, double *p_real,
                           double *p_imag, char sci, char decimal)
     inline int to_longlong(char *item, long long *p_value)
@@ -214,6 +239,16 @@ cdef extern from "parser/io.h":
     void* buffer_rd_bytes(void *source, size_t nbytes,
                           size_t *bytes_read, int *status)
 
+    void *new_gzip_source(char *fname, size_t buffer_size)
+    int del_gzip_source(void *src)
+    void* buffer_gzip_bytes(void *source, size_t nbytes,
+                            size_t *bytes_read, int *status)
+
+    void *new_bz2_source(char *fname, size_t buffer_size)
+    int del_bz2_source(void *src)
+    void* buffer_bz2_bytes(void *source, size_t nbytes,
+                           size_t *bytes_read, int *status)
+
 
 DEFAULT_CHUNKSIZE = 256 * 1024
 
@@ -234,14 +269,17 @@ cdef class TextReader:
 
     cdef:
         parser_t *parser
+        parser_t **chunk_parsers
+        int nchunk_parsers, chunk_capacity
         object file_handle, na_fvalues
         bint factorize, na_filter, verbose, has_usecols, has_mi_columns
         int parser_start
         list clocks
         char *c_encoding
+        char *c_date_format
 
     cdef public:
-        int leading_cols, table_width, skip_footer, buffer_lines
+        int leading_cols, table_width, skip_footer, buffer_lines, threads
         object allow_leading_cols
         object delimiter, converters, delim_whitespace
         object na_values, true_values, false_values
@@ -251,12 +289,13 @@ cdef class TextReader:
         object low_memory
         object skiprows
         object compact_ints, use_unsigned
-        object dtype
+        object dtype, dtype_hints
         object encoding
         object compression
         object mangle_dupe_cols
         object tupleize_cols
-        set noconvert, usecols
+        object date_format
+        set noconvert, usecols, date_columns
 
     def __cinit__(self, source,
                   delimiter=b',',
@@ -306,11 +345,15 @@ cdef class TextReader:
                   use_unsigned=False,
                   low_memory=False,
                   buffer_lines=None,
+                  threads=1,
                   skiprows=None,
                   skip_footer=0,
                   verbose=False,
                   mangle_dupe_cols=True,
-                  tupleize_cols=False):
+                  tupleize_cols=False,
+                  date_format=None,
+                  dtype_hints=None,
+                  colspecs=None):
 
         self.parser = parser_new()
         self.parser.chunksize = tokenize_chunksize
@@ -413,32 +456,64 @@ cdef class TextReader:
         self.verbose = verbose
         self.low_memory = low_memory
 
-        # encoding
+        if threads < 1:
+            raise ValueError('threads must be at least 1, got %s' % threads)
+        self.threads = threads
+
+        # encoding, under its canonical name so that aliases of utf-8 get
+        # the utf-8 paths
         if encoding is not None:
-            if not isinstance(encoding, bytes):
-                encoding = encoding.encode('utf-8')
-            encoding = encoding.lower()
+            if isinstance(encoding, bytes):
+                encoding = encoding.decode('utf-8')
+            try:
+                encoding = codecs.lookup(encoding).name
+            except LookupError:
+                pass
+            encoding = encoding.encode('utf-8').lower()
             self.c_encoding = <char*> encoding
         else:
             self.c_encoding = NULL
 
         self.encoding = encoding
 
+        # fixed-width fields, the delimiter is the filler around values
+        if colspecs is not None:
+            self._set_colspecs(colspecs)
+
+        # strptime format of the date columns, NULL for ISO 8601
+        if date_format is not None:
+            if not isinstance(date_format, bytes):
+                date_format = date_format.encode('utf-8')
+            self.c_date_format = <char*> date_format
+        else:
+            self.c_date_format = NULL
+
+        self.date_format = date_format
+
         if isinstance(dtype, dict):
             conv = {}
             for k in dtype:
                 v = dtype[k]
-                if isinstance(v, basestring):
+                if isinstance(v, basestring) and v != 'category':
                     v = np.dtype(v)
                 conv[k] = v
             dtype = conv
-        elif dtype is not None:
+        elif dtype is not None and not _is_category(dtype):
             dtype = np.dtype(dtype)
 
         self.dtype = dtype
 
+        # dtypes known from an earlier read, tried before inference
+        if dtype_hints is not None:
+            dtype_hints = dict((k, _hint_cast_dtype(v))
+                               for k, v in dtype_hints.items())
+            dtype_hints = dict((k, v) for k, v in dtype_hints.items()
+                               if v is not None)
+        self.dtype_hints = dtype_hints
+
         # XXX
         self.noconvert = set()
+        self.date_columns = set()
 
         #----------------------------------------
         # header stuff
@@ -482,6 +557,9 @@ cdef class TextReader:
         if not self.table_width:
             raise ValueError("No columns to parse from file")
 
+        if self.has_usecols:
+            self._set_tokenizer_usecols()
+
         # compute buffer_lines as function of table width
         heuristic = 2**20 // self.table_width
         self.buffer_lines = 1
@@ -497,6 +575,74 @@ cdef class TextReader:
     def set_error_bad_lines(self, int status):
         self.parser.error_bad_lines = status
 
+    cdef _set_colspecs(self, colspecs):
+        cdef:
+            int *specs
+            int i, status, utf8
+
+        colspecs = list(colspecs)
+        specs = <int*> malloc(2 * len(colspecs) * sizeof(int))
+        if specs == NULL:
+            raise MemoryError()
+
+        try:
+            prev_end = 0
+            for i, (start, end) in enumerate(colspecs):
+                if start < prev_end or end < start:
+                    raise ValueError('colspecs must be sorted, '
+                                     'non-overlapping (start, end) pairs, '
+                                     'got %s' % (colspecs,))
+                specs[2 * i] = start
+                specs[2 * i + 1] = end
+                prev_end = end
+
+            # positions are in characters of the decoded text
+            utf8 = ((self.c_encoding == NULL and PY3) or
+                    (self.c_encoding != NULL and self.c_encoding == b'utf-8'))
+
+            status = parser_set_colspecs(self.parser, specs, len(colspecs),
+                                         self.parser.delimiter, utf8)
+        finally:
+            free(specs)
+
+        if status != 0:
+            raise MemoryError()
+
+    cdef _set_tokenizer_usecols(self):
+        # have the tokenizer store only the fields of the columns that will
+        # be converted
+        cdef:
+            Py_ssize_t i, nused = 0
+            int *cols
+
+        used = []
+        for i in range(self.table_width):
+            if i < self.leading_cols:
+                used.append(i)
+                continue
+            try:
+                name = self._get_column_name(i, nused)
+            except IndexError:
+                # let the conversion report it
+                return
+            if i in self.usecols or name in self.usecols:
+                used.append(i)
+                nused += 1
+
+        if len(used) == 0 or len(used) == self.table_width:
+            return
+
+        cols = <int*> malloc(len(used) * sizeof(int))
+        if cols == NULL:
+            raise MemoryError('out of memory for usecols')
+        for i in range(len(used)):
+            cols[i] = used[i]
+        status = parser_set_usecols(self.parser, cols, len(used))
+        free(cols)
+
+        if status < 0:
+            raise MemoryError('out of memory for usecols')
+
     cdef _make_skiprow_set(self):
         if isinstance(self.skiprows, (int, np.integer)):
             self.skiprows = range(self.skiprows)
@@ -512,6 +658,11 @@ cdef class TextReader:
         self.parser.cb_io = NULL
         self.parser.cb_cleanup = NULL
 
+        if self.compression and isinstance(source, basestring):
+            # decompressed in C where pandas was built against zlib / bzip2
+            if self._setup_compressed_source(source):
+                return
+
         if self.compression:
             if self.compression == 'gzip':
                 import gzip
@@ -571,6 +722,31 @@ cdef class TextReader:
             raise IOError('Expected file path name or file-like object,'
                           ' got %s type' % type(source))
 
+    cdef bint _setup_compressed_source(self, source) except -1:
+        cdef:
+            void *ptr = NULL
+            bytes fname
+
+        fname = source if isinstance(source, bytes) else source.encode('utf-8')
+
+        if self.compression == 'gzip':
+            ptr = new_gzip_source(fname, self.parser.chunksize)
+            self.parser.cb_io = &buffer_gzip_bytes
+            self.parser.cb_cleanup = &del_gzip_source
+        elif self.compression == 'bz2':
+            ptr = new_bz2_source(fname, self.parser.chunksize)
+            self.parser.cb_io = &buffer_bz2_bytes
+            self.parser.cb_cleanup = &del_bz2_source
+
+        if ptr == NULL:
+            # not available or not a valid file, let Python open it
+            self.parser.cb_io = NULL
+            self.parser.cb_cleanup = NULL
+            return False
+
+        self.parser.source = ptr
+        return True
+
     cdef _get_header(self):
         # header is now a list of lists, so field_count should use header[0]
 
@@ -704,7 +880,9 @@ cdef class TextReader:
         cdef:
             int status
 
-        if self.low_memory:
+        if rows is None and self._can_read_parallel():
+            columns = self._read_parallel()
+        elif self.low_memory:
             # Conserve intermediate space
             columns = self._read_low_memory(rows)
         else:
@@ -758,6 +936,442 @@ cdef class TextReader:
         # destructive to chunks
         return _concatenate_chunks(chunks)
 
+    cdef bint _can_read_parallel(self):
+        # the record boundaries are found with the states of the default
+        # delimited tokenizer, and the header rows must be behind us
+        return (self.threads > 1 and
+                not self.parser.delim_whitespace and
+                self.parser.colspecs == NULL and
+                self.parser.lineterminator == 0 and
+                self.parser.state == START_RECORD and
+                self.parser.lines > 0 and
+                self.skip_footer == 0)
+
+    cdef _read_parallel(self):
+        """
+        Read all remaining rows, splitting blocks of the input at record
+        boundaries into one chunk per thread. The chunks are tokenized without
+        the GIL and converted on a pool of threads, and the columns stitched
+        in order. Should a chunk fail, or not line up with the previous one
+        (ragged rows), the block is tokenized as a single chunk instead, so
+        that errors and warnings are those of the serial reader. The tokens
+        of every chunk are kept until the end of the read, as with
+        low_memory=False, and a column whose inferred dtype differs between
+        chunks is converted again over all of them, so that the result is
+        that of the serial reader as well.
+        """
+        cdef:
+            int nchunks = self.threads
+            int chunk_bytes = 16 * self.parser.chunksize
+            int target = nchunks * chunk_bytes
+            int bufcap = target + self.parser.chunksize
+            int buflen, start, end, k, n, base, status
+            int file_lines, prev_fields, block_fields, chunk_lines
+            size_t bytes_read
+            bint eof = 0, serial
+            char *buf
+            char *new_buf
+            char *data
+            int *breaks
+            int *records
+            parser_t *chunk
+
+        from multiprocessing.pool import ThreadPool
+
+        self._start_clock()
+
+        file_lines = self.parser.file_lines
+        prev_fields = self.parser.line_fields[self.parser.lines - 1]
+
+        # (parser, first line, end line) of each part of the result, -1
+        # standing for the main parser and k for chunk_parsers[k]
+        segments = []
+        results = []
+        if self.parser.lines > self.parser_start:
+            segments.append((-1, self.parser_start, self.parser.lines))
+            results.append(self._convert_lines(self.parser, self.parser_start,
+                                               self.parser.lines,
+                                               not self.as_recarray))
+            self.parser_start = self.parser.lines
+
+        buf = <char*> malloc(bufcap)
+        breaks = <int*> malloc(nchunks * sizeof(int))
+        records = <int*> malloc(nchunks * sizeof(int))
+        self.nchunk_parsers = 0
+        self.chunk_capacity = 0
+        self.chunk_parsers = NULL
+        if buf == NULL or breaks == NULL or records == NULL:
+            free(buf)
+            free(breaks)
+            free(records)
+            raise MemoryError('out of memory for parallel tokenization')
+
+        # bytes buffered by the main parser but not tokenized yet
+        buflen = self.parser.datalen - self.parser.datapos
+        memcpy(buf, self.parser.data + self.parser.datapos, buflen)
+        self.parser.datapos = self.parser.datalen
+
+        pool = ThreadPool(nchunks)
+        try:
+            while True:
+                while not eof and buflen < target:
+                    data = <char*> self.parser.cb_io(self.parser.source,
+                                                     self.parser.chunksize,
+                                                     &bytes_read, &status)
+                    if status == REACHED_EOF:
+                        eof = 1
+                        break
+                    elif status == DECOMPRESSION_FAILED:
+                        raise CParserError('Decompressing the source failed')
+                    elif data == NULL:
+                        raise CParserError('Calling read(nbytes) on source '
+                                           'failed. Try engine=\'python\'.')
+
+                    if buflen + <int> bytes_read > bufcap:
+                        bufcap = 2 * (buflen + bytes_read)
+                        new_buf = <char*> realloc(buf, bufcap)
+                        if new_buf == NULL:
+                            raise MemoryError('out of memory for parallel '
+                                              'tokenization')
+                        buf = new_buf
+                    memcpy(buf + buflen, data, bytes_read)
+                    buflen += bytes_read
+
+                n = parser_find_breaks(self.parser, buf, buflen, nchunks,
+                                       breaks, records)
+                if eof:
+                    if buflen == 0:
+                        break
+                    # the last record may lack its line terminator
+                    if n == 0:
+                        n = 1
+                    breaks[n - 1] = buflen
+                elif n == 0:
+                    # a record longer than the block
+                    target *= 2
+                    continue
+                end = breaks[n - 1]
+
+                base = self.nchunk_parsers
+                self._reserve_chunk_parsers(base + n)
+
+                start = 0
+                chunk_lines = file_lines
+                for k in range(n):
+                    self._new_chunk_parser(buf + start, breaks[k] - start,
+                                           chunk_lines, prev_fields)
+                    start = breaks[k]
+                    chunk_lines += records[k]
+
+                tasks = [(base + k, eof and k == n - 1) for k in range(n)]
+                statuses = pool.map(self._tokenize_chunk, tasks)
+
+                # check the seams against a single pass over the block
+                block_fields = prev_fields
+                serial = 0
+                chunk_lines = file_lines
+                for k in range(n):
+                    chunk = self.chunk_parsers[base + k]
+                    if (statuses[k] < 0 or
+                        (self.parser.expected_fields < 0 and
+                         chunk.line_fields[0] != prev_fields)):
+                        serial = 1
+                        break
+                    chunk_lines += records[k]
+                    if not (eof and k == n - 1):
+                        if chunk.file_lines != chunk_lines:
+                            serial = 1
+                            break
+                    if chunk.lines > 1:
+                        prev_fields = chunk.line_fields[chunk.lines - 1]
+
+                if serial:
+                    self._free_chunk_parsers(base)
+
+                    # one chunk picking up where the last block left off
+                    prev_fields = block_fields
+                    chunk = self._new_chunk_parser(buf, end, file_lines,
+                                                   prev_fields)
+                    status = tokenize_chunk(chunk, eof)
+                    chunk.data = NULL
+                    chunk.datalen = chunk.datapos = 0
+
+                    self._flush_warnings(chunk)
+                    if status < 0:
+                        raise_parser_error('Error tokenizing data', chunk)
+
+                    file_lines = chunk.file_lines
+                    if chunk.lines > 1:
+                        prev_fields = chunk.line_fields[chunk.lines - 1]
+                        segments.append((base, 1, chunk.lines))
+                        results.append(self._convert_chunk(base))
+                else:
+                    for k in range(n):
+                        chunk = self.chunk_parsers[base + k]
+                        chunk.data = NULL
+                        chunk.datalen = chunk.datapos = 0
+                        self._flush_warnings(chunk)
+                    file_lines = self.chunk_parsers[base + n - 1].file_lines
+
+                    converted = pool.map(self._convert_chunk,
+                                         range(base, base + n))
+                    for k in range(n):
+                        if converted[k] is not None:
+                            chunk = self.chunk_parsers[base + k]
+                            segments.append((base + k, 1, chunk.lines))
+                            results.append(converted[k])
+
+                if eof:
+                    break
+
+                # carry the incomplete record over to the next block
+                buflen -= end
+                memmove(buf, buf + end, buflen)
+
+            self.parser.state = FINISHED
+            self.parser.file_lines = file_lines
+
+            if len(results) == 0:
+                raise StopIteration
+
+            # destructive to results
+            columns = self._stitch_segments(segments, results)
+        finally:
+            pool.close()
+            pool.join()
+
+            self._free_chunk_parsers(0)
+            free(self.chunk_parsers)
+            self.chunk_parsers = NULL
+            self.chunk_capacity = 0
+            free(buf)
+            free(breaks)
+            free(records)
+
+        self._end_clock('Parallel tokenization and type conversion')
+
+        return columns
+
+    def _tokenize_chunk(self, task):
+        cdef:
+            int status
+            bint eof
+            parser_t *chunk
+
+        k, eof = task
+        chunk = self.chunk_parsers[k]
+        with nogil:
+            status = tokenize_chunk(chunk, eof)
+        return status
+
+    def _convert_chunk(self, int k):
+        cdef parser_t *chunk = self.chunk_parsers[k]
+
+        # the first line is the placeholder for the previous chunk
+        if chunk.lines <= 1:
+            return None
+        return self._convert_lines(chunk, 1, chunk.lines,
+                                   not self.as_recarray)
+
+    cdef _reserve_chunk_parsers(self, int n):
+        cdef parser_t **new_parsers
+
+        if n <= self.chunk_capacity:
+            return
+        n = max(n, 2 * self.chunk_capacity)
+        new_parsers = <parser_t**> realloc(self.chunk_parsers,
+                                           n * sizeof(parser_t*))
+        if new_parsers == NULL:
+            raise MemoryError('out of memory for parallel tokenization')
+        self.chunk_parsers = new_parsers
+        self.chunk_capacity = n
+
+    cdef parser_t *_new_chunk_parser(self, char *data, int datalen,
+                                     int file_lines,
+                                     int prev_fields) except NULL:
+        cdef parser_t *chunk
+
+        self._reserve_chunk_parsers(self.nchunk_parsers + 1)
+        chunk = parser_new_chunk(self.parser, data, datalen, file_lines,
+                                 prev_fields)
+        if chunk == NULL:
+            raise MemoryError('out of memory for parallel tokenization')
+        self.chunk_parsers[self.nchunk_parsers] = chunk
+        self.nchunk_parsers += 1
+        return chunk
+
+    cdef _free_chunk_parsers(self, int start):
+        cdef int k
+
+        for k in range(start, self.nchunk_parsers):
+            parser_free_chunk(self.chunk_parsers[k])
+            self.chunk_parsers[k] = NULL
+        self.nchunk_parsers = min(start, self.nchunk_parsers)
+
+    cdef parser_t *_segment_parser(self, int k):
+        if k < 0:
+            return self.parser
+        return self.chunk_parsers[k]
+
+    cdef _stitch_segments(self, list segments, list results):
+        # a column inferred differently in different chunks is converted
+        # again as a whole, as by the serial reader
+        cdef bint upcast_na = not self.as_recarray
+
+        mixed = {}
+        for i, name in self._used_columns():
+            arrs = [columns[i] for columns in results]
+            categorical = [isinstance(a, Categorical) for a in arrs]
+            if all(categorical):
+                continue
+            if not any(categorical) and len(set(a.dtype for a in arrs)) == 1:
+                continue
+
+            conv = self._get_converter(i, name)
+            if conv:
+                values = np.concatenate([np.asarray(a, dtype=object)
+                                         for a in arrs])
+                mixed[i] = lib.maybe_convert_objects(values)
+            else:
+                mixed[i] = self._convert_segments(segments, i, name,
+                                                  upcast_na)
+            for columns in results:
+                del columns[i]
+
+        result = _concatenate_chunks(results)
+        result.update(mixed)
+        return result
+
+    cdef _convert_segments(self, list segments, Py_ssize_t i, object name,
+                           bint upcast_na):
+        cdef:
+            kh_str_t *na_hashset = NULL
+            bint na_filter = 0
+            object na_flist = set()
+
+        if self.na_filter:
+            na_list, na_flist = self._get_na_list(i, name)
+            if na_list is not None:
+                na_filter = 1
+                na_hashset = kset_from_list(na_list)
+
+        try:
+            col_res, na_count = self._infer_segments(
+                segments, i, name, na_filter, na_hashset, na_flist)
+        finally:
+            if na_filter:
+                self._free_na_set(na_hashset)
+
+        if isinstance(col_res, Categorical):
+            return col_res
+
+        if upcast_na and na_count > 0:
+            col_res = _maybe_upcast(col_res)
+
+        if issubclass(col_res.dtype.type, np.integer) and self.compact_ints:
+            col_res = downcast_int64(col_res, self.use_unsigned)
+
+        return col_res
+
+    cdef _infer_segments(self, list segments, Py_ssize_t i, object name,
+                         bint na_filter, kh_str_t *na_hashset,
+                         object na_flist):
+        # the dtype inference of _convert_tokens over the rows of all the
+        # segments
+        cdef:
+            parser_t *parser
+            int k, start, end
+
+        if i in self.noconvert:
+            if i in self.date_columns:
+                parts = []
+                for k, start, end in segments:
+                    parser = self._segment_parser(k)
+                    col_res = _try_datetime(parser, i, start, end, na_filter,
+                                            na_hashset, self.c_date_format)
+                    if col_res is None:
+                        break
+                    parts.append(col_res)
+                else:
+                    return np.concatenate(parts), 0
+
+            parts = []
+            na_count = 0
+            for k, start, end in segments:
+                parser = self._segment_parser(k)
+                col_res, count = self._string_convert(
+                    parser, i, start, end, na_filter, na_hashset)
+                parts.append(col_res)
+                na_count += count
+            return np.concatenate(parts), na_count
+
+        category = _is_category(self._get_column_dtype(i, name))
+
+        hint = self._get_dtype_hint(i, name)
+        candidates = list(dtype_cast_order)
+        if hint is not None and not (category and hint == '|O8'):
+            candidates.insert(0, hint)
+
+        for dt in candidates:
+            if category and dt == '|O8':
+                return self._categorical_segments(segments, i, na_filter,
+                                                  na_hashset)
+            parts = []
+            na_count = 0
+            try:
+                for k, start, end in segments:
+                    parser = self._segment_parser(k)
+                    col_res, count = self._convert_with_dtype(
+                        parser, dt, i, start, end, na_filter, 0, na_hashset,
+                        na_flist)
+                    if col_res is None:
+                        break
+                    parts.append(col_res)
+                    na_count += count
+            except OverflowError:
+                if hint is not None and dt is hint:
+                    continue
+                if category:
+                    return self._categorical_segments(segments, i, na_filter,
+                                                      na_hashset)
+                dt = '|O8'
+                parts = []
+                na_count = 0
+                for k, start, end in segments:
+                    parser = self._segment_parser(k)
+                    col_res, count = self._convert_with_dtype(
+                        parser, dt, i, start, end, na_filter, 0, na_hashset,
+                        na_flist)
+                    parts.append(col_res)
+                    na_count += count
+
+            if len(parts) == len(segments):
+                return np.concatenate(parts), na_count
+
+        raise Exception('Unable to parse column %d' % i)
+
+    cdef _categorical_segments(self, list segments, Py_ssize_t i,
+                               bint na_filter, kh_str_t *na_hashset):
+        cdef:
+            parser_t *parser
+            int k, start, end
+
+        parts = []
+        na_count = 0
+        for k, start, end in segments:
+            parser = self._segment_parser(k)
+            col_res, count = self._categorical_convert(parser, i, start, end,
+                                                       na_filter, na_hashset)
+            parts.append(col_res)
+            na_count += count
+        return _concatenate_categoricals(parts), na_count
+
+    cdef _flush_warnings(self, parser_t *parser):
+        if parser.warn_msg != NULL:
+            print >> sys.stderr, parser.warn_msg
+            free(parser.warn_msg)
+            parser.warn_msg = NULL
+
     cdef _tokenize_rows(self, size_t nrows):
         cdef int status
         status = tokenize_nrows(self.parser, nrows)
@@ -839,13 +1453,14 @@ cdef class TextReader:
     def remove_noconvert(self, i):
         self.noconvert.remove(i)
 
+    def set_date_column(self, i):
+        # converted to datetime64[ns] straight from the tokens, if every
+        # value parses, and to strings as for set_noconvert otherwise
+        self.noconvert.add(i)
+        self.date_columns.add(i)
+
     def _convert_column_data(self, rows=None, upcast_na=False, footer=0):
-        cdef:
-            Py_ssize_t i, nused, ncols
-            kh_str_t *na_hashset = NULL
-            int start, end
-            object name, na_flist
-            bint na_filter = 0
+        cdef int start, end
 
         start = self.parser_start
 
@@ -858,8 +1473,18 @@ cdef class TextReader:
         # if footer > 0:
         #     end -= footer
 
-        results = {}
-        nused = 0
+        results = self._convert_lines(self.parser, start, end, upcast_na)
+
+        self.parser_start += end - start
+
+        return results
+
+    cdef list _used_columns(self):
+        # (index, name) of the columns of the result
+        cdef:
+            Py_ssize_t i, nused = 0
+            list columns = []
+
         for i in range(self.table_width):
             if i < self.leading_cols:
                 # Pass through leading columns always
@@ -870,7 +1495,19 @@ cdef class TextReader:
                                              name in self.usecols):
                     continue
                 nused += 1
+            columns.append((i, name))
+        return columns
 
+    cdef _convert_lines(self, parser_t *parser, int start, int end,
+                        bint upcast_na):
+        cdef:
+            Py_ssize_t i
+            kh_str_t *na_hashset = NULL
+            object name, na_flist
+            bint na_filter = 0
+
+        results = {}
+        for i, name in self._used_columns():
             conv = self._get_converter(i, name)
 
             # XXX
@@ -886,50 +1523,48 @@ cdef class TextReader:
                 na_filter = 0
 
             if conv:
-                results[i] = _apply_converter(conv, self.parser, i, start, end,
+                results[i] = _apply_converter(conv, parser, i, start, end,
                                               self.c_encoding)
                 continue
 
             # Should return as the desired dtype (inferred or specified)
-            col_res, na_count = self._convert_tokens(i, start, end, name,
+            col_res, na_count = self._convert_tokens(parser, i, start, end, name,
                                                      na_filter, na_hashset, na_flist)
 
             if na_filter:
                 self._free_na_set(na_hashset)
 
+            if col_res is None:
+                raise Exception('Unable to parse column %d' % i)
+
+            if isinstance(col_res, Categorical):
+                # missing values are already coded as -1
+                results[i] = col_res
+                continue
+
             if upcast_na and na_count > 0:
                 col_res = _maybe_upcast(col_res)
 
             if issubclass(col_res.dtype.type, np.integer) and self.compact_ints:
                 col_res = downcast_int64(col_res, self.use_unsigned)
 
-            if col_res is None:
-                raise Exception('Unable to parse column %d' % i)
-
             results[i] = col_res
 
-        self.parser_start += end - start
-
         return results
 
-    cdef inline _convert_tokens(self, Py_ssize_t i, int start, int end,
+    cdef inline _convert_tokens(self, parser_t *parser, Py_ssize_t i, int start, int end,
                                 object name, bint na_filter,
                                 kh_str_t *na_hashset,
                                 object na_flist):
         cdef:
-            object col_dtype = None
-
-        if self.dtype is not None:
-            if isinstance(self.dtype, dict):
-                if name in self.dtype:
-                    col_dtype = self.dtype[name]
-                elif i in self.dtype:
-                    col_dtype = self.dtype[i]
-            else:
-                if self.dtype.names:
-                    col_dtype = self.dtype.descr[i][1]
-                else:
-                    col_dtype = self.dtype
+            object col_dtype = self._get_column_dtype(i, name)
+            bint category = 0
+
+        if col_dtype is not None:
+            if _is_category(col_dtype):
+                # only the columns inferred as strings are dictionary-encoded
+                category = 1
+                col_dtype = None
 
             if col_dtype is not None:
                 if not isinstance(col_dtype, basestring):
@@ -938,27 +1573,68 @@ cdef class TextReader:
                     else:
                         col_dtype = np.dtype(col_dtype).str
 
-                return self._convert_with_dtype(col_dtype, i, start, end,
+                return self._convert_with_dtype(parser, col_dtype, i, start, end,
                                                 na_filter, 1, na_hashset, na_flist)
 
         if i in self.noconvert:
-            return self._string_convert(i, start, end, na_filter, na_hashset)
+            if i in self.date_columns:
+                col_res = _try_datetime(parser, i, start, end, na_filter,
+                                        na_hashset, self.c_date_format)
+                if col_res is not None:
+                    return col_res, 0
+            return self._string_convert(parser, i, start, end, na_filter, na_hashset)
         else:
             col_res = None
+
+            hint = self._get_dtype_hint(i, name)
+            if hint is not None and not (category and hint == '|O8'):
+                try:
+                    col_res, na_count = self._convert_with_dtype(
+                        parser, hint, i, start, end, na_filter, 0, na_hashset,
+                        na_flist)
+                except OverflowError:
+                    col_res = None
+
+                if col_res is not None:
+                    return col_res, na_count
+
             for dt in dtype_cast_order:
+                if category and dt == '|O8':
+                    return self._categorical_convert(parser, i, start, end,
+                                                     na_filter, na_hashset)
                 try:
                     col_res, na_count = self._convert_with_dtype(
-                        dt, i, start, end, na_filter, 0, na_hashset, na_flist)
+                        parser, dt, i, start, end, na_filter, 0, na_hashset, na_flist)
                 except OverflowError:
+                    if category:
+                        return self._categorical_convert(
+                            parser, i, start, end, na_filter, na_hashset)
                     col_res, na_count = self._convert_with_dtype(
-                        '|O8', i, start, end, na_filter, 0, na_hashset, na_flist)
+                        parser, '|O8', i, start, end, na_filter, 0, na_hashset, na_flist)
 
                 if col_res is not None:
                     break
 
         return col_res, na_count
 
-    cdef _convert_with_dtype(self, object dtype, Py_ssize_t i,
+    cdef _get_column_dtype(self, Py_ssize_t i, object name):
+        # the dtype given for the column, if any
+        if self.dtype is None:
+            return None
+        elif isinstance(self.dtype, dict):
+            if name in self.dtype:
+                return self.dtype[name]
+            elif i in self.dtype:
+                return self.dtype[i]
+            return None
+        elif isinstance(self.dtype, basestring):
+            return self.dtype
+        elif self.dtype.names:
+            return self.dtype.descr[i][1]
+        else:
+            return self.dtype
+
+    cdef _convert_with_dtype(self, parser_t *parser, object dtype, Py_ssize_t i,
                              int start, int end,
                              bint na_filter,
                              bint user_dtype,
@@ -967,7 +1643,7 @@ cdef class TextReader:
         cdef kh_str_t *true_set, *false_set
 
         if dtype[1] == 'i' or dtype[1] == 'u':
-            result, na_count = _try_int64(self.parser, i, start, end,
+            result, na_count = _try_int64(parser, i, start, end,
                                           na_filter, na_hashset)
             if user_dtype and na_count > 0:
                 raise Exception('Integer column has NA values')
@@ -978,7 +1654,7 @@ cdef class TextReader:
             return result, na_count
 
         elif dtype[1] == 'f':
-            result, na_count = _try_double(self.parser, i, start, end,
+            result, na_count = _try_double(parser, i, start, end,
                                            na_filter, na_hashset, na_flist)
 
             if dtype[1:] != 'f8':
@@ -990,13 +1666,13 @@ cdef class TextReader:
 
                 true_set = kset_from_list(self.true_values + _true_values)
                 false_set = kset_from_list(self.false_values + _false_values)
-                result, na_count = _try_bool_flex(self.parser, i, start, end,
+                result, na_count = _try_bool_flex(parser, i, start, end,
                                                   na_filter, na_hashset,
                                                   true_set, false_set)
                 kh_destroy_str(true_set)
                 kh_destroy_str(false_set)
             else:
-                result, na_count = _try_bool(self.parser, i, start, end,
+                result, na_count = _try_bool(parser, i, start, end,
                                              na_filter, na_hashset)
             return result, na_count
         elif dtype[1] == 'c':
@@ -1006,11 +1682,11 @@ cdef class TextReader:
             # TODO: na handling
             width = int(dtype[2:])
             if width > 0:
-                result = _to_fw_string(self.parser, i, start, end, width)
+                result = _to_fw_string(parser, i, start, end, width)
                 return result, 0
 
             # treat as a regular string parsing
-            return self._string_convert(i, start, end, na_filter,
+            return self._string_convert(parser, i, start, end, na_filter,
                                        na_hashset)
         elif dtype[1] == 'U':
             width = int(dtype[2:])
@@ -1018,12 +1694,12 @@ cdef class TextReader:
                 raise NotImplementedError("the dtype %s is not supported for parsing" % dtype)
 
             # unicode variable width
-            return self._string_convert(i, start, end, na_filter,
+            return self._string_convert(parser, i, start, end, na_filter,
                                         na_hashset)
 
 
         elif dtype[1] == 'O':
-            return self._string_convert(i, start, end, na_filter,
+            return self._string_convert(parser, i, start, end, na_filter,
                                         na_hashset)
         else:
             if dtype[1] == 'M':
@@ -1031,33 +1707,59 @@ cdef class TextReader:
                                  "pass this column using parse_dates instead" % dtype)
             raise TypeError("the dtype %s is not supported for parsing" % dtype)
 
-    cdef _string_convert(self, Py_ssize_t i, int start, int end,
+    cdef _string_convert(self, parser_t *parser, Py_ssize_t i, int start, int end,
                          bint na_filter, kh_str_t *na_hashset):
         if PY3:
             if self.c_encoding != NULL:
                 if self.c_encoding == b"utf-8":
-                    return _string_box_utf8(self.parser, i, start, end,
+                    return _string_box_utf8(parser, i, start, end,
                                             na_filter, na_hashset)
                 else:
-                    return _string_box_decode(self.parser, i, start, end,
+                    return _string_box_decode(parser, i, start, end,
                                               na_filter, na_hashset,
                                               self.c_encoding)
             else:
-                return _string_box_utf8(self.parser, i, start, end,
+                return _string_box_utf8(parser, i, start, end,
                                         na_filter, na_hashset)
         else:
             if self.c_encoding != NULL:
                 if self.c_encoding == b"utf-8":
-                    return _string_box_utf8(self.parser, i, start, end,
+                    return _string_box_utf8(parser, i, start, end,
                                             na_filter, na_hashset)
                 else:
-                    return _string_box_decode(self.parser, i, start, end,
+                    return _string_box_decode(parser, i, start, end,
                                               na_filter, na_hashset,
                                               self.c_encoding)
             else:
-                return _string_box_factorize(self.parser, i, start, end,
+                return _string_box_factorize(parser, i, start, end,
                                              na_filter, na_hashset)
 
+    cdef _categorical_convert(self, parser_t *parser, Py_ssize_t i,
+                              int start, int end,
+                              bint na_filter, kh_str_t *na_hashset):
+        # levels are boxed the same way as _string_convert boxes values
+        cdef int boxing = BOX_BYTES
+
+        if self.c_encoding != NULL:
+            if self.c_encoding == b"utf-8":
+                boxing = BOX_UTF8
+            else:
+                boxing = BOX_DECODE
+        elif PY3:
+            boxing = BOX_UTF8
+
+        return _string_categorical(parser, i, start, end, na_filter,
+                                   na_hashset, boxing, self.c_encoding)
+
+    cdef _get_dtype_hint(self, i, name):
+        if not self.dtype_hints:
+            return None
+
+        if name is not None and name in self.dtype_hints:
+            return self.dtype_hints[name]
+
+        return self.dtype_hints.get(i)
+
     def _get_converter(self, i, name):
         if self.converters is None:
             return None
@@ -1345,6 +2047,101 @@ cdef _string_box_decode(parser_t *parser, int col,
     return result, na_count
 
 
+cdef inline bint _is_category(object dtype):
+    return isinstance(dtype, basestring) and dtype == 'category'
+
+cdef enum:
+    BOX_BYTES
+    BOX_UTF8
+    BOX_DECODE
+
+cdef _string_categorical(parser_t *parser, int col,
+                         int line_start, int line_end,
+                         bint na_filter, kh_str_t *na_hashset,
+                         int boxing, char *encoding):
+    """
+    Dictionary-encode a string column: each distinct word is boxed once as a
+    level and the rows are stored as int32 codes into the levels, -1 for NA.
+    Levels are in order of first appearance.
+    """
+    cdef:
+        int na_count = 0
+        Py_ssize_t i, size
+        size_t lines
+        coliter_t it
+        char *word
+        ndarray[int32_t] labels
+
+        int ret = 0
+        kh_str_t *table
+        list levels = []
+
+        char *errors = "strict"
+        khiter_t k
+
+    table = kh_init_str()
+    lines = line_end - line_start
+    labels = np.empty(lines, dtype=np.int32)
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                na_count += 1
+                labels[i] = -1
+                continue
+
+        k = kh_get_str(table, word)
+
+        if k == table.n_buckets:
+            # new level, the only place a Python object is created
+            if boxing == BOX_UTF8:
+                levels.append(PyUnicode_FromString(word))
+            elif boxing == BOX_DECODE:
+                size = strlen(word)
+                levels.append(PyUnicode_Decode(word, size, encoding, errors))
+            else:
+                levels.append(PyBytes_FromString(word))
+
+            k = kh_put_str(table, word, &ret)
+            table.vals[k] = len(levels) - 1
+
+        labels[i] = table.vals[k]
+
+    kh_destroy_str(table)
+
+    return Categorical(labels, Index(levels, dtype=object)), na_count
+
+
+def _concatenate_categoricals(list cats):
+    """
+    Merge the levels of the per-chunk Categoricals of one column and recode
+    their labels against the merged levels.
+    """
+    cdef:
+        object levels, indexer
+        list labels = []
+
+    levels = cats[0].levels
+    for cat in cats[1:]:
+        new = levels.get_indexer(cat.levels) == -1
+        if new.any():
+            levels = Index(np.concatenate([levels.values,
+                                           cat.levels.values[new]]),
+                           dtype=object)
+
+    for cat in cats:
+        # the extra trailing -1 maps NA codes (-1) onto themselves
+        indexer = np.append(levels.get_indexer(cat.levels), -1)
+        labels.append(indexer.astype(np.int32).take(cat.labels))
+
+    return Categorical(np.concatenate(labels), levels)
+
+
 cdef _to_fw_string(parser_t *parser, int col, int line_start,
                    int line_end, size_t width):
     cdef:
@@ -1385,94 +2182,203 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.float64)
     data = <double *> result.data
+
+    if not use_na_flist:
+        with nogil:
+            error = _try_double_nogil(parser, col, line_start, line_end,
+                                      na_filter, na_hashset, NA, data,
+                                      &na_count)
+        if error != 0:
+            return None, None
+        return result, na_count
+
     coliter_setup(&it, parser, col, line_start)
 
-    if na_filter:
-        for i in range(lines):
-            word = COLITER_NEXT(it)
+    for i in range(lines):
+        word = COLITER_NEXT(it)
 
+        if na_filter:
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
                 na_count += 1
                 data[0] = NA
+                data += 1
+                continue
+
+        error = to_double(word, data, parser.sci, parser.decimal, parser.thousands)
+        if error != 1:
+            if strcasecmp(word, cinf) == 0:
+                data[0] = INF
+            elif strcasecmp(word, cneginf) == 0:
+                data[0] = NEGINF
             else:
-                error = to_double(word, data, parser.sci, parser.decimal, parser.thousands)
-                if error != 1:
-                    if strcasecmp(word, cinf) == 0:
-                        data[0] = INF
-                    elif strcasecmp(word, cneginf) == 0:
-                        data[0] = NEGINF
-                    else:
-                        return None, None
-                if use_na_flist:
-                    if data[0] in na_flist:
-                        na_count += 1
-                        data[0] = NA
-            data += 1
-    else:
-        for i in range(lines):
-            word = COLITER_NEXT(it)
-            error = to_double(word, data, parser.sci, parser.decimal, parser.thousands)
-            if error != 1:
-                if strcasecmp(word, cinf) == 0:
-                    data[0] = INF
-                elif strcasecmp(word, cneginf) == 0:
-                    data[0] = NEGINF
-                else:
-                    return None, None
-            data += 1
+                return None, None
+        if data[0] in na_flist:
+            na_count += 1
+            data[0] = NA
+        data += 1
 
     return result, na_count
 
+cdef inline int _try_double_nogil(parser_t *parser, int col, int line_start,
+                                  int line_end, bint na_filter,
+                                  kh_str_t *na_hashset, double NA,
+                                  double *data, int *na_count) nogil:
+    # returns nonzero if a token does not parse as a float
+    cdef:
+        int error
+        size_t i, lines
+        coliter_t it
+        char *word
+        khiter_t k
+
+    lines = line_end - line_start
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                na_count[0] += 1
+                data[0] = NA
+                data += 1
+                continue
+
+        error = to_double(word, data, parser.sci, parser.decimal, parser.thousands)
+        if error != 1:
+            if strcasecmp(word, cinf) == 0:
+                data[0] = INF
+            elif strcasecmp(word, cneginf) == 0:
+                data[0] = NEGINF
+            else:
+                return 1
+        data += 1
+
+    return 0
+
 
 cdef _try_int64(parser_t *parser, int col, int line_start, int line_end,
                 bint na_filter, kh_str_t *na_hashset):
     cdef:
         int error, na_count = 0
-        size_t i, lines
+        size_t lines
         coliter_t it
-        char *word
+        char *word = NULL
         int64_t *data
         ndarray result
 
         int64_t NA = na_values[np.int64]
-        khiter_t k
 
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.int64)
     data = <int64_t *> result.data
+
+    with nogil:
+        error = _try_int64_nogil(parser, col, line_start, line_end,
+                                 na_filter, na_hashset, NA, data,
+                                 &na_count, &word)
+    if error != 0:
+        if error == ERROR_OVERFLOW:
+            raise OverflowError(word)
+        return None, None
+
+    return result, na_count
+
+cdef inline int _try_int64_nogil(parser_t *parser, int col, int line_start,
+                                 int line_end, bint na_filter,
+                                 kh_str_t *na_hashset, int64_t NA,
+                                 int64_t *data, int *na_count,
+                                 char **bad_word) nogil:
+    # returns the str_to_int64 error code of the first bad token, which is
+    # stored in bad_word
+    cdef:
+        int error
+        size_t i, lines
+        coliter_t it
+        char *word
+        khiter_t k
+
+    lines = line_end - line_start
     coliter_setup(&it, parser, col, line_start)
 
-    if na_filter:
-        for i in range(lines):
-            word = COLITER_NEXT(it)
+    for i in range(lines):
+        word = COLITER_NEXT(it)
 
+        if na_filter:
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
-                na_count += 1
+                na_count[0] += 1
                 data[i] = NA
                 continue
 
-            data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
-                                   &error, parser.thousands)
-            if error != 0:
-                if error == ERROR_OVERFLOW:
-                    raise OverflowError(word)
+        data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
+                               &error, parser.thousands)
+        if error != 0:
+            bad_word[0] = word
+            return error
 
-                return None, None
-    else:
-        for i in range(lines):
-            word = COLITER_NEXT(it)
-            data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
-                                   &error, parser.thousands)
+    return 0
+
+
+cdef _try_datetime(parser_t *parser, int col, int line_start, int line_end,
+                   bint na_filter, kh_str_t *na_hashset, char *date_format):
+    # parses ISO 8601 (or date_format) datetimes from the tokens to
+    # datetime64[ns], or returns None if any value does not parse
+    cdef:
+        int error
+        size_t i, lines
+        coliter_t it
+        char *word
+        int64_t *data
+        ndarray result
+        khiter_t k
+        pandas_datetimestruct dts
+
+    lines = line_end - line_start
+    result = np.empty(lines, dtype=_NS_DTYPE)
+    data = <int64_t *> result.data
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                data[i] = INT64_MIN
+                continue
+
+        if word[0] == 0 or _is_nat_string(word):
+            data[i] = INT64_MIN
+            continue
+
+        if date_format != NULL:
+            error = parse_fixed_format_datetime(word, strlen(word),
+                                                date_format, &dts)
+        else:
+            error = _cstring_to_dts(word, strlen(word), &dts)
             if error != 0:
-                if error == ERROR_OVERFLOW:
-                    raise OverflowError(word)
-                return None, None
+                PyErr_Clear()
 
-    return result, na_count
+        # dates near the bounds of datetime64[ns] are left to tslib
+        if error != 0 or dts.year < 1678 or dts.year > 2261:
+            return None
+
+        data[i] = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
+
+    return result
+
+cdef inline bint _is_nat_string(char *word):
+    # the strings tslib takes as NaT
+    return (strcmp(word, b'NaT') == 0 or strcmp(word, b'nat') == 0 or
+            strcmp(word, b'NAT') == 0 or strcmp(word, b'nan') == 0 or
+            strcmp(word, b'NaN') == 0 or strcmp(word, b'NAN') == 0)
 
 
 cdef _try_bool(parser_t *parser, int col, int line_start, int line_end,
@@ -1647,6 +2553,15 @@ cdef kh_str_t* kset_from_list(list values) except NULL:
 # TODO: endianness just a placeholder?
 cdef list dtype_cast_order = ['<i8', '<f8', '|b1', '|O8']
 
+_hint_kinds = {'i': '<i8', 'u': '<i8', 'f': '<f8', 'b': '|b1', 'O': '|O8'}
+
+def _hint_cast_dtype(dtype):
+    """
+    The dtype of dtype_cast_order a column of ``dtype`` was inferred as, or
+    None for the dtypes not found by inference (dates)
+    """
+    return _hint_kinds.get(np.dtype(dtype).kind)
+
 
 cdef raise_parser_error(object base, parser_t *parser):
     message = '%s. C error: ' % base
@@ -1739,9 +2654,29 @@ def _concatenate_chunks(list chunks):
     result = {}
     for name in names:
         arrs = [chunk.pop(name) for chunk in chunks]
+        categorical = [isinstance(a, Categorical) for a in arrs]
+        if all(categorical):
+            result[name] = _concatenate_categoricals(arrs)
+            continue
+        elif any(categorical):
+            # strings in some chunks only, mixed with the values of the
+            # others like any column inferred differently between chunks
+            arrs = [np.asarray(a) if is_cat else a
+                    for a, is_cat in zip(arrs, categorical)]
+        dtypes = set(a.dtype for a in arrs)
+        if len(dtypes) > 1 and _NS_DTYPE in dtypes:
+            # dates that parsed in some chunks but not in others are boxed
+            # for the date converter to take up with the strings
+            arrs = [_box_datetime64(a) if a.dtype == _NS_DTYPE else a
+                    for a in arrs]
         result[name] = np.concatenate(arrs)
     return result
 
+def _box_datetime64(ndarray arr):
+    from pandas.tslib import Timestamp, NaT
+    return lib.map_infer(arr.view('i8'),
+                         lambda x: NaT if x == INT64_MIN else Timestamp(x))
+
 #----------------------------------------------------------------------
 
 # NA values
@@ -1834,6 +2769,9 @@ def _to_structured_array(dict columns, object names):
         int stride, elsize
         char *buf
 
+    columns = dict((i, np.asarray(col)) if isinstance(col, Categorical)
+                   else (i, col) for i, col in columns.items())
+
     if names is None:
         names = ['%d' % i for i in range(len(columns))]
     else:
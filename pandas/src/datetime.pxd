@@ -114,6 +114,9 @@ cdef extern from "datetime/np_datetime_strings.h":
 
     int get_datetime_iso_8601_strlen(int local, PANDAS_DATETIMEUNIT base)
 
+    int parse_fixed_format_datetime(char *str, int len, char *format,
+                                    pandas_datetimestruct *out) nogil
+
     # int parse_python_string(object obj, pandas_datetimestruct *out) except -1
 
 
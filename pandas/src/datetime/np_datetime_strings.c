@@ -13,6 +13,7 @@
 #include <Python.h>
 
 #include <time.h>
+#include <ctype.h>
 
 #include <numpy/arrayobject.h>
 #include "numpy/arrayscalars.h"
@@ -912,6 +913,178 @@ error:
     return -1;
 }
 
+/*
+ * Matches one of the alternatives of a strptime numeric field, in the order
+ * the regular expressions of the time module try them. Each alternative is
+ * a pair of characters: the range of the first digit, and the range of the
+ * second one (' ' for a single digit field).
+ */
+static int
+parse_fixed_field(char **pstr, char *end, const char *alternatives,
+                  int *out)
+{
+    char *str = *pstr;
+    const char *alt;
+
+    for (alt = alternatives; *alt != '\0'; alt += 4) {
+        if (str < end && str[0] >= alt[0] && str[0] <= alt[1]) {
+            if (alt[2] == ' ') {
+                *out = str[0] - '0';
+                *pstr = str + 1;
+                return 0;
+            }
+            if (str + 1 < end && str[1] >= alt[2] && str[1] <= alt[3]) {
+                *out = 10 * (str[0] - '0') + (str[1] - '0');
+                *pstr = str + 2;
+                return 0;
+            }
+        }
+    }
+    return -1;
+}
+
+/*
+ * Parses a datetime string with a strptime format made of the directives
+ * %Y, %m, %d, %H, %M, %S, %f and %%, whitespace (matching one or more
+ * whitespace characters) and literal characters.
+ *
+ * Unlike parse_iso_8601_datetime, no Python exception is set, so it can
+ * be called without the GIL.
+ *
+ * Returns 0 on success, -1 if the string does not match the format, the
+ * format has another directive, or the date is not valid.
+ */
+int
+parse_fixed_format_datetime(char *str, int len, char *format,
+                            pandas_datetimestruct *out)
+{
+    char *end = str + len;
+    int value, i;
+
+    memset(out, 0, sizeof(pandas_datetimestruct));
+    out->year = 1900;
+    out->month = 1;
+    out->day = 1;
+
+    while (*format != '\0') {
+        if (*format == '%') {
+            format++;
+            switch (*format) {
+                case 'Y':
+                    if (end - str < 4) {
+                        return -1;
+                    }
+                    out->year = 0;
+                    for (i = 0; i < 4; ++i) {
+                        if (str[i] < '0' || str[i] > '9') {
+                            return -1;
+                        }
+                        out->year = 10 * out->year + (str[i] - '0');
+                    }
+                    str += 4;
+                    break;
+                case 'm':
+                    if (parse_fixed_field(&str, end, "1102" "0019" "19  ",
+                                          &value) < 0) {
+                        return -1;
+                    }
+                    out->month = value;
+                    break;
+                case 'd':
+                    if (str < end && str[0] == ' ') {
+                        /* strptime also takes a space padded day */
+                        str++;
+                        if (parse_fixed_field(&str, end, "19  ",
+                                              &value) < 0) {
+                            return -1;
+                        }
+                    }
+                    else if (parse_fixed_field(&str, end,
+                                               "3301" "1209" "0019" "19  ",
+                                               &value) < 0) {
+                        return -1;
+                    }
+                    out->day = value;
+                    break;
+                case 'H':
+                    if (parse_fixed_field(&str, end, "2203" "0109" "09  ",
+                                          &value) < 0) {
+                        return -1;
+                    }
+                    out->hour = value;
+                    break;
+                case 'M':
+                    if (parse_fixed_field(&str, end, "0509" "09  ",
+                                          &value) < 0) {
+                        return -1;
+                    }
+                    out->min = value;
+                    break;
+                case 'S':
+                    /* leap seconds are left to the slow path */
+                    if (parse_fixed_field(&str, end, "6601" "0509" "09  ",
+                                          &value) < 0 || value > 59) {
+                        return -1;
+                    }
+                    out->sec = value;
+                    break;
+                case 'f':
+                    /* up to 6 digits of microseconds */
+                    if (str >= end || str[0] < '0' || str[0] > '9') {
+                        return -1;
+                    }
+                    value = 0;
+                    for (i = 0; i < 6; ++i) {
+                        value *= 10;
+                        if (str < end && str[0] >= '0' && str[0] <= '9') {
+                            value += str[0] - '0';
+                            str++;
+                        }
+                    }
+                    out->us = value;
+                    break;
+                case '%':
+                    if (str >= end || *str != '%') {
+                        return -1;
+                    }
+                    str++;
+                    break;
+                default:
+                    return -1;
+            }
+            format++;
+        }
+        else if (isspace(*format)) {
+            if (str >= end || !isspace(*str)) {
+                return -1;
+            }
+            while (str < end && isspace(*str)) {
+                str++;
+            }
+            while (isspace(*format)) {
+                format++;
+            }
+        }
+        else {
+            if (str >= end || *str != *format) {
+                return -1;
+            }
+            str++;
+            format++;
+        }
+    }
+
+    if (str != end) {
+        return -1;
+    }
+
+    if (out->day > days_per_month_table[is_leapyear(out->year)][out->month - 1]) {
+        return -1;
+    }
+
+    return 0;
+}
+
 /*
  * Provides a string length to use for converting datetime
  * objects with the given local and unit settings.
@@ -49,6 +49,17 @@ parse_iso_8601_datetime(char *str, int len,
                     PANDAS_DATETIMEUNIT *out_bestunit,
                     npy_bool *out_special);
 
+/*
+ * Parses a datetime string with a strptime format made of the directives
+ * %Y, %m, %d, %H, %M, %S, %f and %%, whitespace and literal characters.
+ * Sets no Python exception, so it can be called without the GIL.
+ *
+ * Returns 0 on success, -1 on failure.
+ */
+int
+parse_fixed_format_datetime(char *str, int len, char *format,
+                            pandas_datetimestruct *out);
+
 /*
  * Provides a string length to use for converting datetime
  * objects with the given local and unit settings.
@@ -279,3 +279,243 @@ void* buffer_mmap_bytes(void *source, size_t nbytes,
 }
 
 #endif
+
+
+/*
+
+  gzip compressed file, decompressed with zlib
+
+ */
+
+#ifdef HAVE_ZLIB
+
+void *new_gzip_source(char *fname, size_t buffer_size) {
+    gzip_source *gs = (gzip_source *) malloc(sizeof(gzip_source));
+
+    if (gs == NULL) {
+        return NULL;
+    }
+
+    gs->fp = gzopen(fname, "rb");
+    if (gs->fp == NULL) {
+        free(gs);
+        return NULL;
+    }
+
+#if ZLIB_VERNUM >= 0x1240
+    gzbuffer(gs->fp, DECOMPRESS_BUFFER_SIZE);
+#endif
+
+    /* zlib reads files without a gzip header as they are; leave those to
+       the Python reader, which rejects them */
+    if (gzdirect(gs->fp)) {
+        gzclose(gs->fp);
+        free(gs);
+        return NULL;
+    }
+
+    gs->buffer = (char*) malloc((buffer_size + 1) * sizeof(char));
+    if (gs->buffer == NULL) {
+        gzclose(gs->fp);
+        free(gs);
+        return NULL;
+    }
+    gs->buffer[buffer_size] = '\0';
+
+    return (void *) gs;
+}
+
+int del_gzip_source(void *gs) {
+    if (gs == NULL)
+        return 0;
+
+    free(GZS(gs)->buffer);
+    gzclose(GZS(gs)->fp);
+    free(gs);
+
+    return 0;
+}
+
+void* buffer_gzip_bytes(void *source, size_t nbytes,
+                        size_t *bytes_read, int *status) {
+    gzip_source *src = GZS(source);
+    int n, errnum = Z_OK;
+
+    /* concatenated gzip members are read through by gzread */
+    n = gzread(src->fp, (void*) src->buffer, (unsigned) nbytes);
+
+    /* a truncated file reads as a short one, with the error kept aside */
+    if (n == 0)
+        gzerror(src->fp, &errnum);
+
+    if (n < 0 || (errnum != Z_OK && errnum != Z_STREAM_END)) {
+        *bytes_read = 0;
+        *status = DECOMPRESSION_FAILED;
+        return NULL;
+    }
+
+    *bytes_read = (size_t) n;
+    *status = (n == 0) ? REACHED_EOF : 0;
+
+    return (void*) src->buffer;
+}
+
+#else
+
+void *new_gzip_source(char *fname, size_t buffer_size) {
+    return NULL;
+}
+
+int del_gzip_source(void *src) {
+    return 0;
+}
+
+void* buffer_gzip_bytes(void *source, size_t nbytes,
+                        size_t *bytes_read, int *status) {
+    return NULL;
+}
+
+#endif
+
+
+/*
+
+  bzip2 compressed file, decompressed with libbzip2
+
+ */
+
+#ifdef HAVE_BZLIB
+
+void *new_bz2_source(char *fname, size_t buffer_size) {
+    int bzerror;
+    bz2_source *bs = (bz2_source *) malloc(sizeof(bz2_source));
+
+    if (bs == NULL) {
+        return NULL;
+    }
+
+    bs->fp = fopen(fname, "rb");
+    if (bs->fp == NULL) {
+        free(bs);
+        return NULL;
+    }
+    /* libbzip2 freads small blocks, let stdio fetch large ones */
+    setvbuf(bs->fp, NULL, _IOFBF, DECOMPRESS_BUFFER_SIZE);
+
+    bs->bzf = BZ2_bzReadOpen(&bzerror, bs->fp, 0, 0, NULL, 0);
+    if (bzerror != BZ_OK) {
+        BZ2_bzReadClose(&bzerror, bs->bzf);
+        fclose(bs->fp);
+        free(bs);
+        return NULL;
+    }
+
+    bs->buffer = (char*) malloc((buffer_size + 1) * sizeof(char));
+    if (bs->buffer == NULL) {
+        BZ2_bzReadClose(&bzerror, bs->bzf);
+        fclose(bs->fp);
+        free(bs);
+        return NULL;
+    }
+    bs->buffer[buffer_size] = '\0';
+    bs->eof = 0;
+
+    return (void *) bs;
+}
+
+int del_bz2_source(void *bs) {
+    int bzerror;
+
+    if (bs == NULL)
+        return 0;
+
+    if (BZS(bs)->bzf != NULL)
+        BZ2_bzReadClose(&bzerror, BZS(bs)->bzf);
+    free(BZS(bs)->buffer);
+    fclose(BZS(bs)->fp);
+    free(bs);
+
+    return 0;
+}
+
+/* Start reading the stream following the one just finished, if any. */
+static int next_bz2_stream(bz2_source *src) {
+    int bzerror, nunused, c;
+    void *unused;
+
+    BZ2_bzReadGetUnused(&bzerror, src->bzf, &unused, &nunused);
+    if (bzerror != BZ_OK)
+        return -1;
+    memcpy(src->unused, unused, nunused);
+
+    BZ2_bzReadClose(&bzerror, src->bzf);
+    src->bzf = NULL;
+
+    if (nunused == 0) {
+        c = fgetc(src->fp);
+        if (c == EOF) {
+            src->eof = 1;
+            return 0;
+        }
+        ungetc(c, src->fp);
+    }
+
+    src->bzf = BZ2_bzReadOpen(&bzerror, src->fp, 0, 0,
+                              src->unused, nunused);
+    if (bzerror != BZ_OK)
+        return -1;
+
+    return 0;
+}
+
+void* buffer_bz2_bytes(void *source, size_t nbytes,
+                       size_t *bytes_read, int *status) {
+    bz2_source *src = BZS(source);
+    int bzerror = BZ_OK, n;
+    size_t total = 0;
+
+    while (total < nbytes && !src->eof) {
+        n = BZ2_bzRead(&bzerror, src->bzf, src->buffer + total,
+                       (int) (nbytes - total));
+
+        if (bzerror == BZ_OK) {
+            total += n;
+        } else if (bzerror == BZ_STREAM_END) {
+            total += n;
+            if (next_bz2_stream(src) < 0) {
+                bzerror = BZ_DATA_ERROR;
+                break;
+            }
+        } else {
+            break;
+        }
+    }
+
+    if (bzerror != BZ_OK && bzerror != BZ_STREAM_END) {
+        *bytes_read = 0;
+        *status = DECOMPRESSION_FAILED;
+        return NULL;
+    }
+
+    *bytes_read = total;
+    *status = (total == 0) ? REACHED_EOF : 0;
+
+    return (void*) src->buffer;
+}
+
+#else
+
+void *new_bz2_source(char *fname, size_t buffer_size) {
+    return NULL;
+}
+
+int del_bz2_source(void *src) {
+    return 0;
+}
+
+void* buffer_bz2_bytes(void *source, size_t nbytes,
+                       size_t *bytes_read, int *status) {
+    return NULL;
+}
+
+#endif
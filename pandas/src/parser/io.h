@@ -62,6 +62,58 @@ void* buffer_mmap_bytes(void *source, size_t nbytes,
                         size_t *bytes_read, int *status);
 
 
+/*
+  Compressed files decompressed in C. HAVE_ZLIB / HAVE_BZLIB are defined by
+  setup.py where the libraries are linked; without them new_gzip_source and
+  new_bz2_source return NULL and the caller falls back to Python.
+ */
+
+/* Size of the buffers between the file and the decompressor. */
+#define DECOMPRESS_BUFFER_SIZE (1 << 20)
+
+#ifdef HAVE_ZLIB
+#include <zlib.h>
+
+typedef struct _gzip_source {
+    gzFile fp;
+
+    /* Decompressed bytes handed to the tokenizer, reused for every read. */
+    char *buffer;
+} gzip_source;
+
+#define GZS(source) ((gzip_source *)source)
+#endif
+
+#ifdef HAVE_BZLIB
+#include <bzlib.h>
+
+typedef struct _bz2_source {
+    FILE *fp;
+    BZFILE *bzf;
+
+    /* Decompressed bytes handed to the tokenizer, reused for every read. */
+    char *buffer;
+
+    /* Input read past the end of a stream, for the next stream. */
+    char unused[BZ_MAX_UNUSED];
+
+    int eof;
+} bz2_source;
+
+#define BZS(source) ((bz2_source *)source)
+#endif
+
+void *new_gzip_source(char *fname, size_t buffer_size);
+int del_gzip_source(void *src);
+void* buffer_gzip_bytes(void *source, size_t nbytes,
+                        size_t *bytes_read, int *status);
+
+void *new_bz2_source(char *fname, size_t buffer_size);
+int del_bz2_source(void *src);
+void* buffer_bz2_bytes(void *source, size_t nbytes,
+                       size_t *bytes_read, int *status);
+
+
 typedef struct _rd_source {
     PyObject* obj;
     PyObject* buffer;
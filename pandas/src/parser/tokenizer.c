@@ -69,7 +69,12 @@ static void *safe_realloc(void *buffer, size_t size) {
 void coliter_setup(coliter_t *self, parser_t *parser, int i, int start) {
     // column i, starting at 0
     self->words = parser->words;
-    self->col = i;
+    if (parser->usecols_rank != NULL) {
+        // only the kept fields are stored
+        self->col = parser->usecols_rank[i];
+    } else {
+        self->col = i;
+    }
     self->line_start = parser->line_start + start;
 }
 
@@ -157,6 +162,17 @@ void parser_set_default_options(parser_t *self) {
 
     self->skipset = NULL;
     self->skip_footer = 0;
+
+    self->usecols_rank = NULL;
+    self->usecols_len = 0;
+
+    self->colspecs = NULL;
+    self->ncolspecs = 0;
+    self->fwf_utf8 = 0;
+    self->fwf_filler = ' ';
+    self->fwf_pos = 0;
+    self->fwf_field = 0;
+    self->fwf_push = 0;
 }
 
 int get_parser_memory_footprint(parser_t *self) {
@@ -199,6 +215,9 @@ int parser_cleanup(parser_t *self) {
     if (self->skipset != NULL)
         kh_destroy_int64((kh_int64_t*) self->skipset);
 
+    free_if_not_null(self->usecols_rank);
+    free_if_not_null(self->colspecs);
+
     return 0;
 }
 
@@ -382,10 +401,33 @@ static int push_char(parser_t *self, char c) {
     return 0;
 }
 
+static int P_INLINE field_is_kept(parser_t *self, int i) {
+    return (self->usecols_rank == NULL ||
+            (i < self->usecols_len &&
+             self->usecols_rank[i + 1] > self->usecols_rank[i]));
+}
+
+static int P_INLINE stored_fields(parser_t *self, int fields) {
+    // number of words stored for a line with this many fields
+    if (self->usecols_rank == NULL) {
+        return fields;
+    } else if (fields >= self->usecols_len) {
+        return self->usecols_rank[self->usecols_len];
+    }
+    return self->usecols_rank[fields];
+}
+
 static int P_INLINE end_field(parser_t *self) {
     // XXX cruft
     self->numeric_field = 0;
 
+    if (!field_is_kept(self, self->line_fields[self->lines])) {
+        // excluded by usecols, drop the characters of the field
+        self->stream_len = self->word_start;
+        self->line_fields[self->lines]++;
+        return 0;
+    }
+
     // null terminate token
     push_char(self, '\0');
 
@@ -453,7 +495,7 @@ static int end_line(parser_t *self) {
             self->file_lines++;
 
             // skip the tokens from this bad line
-            self->line_start[self->lines] += fields;
+            self->line_start[self->lines] += stored_fields(self, fields);
 
             // reset field count
             self->line_fields[self->lines] = 0;
@@ -469,7 +511,7 @@ static int end_line(parser_t *self) {
         self->file_lines++;
 
         // skip the tokens from this bad line
-        self->line_start[self->lines] += fields;
+        self->line_start[self->lines] += stored_fields(self, fields);
 
         // reset field count
         self->line_fields[self->lines] = 0;
@@ -524,7 +566,7 @@ static int end_line(parser_t *self) {
 
         // good line, set new start point
         self->line_start[self->lines] = (self->line_start[self->lines - 1] +
-                                         fields);
+                                         stored_fields(self, fields));
 
         TRACE(("new line start: %d\n", self->line_start[self->lines]));
 
@@ -556,6 +598,74 @@ int parser_add_skiprow(parser_t *self, int64_t row) {
     return 0;
 }
 
+int parser_set_usecols(parser_t *self, int *cols, int ncols) {
+    /*
+      Keep only the fields at the (sorted) positions in cols from now on.
+      The lines tokenized so far, and the fields of the current line, are
+      compacted to the same layout.
+    */
+    int i, j, line, fields, start, nwords;
+    int len = cols[ncols - 1] + 1;
+    int *rank = (int*) calloc(len + 1, sizeof(int));
+
+    if (rank == NULL) {
+        return PARSER_OUT_OF_MEMORY;
+    }
+
+    for (i = 0; i < ncols; ++i) {
+        rank[cols[i] + 1] = 1;
+    }
+    for (i = 0; i < len; ++i) {
+        rank[i + 1] += rank[i];
+    }
+
+    free_if_not_null(self->usecols_rank);
+    self->usecols_rank = rank;
+    self->usecols_len = len;
+
+    nwords = 0;
+    for (line = 0; line <= self->lines; ++line) {
+        start = self->line_start[line];
+        fields = self->line_fields[line];
+        self->line_start[line] = nwords;
+
+        for (j = 0; j < fields; ++j) {
+            if (field_is_kept(self, j)) {
+                self->words[nwords] = self->words[start + j];
+                self->word_starts[nwords] = self->word_starts[start + j];
+                nwords++;
+            }
+        }
+    }
+    self->words_len = nwords;
+
+    return 0;
+}
+
+int parser_set_colspecs(parser_t *self, int *colspecs, int ncolspecs,
+                        char filler, int utf8) {
+    /*
+      Slice lines into fields at the character extents in colspecs (pairs of
+      half-open [start, end) positions, sorted and not overlapping) instead
+      of splitting them at delimiters. The filler character is stripped from
+      both ends of each field.
+    */
+    int *specs = (int*) malloc(2 * ncolspecs * sizeof(int));
+
+    if (specs == NULL) {
+        return PARSER_OUT_OF_MEMORY;
+    }
+    memcpy(specs, colspecs, 2 * ncolspecs * sizeof(int));
+
+    free_if_not_null(self->colspecs);
+    self->colspecs = specs;
+    self->ncolspecs = ncolspecs;
+    self->fwf_filler = filler;
+    self->fwf_utf8 = utf8;
+
+    return 0;
+}
+
 static int parser_buffer_bytes(parser_t *self, size_t nbytes) {
     int status;
     size_t bytes_read;
@@ -572,6 +682,8 @@ static int parser_buffer_bytes(parser_t *self, size_t nbytes) {
         if (status == CALLING_READ_FAILED) {
             sprintf(self->error_msg, ("Calling read(nbytes) on source failed. "
                                       "Try engine='python'."));
+        } else if (status == DECOMPRESSION_FAILED) {
+            sprintf(self->error_msg, "Decompressing the source failed");
         } else {
             sprintf(self->error_msg, "Unknown error in IO callback");
         }
@@ -615,6 +727,14 @@ static int parser_buffer_bytes(parser_t *self, size_t nbytes) {
     stream = self->stream + self->stream_len;  \
     slen = self->stream_len;
 
+#define END_FIELD_WITH(func)                       \
+    self->stream_len = slen;                   \
+    if (func(self) < 0) {                      \
+        goto parsingerror;                     \
+    }                                          \
+    stream = self->stream + self->stream_len;  \
+    slen = self->stream_len;
+
 #define END_LINE_STATE(STATE)                                           \
     self->stream_len = slen;                                            \
     if (end_line(self) < 0) {                                           \
@@ -1363,6 +1483,133 @@ linelimit:
 }
 
 
+/*
+  Fixed-width fields
+ */
+
+static int end_fixed_width_field(parser_t *self) {
+    // there can be more fields than bytes read, e.g. past the end of a line
+    if (make_stream_space(self, 1) < 0) {
+        self->error_msg = "out of memory";
+        return -1;
+    }
+
+    // strip the filler the field ends with
+    while (self->stream_len > self->word_start &&
+           self->stream[self->stream_len - 1] == self->fwf_filler) {
+        self->stream_len--;
+    }
+    self->fwf_field++;
+    return end_field(self);
+}
+
+static int end_fixed_width_line(parser_t *self) {
+    // the fields past the end of the line are empty
+    while (self->fwf_field < self->ncolspecs) {
+        if (end_fixed_width_field(self) < 0)
+            return -1;
+    }
+    self->fwf_pos = 0;
+    self->fwf_field = 0;
+    return 0;
+}
+
+int tokenize_fixed_width(parser_t *self, size_t line_limit)
+{
+    int i, slen, start_lines, pos;
+    char c;
+    char *stream;
+    char *buf = self->data + self->datapos;
+    int *specs = self->colspecs;
+
+    start_lines = self->lines;
+
+    if (make_stream_space(self, self->datalen - self->datapos) < 0) {
+        self->error_msg = "out of memory";
+        return -1;
+    }
+
+    stream = self->stream + self->stream_len;
+    slen = self->stream_len;
+
+    for (i = self->datapos; i < self->datalen; ++i)
+    {
+        // Next character in file
+        c = *buf++;
+
+        switch(self->state) {
+
+        case EAT_CRNL:
+            self->state = START_RECORD;
+            if (c == '\n') {
+                break;
+            }
+            /* \r line terminator, c starts the next line */
+            /* fallthru */
+
+        case START_RECORD:
+        case IN_FIELD:
+            if (c == '\n' || c == '\r') {
+                if (self->state == START_RECORD && self->ncolspecs == 1) {
+                    // a blank line is no row when there is only one field
+                    self->file_lines++;
+                    self->state = (c == '\r') ? EAT_CRNL : START_RECORD;
+                } else {
+                    END_FIELD_WITH(end_fixed_width_line);
+                    END_LINE_STATE((c == '\r') ? EAT_CRNL : START_RECORD);
+                }
+                break;
+            }
+            self->state = IN_FIELD;
+
+            if (self->fwf_utf8 && (c & 0xC0) == 0x80) {
+                // continuation byte of the current character
+                if (self->fwf_push) {
+                    PUSH_CHAR(c);
+                }
+                break;
+            }
+
+            pos = self->fwf_pos++;
+            self->fwf_push = 0;
+
+            while (self->fwf_field < self->ncolspecs &&
+                   pos >= specs[2 * self->fwf_field + 1]) {
+                END_FIELD_WITH(end_fixed_width_field);
+            }
+
+            if (self->fwf_field < self->ncolspecs &&
+                pos >= specs[2 * self->fwf_field]) {
+                // strip the filler the field starts with
+                if (c != self->fwf_filler || slen > self->word_start) {
+                    PUSH_CHAR(c);
+                    self->fwf_push = 1;
+                }
+            }
+            break;
+
+        default:
+            break;
+        }
+    }
+
+    _TOKEN_CLEANUP();
+
+    return 0;
+
+parsingerror:
+    i++;
+    _TOKEN_CLEANUP();
+
+    return -1;
+
+linelimit:
+    i++;
+    _TOKEN_CLEANUP();
+
+    return 0;
+}
+
 static int parser_handle_eof(parser_t *self) {
     TRACE(("handling eof, datalen: %d, pstate: %d\n", self->datalen, self->state))
     if (self->datalen == 0 && (self->state != START_RECORD)) {
@@ -1370,7 +1617,13 @@ static int parser_handle_eof(parser_t *self) {
         // TODO: empty field at end of line
         TRACE(("handling eof\n"));
 
-        if (self->state == IN_FIELD || self->state == START_FIELD) {
+        if (self->colspecs != NULL) {
+            // a line ending in \r has been ended already
+            if (self->state != IN_FIELD)
+                return 0;
+            if (end_fixed_width_line(self) < 0)
+                return -1;
+        } else if (self->state == IN_FIELD || self->state == START_FIELD) {
             if (end_field(self) < 0)
                 return -1;
         } else if (self->state == QUOTE_IN_QUOTED_FIELD) {
@@ -1407,9 +1660,14 @@ int parser_consume_rows(parser_t *self, size_t nrows) {
         return 0;
 
     /* cannot guarantee that nrows + 1 has been observed */
-    word_deletions = self->line_start[nrows - 1] + self->line_fields[nrows - 1];
-    char_count = (self->word_starts[word_deletions - 1] +
-                  strlen(self->words[word_deletions - 1]) + 1);
+    word_deletions = (self->line_start[nrows - 1] +
+                      stored_fields(self, self->line_fields[nrows - 1]));
+    if (word_deletions > 0) {
+        char_count = (self->word_starts[word_deletions - 1] +
+                      strlen(self->words[word_deletions - 1]) + 1);
+    } else {
+        char_count = 0;
+    }
 
     TRACE(("Deleting %d words, %d chars\n", word_deletions, char_count));
 
@@ -1528,20 +1786,24 @@ int clear_parsed_lines(parser_t *self, size_t nlines) {
   all : tokenize all the data vs. certain number of rows
  */
 
+static parser_op parser_tokenizer(parser_t *self) {
+    if (self->colspecs != NULL) {
+        return tokenize_fixed_width;
+    } else if (self->delim_whitespace) {
+        return tokenize_whitespace;
+    } else if (self->lineterminator == '\0') {
+        return tokenize_delimited;
+    } else {
+        return tokenize_delim_customterm;
+    }
+}
+
 int _tokenize_helper(parser_t *self, size_t nrows, int all) {
-    parser_op tokenize_bytes;
+    parser_op tokenize_bytes = parser_tokenizer(self);
 
     int status = 0;
     int start_lines = self->lines;
 
-    if (self->delim_whitespace) {
-        tokenize_bytes = tokenize_whitespace;
-    } else if (self->lineterminator == '\0') {
-        tokenize_bytes = tokenize_delimited;
-    } else {
-        tokenize_bytes = tokenize_delim_customterm;
-    }
-
     if (self->state == FINISHED) {
         return 0;
     }
@@ -1594,6 +1856,246 @@ int tokenize_all_rows(parser_t *self) {
     return status;
 }
 
+
+/*
+  Find the record boundaries splitting data into (at most) nchunks chunks of
+  about equal size. The scan follows the states of tokenize_delimited without
+  storing anything, so quoted newlines and comments are accounted for; data
+  must start at a record boundary.
+
+  breaks[k] is set to the end of chunk k and records[k] to the number of
+  records (file lines) ending in it. Returns the number of chunks, the data
+  after the last break being an incomplete record.
+ */
+
+int parser_find_breaks(parser_t *self, char *data, int datalen, int nchunks,
+                       int *breaks, int *records) {
+    int i, end, k = 0, nrecords = 0;
+    int64_t target;
+    char c;
+    ParserState state = START_RECORD;
+
+    target = datalen / nchunks + 1;
+    breaks[0] = 0;
+    records[0] = 0;
+
+    for (i = 0; i < datalen; ++i)
+    {
+        c = data[i];
+        end = 0;
+
+        switch(state) {
+
+        case START_RECORD:
+            if (c == '\n') {
+                end = 1;
+                break;
+            } else if (c == '\r') {
+                state = EAT_CRNL;
+                break;
+            }
+            state = START_FIELD;
+            /* fallthru */
+
+        case START_FIELD:
+            if (c == '\n') {
+                end = 1;
+            } else if (c == '\r') {
+                state = EAT_CRNL;
+            } else if (c == self->quotechar &&
+                       self->quoting != QUOTE_NONE) {
+                state = IN_QUOTED_FIELD;
+            } else if (c == self->escapechar) {
+                state = ESCAPED_CHAR;
+            } else if (c == ' ' && self->skipinitialspace) {
+                ;
+            } else if (c == self->delimiter) {
+                ;
+            } else if (c == self->commentchar) {
+                state = EAT_COMMENT;
+            } else {
+                state = IN_FIELD;
+            }
+            break;
+
+        case ESCAPED_CHAR:
+            state = IN_FIELD;
+            break;
+
+        case IN_FIELD:
+            if (c == '\n') {
+                end = 1;
+            } else if (c == '\r') {
+                state = EAT_CRNL;
+            } else if (c == self->escapechar) {
+                state = ESCAPED_CHAR;
+            } else if (c == self->delimiter) {
+                state = START_FIELD;
+            } else if (c == self->commentchar) {
+                state = EAT_COMMENT;
+            }
+            break;
+
+        case IN_QUOTED_FIELD:
+            if (c == self->escapechar) {
+                state = ESCAPE_IN_QUOTED_FIELD;
+            } else if (c == self->quotechar &&
+                       self->quoting != QUOTE_NONE) {
+                state = self->doublequote ? QUOTE_IN_QUOTED_FIELD : IN_FIELD;
+            }
+            break;
+
+        case ESCAPE_IN_QUOTED_FIELD:
+            state = IN_QUOTED_FIELD;
+            break;
+
+        case QUOTE_IN_QUOTED_FIELD:
+            if (self->quoting != QUOTE_NONE && c == self->quotechar) {
+                state = IN_QUOTED_FIELD;
+            } else if (c == self->delimiter) {
+                state = START_FIELD;
+            } else if (c == '\n') {
+                end = 1;
+            } else if (c == '\r') {
+                state = EAT_CRNL;
+            } else {
+                state = IN_FIELD;
+            }
+            break;
+
+        case EAT_COMMENT:
+            if (c == '\n') {
+                end = 1;
+            } else if (c == '\r') {
+                state = EAT_CRNL;
+            }
+            break;
+
+        case EAT_CRNL:
+            if (c == '\n') {
+                end = 1;
+            } else if (c == self->delimiter) {
+                // \r-delimited record, followed by an empty field
+                nrecords++;
+                state = START_FIELD;
+            } else {
+                // \r-delimited record, see the character again
+                nrecords++;
+                state = START_RECORD;
+                --i;
+            }
+            break;
+
+        default:
+            break;
+        }
+
+        if (end) {
+            // only a newline leaves the tokenizer in START_RECORD with
+            // nothing pending, so chunks are split there
+            nrecords++;
+            state = START_RECORD;
+
+            breaks[k] = i + 1;
+            records[k] = nrecords;
+
+            if (k < nchunks - 1 && i + 1 >= (k + 1) * target) {
+                nrecords = 0;
+                k++;
+                breaks[k] = i + 1;
+                records[k] = 0;
+            }
+        }
+    }
+
+    // the last chunk counts if it saw the end of a record
+    if (k < nchunks && breaks[k] > (k == 0 ? 0 : breaks[k - 1])) {
+        k++;
+    }
+
+    return k;
+}
+
+
+/*
+  A parser with the options (and skip set) of self, tokenizing data on its
+  own. Its lines start with a placeholder line with prev_fields fields, so that
+  the first record is checked against the last one of the previous chunk as in
+  a single parser.
+ */
+
+parser_t *parser_new_chunk(parser_t *self, char *data, int datalen,
+                           int file_lines, int prev_fields) {
+    parser_t *chunk = parser_new();
+
+    if (chunk == NULL) {
+        return NULL;
+    }
+
+    memcpy(chunk, self, sizeof(parser_t));
+    if (parser_init(chunk) < 0) {
+        free(chunk);
+        return NULL;
+    }
+
+    // parser_init resets these
+    chunk->commentchar = self->commentchar;
+
+    chunk->source = NULL;
+    chunk->cb_io = NULL;
+    chunk->cb_cleanup = NULL;
+
+    chunk->data = data;
+    chunk->datalen = datalen;
+    chunk->datapos = 0;
+
+    // past the header rows, which the main parser has seen
+    chunk->header_end = -2;
+    chunk->file_lines = file_lines;
+
+    chunk->line_fields[0] = prev_fields;
+    chunk->lines = 1;
+    chunk->line_start[1] = 0;
+    chunk->line_fields[1] = 0;
+
+    return chunk;
+}
+
+
+/*
+  Tokenize all of self->data, which ends at a record boundary unless eof
+ */
+
+int tokenize_chunk(parser_t *self, int eof) {
+    parser_op tokenize_bytes = parser_tokenizer(self);
+    int status;
+
+    status = tokenize_bytes(self, 0);
+    if (status < 0) {
+        return -1;
+    }
+
+    if (eof) {
+        self->datapos = 0;
+        self->datalen = 0;
+        status = parser_handle_eof(self);
+        self->state = FINISHED;
+    }
+
+    return status;
+}
+
+
+void parser_free_chunk(parser_t *self) {
+    // the source and skip set belong to the main parser
+    parser_clear_data_buffers(self);
+
+    free_if_not_null(self->error_msg);
+    free_if_not_null(self->warn_msg);
+
+    free(self);
+}
+
 void test_count_lines(char *fname) {
     clock_t start = clock();
 
@@ -41,6 +41,7 @@ See LICENSE for the license
 
 #define REACHED_EOF 1
 #define CALLING_READ_FAILED 2
+#define DECOMPRESSION_FAILED 3
 
 #ifndef P_INLINE
   #if defined(__GNUC__)
@@ -201,6 +202,22 @@ typedef struct parser_t {
     void *skipset;
     int skip_footer;
 
+    // fields kept by usecols: usecols_rank[i] is the number of kept fields
+    // before field i, for i <= usecols_len. NULL keeps every field
+    int *usecols_rank;
+    int usecols_len;
+
+    // fixed-width fields: colspecs[2 * i] and colspecs[2 * i + 1] are the
+    // half-open character extents of field i, in increasing order. NULL for
+    // delimited input
+    int *colspecs;
+    int ncolspecs;
+    int fwf_utf8;      // positions count UTF-8 characters rather than bytes
+    char fwf_filler;   // stripped from both ends of a field
+    int fwf_pos;       // character position in the current line
+    int fwf_field;     // first field not yet ended in the current line
+    int fwf_push;      // whether the bytes of the current character are kept
+
     // error handling
     char *warn_msg;
     char *error_msg;
@@ -233,6 +250,11 @@ int parser_trim_buffers(parser_t *self);
 
 int parser_add_skiprow(parser_t *self, int64_t row);
 
+int parser_set_usecols(parser_t *self, int *cols, int ncols);
+
+int parser_set_colspecs(parser_t *self, int *colspecs, int ncolspecs,
+                        char filler, int utf8);
+
 void parser_free(parser_t *self);
 
 void parser_set_default_options(parser_t *self);
@@ -243,6 +265,23 @@ int tokenize_nrows(parser_t *self, size_t nrows);
 
 int tokenize_all_rows(parser_t *self);
 
+/*
+
+  Parallel tokenization: the data is split at record boundaries, found by
+  parser_find_breaks, into chunks that are tokenized independently by parsers
+  sharing the options of the main parser
+
+ */
+int parser_find_breaks(parser_t *self, char *data, int datalen, int nchunks,
+                       int *breaks, int *records);
+
+parser_t *parser_new_chunk(parser_t *self, char *data, int datalen,
+                           int file_lines, int prev_fields);
+
+int tokenize_chunk(parser_t *self, int eof);
+
+void parser_free_chunk(parser_t *self);
+
 /*
 
   Have parsed / type-converted a chunk of data and want to free memory from the
@@ -0,0 +1,409 @@
+#-------------------------------------------------------------------------------
+# Native CSV writer
+
+from libc.stdlib cimport realloc
+from libc.string cimport memcpy, memchr, strlen
+from libc.stdio cimport snprintf
+from cpython cimport (PyBytes_AS_STRING, PyBytes_GET_SIZE,
+                      PyBytes_FromStringAndSize, PyUnicode_Check,
+                      PyFloat_CheckExact)
+from pandas.compat import PY3
+
+cdef extern from "Python.h":
+    char *PyOS_double_to_string(double val, char format_code, int precision,
+                                int flags, int *type) except NULL
+    void PyMem_Free(void *p)
+    enum:
+        Py_DTSF_SIGN
+        Py_DTSF_ADD_DOT_0
+        Py_DTSF_ALT
+
+# kinds of the columns passed to write_csv_columns
+CSV_FLOAT = 0
+CSV_INT = 1
+CSV_BOOL = 2
+CSV_DATETIME = 3
+CSV_DATE = 4
+CSV_LIST = 5
+
+# float repr, the default format of the csv module
+CSV_REPR_FORMAT = (b'', b'r', 0, Py_DTSF_ADD_DOT_0, b'')
+
+# flags of the '+' and '#' float conversions
+CSV_FLOAT_SIGN = Py_DTSF_SIGN
+CSV_FLOAT_ALT = Py_DTSF_ALT
+
+cdef enum:
+    _FLOAT = 0
+    _INT = 1
+    _BOOL = 2
+    _DATETIME = 3
+    _DATE = 4
+    _LIST = 5
+
+cdef int64_t _NS_PER_DAY = 86400LL * 1000000000LL
+
+ctypedef struct csv_buffer:
+    char *data
+    Py_ssize_t length
+    Py_ssize_t capacity
+
+ctypedef struct csv_dialect:
+    char sep
+    char quotechar
+    char *lineterm
+    Py_ssize_t lineterm_len
+    bint quote_all
+    # the formatted numbers, dates and booleans never need quoting
+    bint plain_numbers
+
+ctypedef struct csv_float_format:
+    char code
+    int precision
+    int flags
+    char *prefix
+    Py_ssize_t prefix_len
+    char *suffix
+    Py_ssize_t suffix_len
+
+cdef csv_float_format _repr_format
+_repr_format.code = 'r'
+_repr_format.precision = 0
+_repr_format.flags = Py_DTSF_ADD_DOT_0
+_repr_format.prefix = ''
+_repr_format.prefix_len = 0
+_repr_format.suffix = ''
+_repr_format.suffix_len = 0
+
+# characters of the formatted numbers, dates and booleans
+cdef bytes _number_chars = b'0123456789.+-: eEinfaINFATrulsF'
+
+
+cdef int _buf_reserve(csv_buffer *buf, Py_ssize_t n) except -1:
+    cdef:
+        Py_ssize_t capacity
+        char *data
+
+    if buf.length + n <= buf.capacity:
+        return 0
+
+    capacity = max(2 * buf.capacity, buf.length + n)
+    data = <char*> realloc(buf.data, capacity)
+    if data == NULL:
+        raise MemoryError('out of memory for the CSV buffer')
+    buf.data = data
+    buf.capacity = capacity
+    return 0
+
+
+cdef inline int _buf_write(csv_buffer *buf, char *s,
+                           Py_ssize_t n) except -1:
+    _buf_reserve(buf, n)
+    memcpy(buf.data + buf.length, s, n)
+    buf.length += n
+    return 0
+
+
+cdef int _write_field(csv_buffer *buf, char *s, Py_ssize_t n,
+                      csv_dialect *dialect) except -1:
+    """
+    Append a field, quoted as the csv module does: with QUOTE_MINIMAL, when
+    it contains the separator, the quote character or a character of the
+    line terminator, quote characters being doubled.
+    """
+    cdef:
+        Py_ssize_t k
+        bint quote = dialect.quote_all
+        char c
+
+    if not quote:
+        for k in range(n):
+            c = s[k]
+            if (c == dialect.sep or c == dialect.quotechar or
+                memchr(dialect.lineterm, c, dialect.lineterm_len) != NULL):
+                quote = 1
+                break
+
+    if not quote:
+        return _buf_write(buf, s, n)
+
+    _buf_reserve(buf, 2 * n + 2)
+    buf.data[buf.length] = dialect.quotechar
+    buf.length += 1
+    for k in range(n):
+        c = s[k]
+        if c == dialect.quotechar:
+            buf.data[buf.length] = c
+            buf.length += 1
+        buf.data[buf.length] = c
+        buf.length += 1
+    buf.data[buf.length] = dialect.quotechar
+    buf.length += 1
+    return 0
+
+
+cdef inline int _write_number(csv_buffer *buf, char *s, Py_ssize_t n,
+                              csv_dialect *dialect) except -1:
+    if dialect.plain_numbers and not dialect.quote_all:
+        return _buf_write(buf, s, n)
+    return _write_field(buf, s, n, dialect)
+
+
+cdef int _write_float(csv_buffer *buf, double val, csv_float_format *fmt,
+                      csv_dialect *dialect) except -1:
+    cdef:
+        char *s
+        char *field
+        Py_ssize_t n, length
+
+    s = PyOS_double_to_string(val, fmt.code, fmt.precision, fmt.flags, NULL)
+    n = strlen(s)
+    try:
+        if fmt.prefix_len == 0 and fmt.suffix_len == 0:
+            _write_number(buf, s, n, dialect)
+        else:
+            length = fmt.prefix_len + n + fmt.suffix_len
+            field = <char*> malloc(length)
+            if field == NULL:
+                raise MemoryError('out of memory for the CSV buffer')
+            memcpy(field, fmt.prefix, fmt.prefix_len)
+            memcpy(field + fmt.prefix_len, s, n)
+            memcpy(field + fmt.prefix_len + n, fmt.suffix, fmt.suffix_len)
+            try:
+                _write_number(buf, field, length, dialect)
+            finally:
+                free(field)
+    finally:
+        PyMem_Free(s)
+    return 0
+
+
+cdef int _write_datetime(csv_buffer *buf, int64_t val, bint date_only,
+                         csv_dialect *dialect) except -1:
+    """
+    Append a datetime64[ns] value in the format of Timestamp._repr_base, or
+    the date only.
+    """
+    cdef:
+        int64_t days, nanos, z, era, doe, yoe, doy, mp
+        int year, month, day, n
+        char s[48]
+
+    days = val // _NS_PER_DAY
+    nanos = val - days * _NS_PER_DAY
+
+    # civil date of the days since the epoch
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = <int> (doy - (153 * mp + 2) // 5 + 1)
+    month = <int> (mp + 3 if mp < 10 else mp - 9)
+    year = <int> (yoe + era * 400 + (month <= 2))
+
+    if date_only:
+        n = snprintf(s, sizeof(s), '%d-%.2d-%.2d', year, month, day)
+    else:
+        n = snprintf(s, sizeof(s), '%d-%.2d-%.2d %.2d:%.2d:%.2d',
+                     year, month, day,
+                     <int> (nanos // 3600000000000LL),
+                     <int> (nanos // 60000000000LL % 60),
+                     <int> (nanos // 1000000000LL % 60))
+        nanos = nanos % 1000000000LL
+        if nanos % 1000 != 0:
+            n += snprintf(s + n, sizeof(s) - n, '.%.9d', <int> nanos)
+        elif nanos != 0:
+            n += snprintf(s + n, sizeof(s) - n, '.%.6d', <int> (nanos // 1000))
+
+    return _write_number(buf, s, n, dialect)
+
+
+cdef int _write_object(csv_buffer *buf, object val,
+                       csv_dialect *dialect) except -1:
+    """
+    Append a preformatted value, converted to a string as by the csv
+    module.
+    """
+    cdef bytes s
+
+    if PyFloat_CheckExact(val):
+        return _write_float(buf, val, &_repr_format, dialect)
+
+    if val is None:
+        s = b''
+    elif PyUnicode_Check(val):
+        s = val.encode('utf-8')
+    elif PyBytes_Check(val):
+        s = val
+    else:
+        if not PY3 and isinstance(val, float):
+            val = repr(val)
+        else:
+            val = str(val)
+        if PyUnicode_Check(val):
+            s = val.encode('utf-8')
+        else:
+            s = val
+
+    return _write_field(buf, PyBytes_AS_STRING(s), PyBytes_GET_SIZE(s),
+                        dialect)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def write_csv_columns(list columns, Py_ssize_t nrows, object f, object sep,
+                      object quotechar, object line_terminator,
+                      bint quote_all, object na_rep, tuple float_format):
+    """
+    Format the columns of a chunk row by row into a single buffer of CSV
+    lines and write it to f with one call.
+
+    Parameters
+    ----------
+    columns : list of (kind, values) pairs
+        values is a 1-d float64 (CSV_FLOAT), int64 (CSV_INT), bool
+        (CSV_BOOL) or datetime64[ns] (CSV_DATETIME, CSV_DATE for the date
+        only) array, or a list of preformatted objects (CSV_LIST)
+    nrows : number of rows of the chunk
+    f : file handle, written str in Python 3 and bytes in Python 2
+    sep, quotechar, line_terminator : ASCII strings
+    quote_all : quote every field (QUOTE_ALL) rather than QUOTE_MINIMAL
+    na_rep : representation of NaN and NaT
+    float_format : (prefix, code, precision, flags, suffix) tuple of the
+        PyOS_double_to_string arguments formatting the floats
+    """
+    cdef:
+        Py_ssize_t i, j, ncols = len(columns)
+        Py_ssize_t na_len, row_start
+        int *kinds = NULL
+        char **data = NULL
+        Py_ssize_t *strides = NULL
+        char *p
+        char *na
+        double fval
+        int64_t ival
+        bint lone_field
+        csv_buffer buf
+        csv_dialect dialect
+        csv_float_format fmt
+        bytes b_sep, b_quotechar, b_lineterm, b_na, b_code, prefix, suffix
+        bytes field_chars
+        char s[32]
+        list keep = []
+        list lists = [None] * ncols
+
+    if ncols == 0 or nrows == 0:
+        return
+
+    b_sep = sep.encode('ascii')
+    b_quotechar = quotechar.encode('ascii')
+    b_lineterm = line_terminator.encode('ascii')
+    dialect.sep = PyBytes_AS_STRING(b_sep)[0]
+    dialect.quotechar = PyBytes_AS_STRING(b_quotechar)[0]
+    dialect.lineterm = PyBytes_AS_STRING(b_lineterm)
+    dialect.lineterm_len = PyBytes_GET_SIZE(b_lineterm)
+    dialect.quote_all = quote_all
+
+    b_na = na_rep.encode('utf-8') if PyUnicode_Check(na_rep) else na_rep
+    na = PyBytes_AS_STRING(b_na)
+    na_len = PyBytes_GET_SIZE(b_na)
+
+    prefix, b_code, fmt.precision, fmt.flags, suffix = float_format
+    fmt.code = PyBytes_AS_STRING(b_code)[0]
+    fmt.prefix = PyBytes_AS_STRING(prefix)
+    fmt.prefix_len = PyBytes_GET_SIZE(prefix)
+    fmt.suffix = PyBytes_AS_STRING(suffix)
+    fmt.suffix_len = PyBytes_GET_SIZE(suffix)
+
+    field_chars = _number_chars + prefix + suffix
+    dialect.plain_numbers = not any(c in field_chars for c in
+                                    (b_sep, b_quotechar) +
+                                    tuple(b_lineterm[k:k + 1] for k in
+                                          range(len(b_lineterm))))
+
+    # the csv module quotes a row made of a single empty field
+    lone_field = ncols == 1
+
+    buf.data = NULL
+    buf.length = 0
+    buf.capacity = 0
+
+    try:
+        kinds = <int*> malloc(ncols * sizeof(int))
+        data = <char**> malloc(ncols * sizeof(char*))
+        strides = <Py_ssize_t*> malloc(ncols * sizeof(Py_ssize_t))
+        if kinds == NULL or data == NULL or strides == NULL:
+            raise MemoryError('out of memory for the CSV columns')
+
+        for i in range(ncols):
+            kind, values = columns[i]
+            kinds[i] = kind
+            if kind == _LIST:
+                lists[i] = values
+                data[i] = NULL
+                strides[i] = 0
+            else:
+                if kind == _BOOL:
+                    values = values.view(np.uint8)
+                elif kind == _DATETIME or kind == _DATE:
+                    values = values.view(np.int64)
+                keep.append(values)
+                data[i] = <char*> (<ndarray> values).data
+                strides[i] = (<ndarray> values).strides[0]
+
+        _buf_reserve(&buf, nrows * ncols * 8)
+
+        for j in range(nrows):
+            row_start = buf.length
+            for i in range(ncols):
+                if i > 0:
+                    _buf_reserve(&buf, 1)
+                    buf.data[buf.length] = dialect.sep
+                    buf.length += 1
+
+                p = data[i] + j * strides[i]
+                if kinds[i] == _FLOAT:
+                    fval = (<double*> p)[0]
+                    if fval != fval:
+                        _write_field(&buf, na, na_len, &dialect)
+                    else:
+                        _write_float(&buf, fval, &fmt, &dialect)
+                elif kinds[i] == _INT:
+                    ival = (<int64_t*> p)[0]
+                    _write_number(&buf, s, snprintf(s, sizeof(s), '%lld',
+                                                    <long long> ival),
+                                  &dialect)
+                elif kinds[i] == _BOOL:
+                    if (<uint8_t*> p)[0]:
+                        _write_number(&buf, 'True', 4, &dialect)
+                    else:
+                        _write_number(&buf, 'False', 5, &dialect)
+                elif kinds[i] == _DATETIME or kinds[i] == _DATE:
+                    ival = (<int64_t*> p)[0]
+                    if ival == NPY_NAT:
+                        _write_field(&buf, na, na_len, &dialect)
+                    else:
+                        _write_datetime(&buf, ival, kinds[i] == _DATE,
+                                        &dialect)
+                else:
+                    _write_object(&buf, (<list> lists[i])[j], &dialect)
+
+            if lone_field and buf.length == row_start:
+                # the field of this row was empty
+                _buf_write(&buf, &dialect.quotechar, 1)
+                _buf_write(&buf, &dialect.quotechar, 1)
+
+            _buf_write(&buf, dialect.lineterm, dialect.lineterm_len)
+
+        out = PyBytes_FromStringAndSize(buf.data, buf.length)
+    finally:
+        free(kinds)
+        free(data)
+        free(strides)
+        free(buf.data)
+
+    if PY3:
+        out = out.decode('utf-8')
+    f.write(out)
@@ -33,7 +33,7 @@ import pandas.core.format as fmt
 import pandas.core.datetools as datetools
 from pandas.core.api import (DataFrame, Index, Series, notnull, isnull,
                              MultiIndex, DatetimeIndex, Timestamp)
-from pandas import date_range
+from pandas import date_range, to_datetime
 import pandas as pd
 from pandas.io.parsers import read_csv
 from pandas.parser import CParserError
@@ -5725,6 +5725,62 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
                     'three,3,6\n')
         self.assertEqual(buf.getvalue(), expected)
 
+    def test_to_csv_column_types(self):
+        df = DataFrame({'f': [0.1, np.nan, np.inf, 1e16],
+                        'i': np.array([1, -2, 3, 2 ** 40], dtype=np.int64),
+                        'b': [True, False, True, False],
+                        'd': [datetime(2013, 1, 1), np.nan,
+                              datetime(2013, 1, 2, 3, 4, 5),
+                              datetime(2013, 1, 2, 3, 4, 5, 6)],
+                        's': ['a', 'b,c', 'd"e', None]},
+                       columns=['f', 'i', 'b', 'd', 's'],
+                       index=date_range('2013-01-01', periods=4))
+
+        buf = StringIO()
+        df.to_csv(buf, na_rep='NA', chunksize=3)
+        expected = (',f,i,b,d,s\n'
+                    '2013-01-01,0.1,1,True,2013-01-01 00:00:00,a\n'
+                    '2013-01-02,NA,-2,False,NA,"b,c"\n'
+                    '2013-01-03,inf,3,True,2013-01-02 03:04:05,"d""e"\n'
+                    '2013-01-04,1e+16,1099511627776,False,'
+                    '2013-01-02 03:04:05.000006,NA\n')
+        self.assertEqual(buf.getvalue(), expected)
+
+        buf = StringIO()
+        df[['f', 'i']].to_csv(buf, float_format='%.2f', sep=';',
+                              index=False, quoting=csv.QUOTE_ALL)
+        expected = ('"f";"i"\n'
+                    '"0.10";"1"\n'
+                    '"";"-2"\n'
+                    '"inf";"3"\n'
+                    '"10000000000000000.00";"1099511627776"\n')
+        self.assertEqual(buf.getvalue(), expected)
+
+        # formats applied by Python
+        buf = StringIO()
+        df[['f']].to_csv(buf, float_format='%6.2f', index=False)
+        self.assertEqual(buf.getvalue().split('\n')[1], '  0.10')
+
+        # a row made of a single empty field is quoted
+        buf = StringIO()
+        DataFrame({'A': ['x', None]}).to_csv(buf, index=False)
+        self.assertEqual(buf.getvalue(), 'A\nx\n""\n')
+
+    def test_to_csv_date_format(self):
+        # B holds the datetimes as objects
+        df = DataFrame({'A': to_datetime([datetime(2013, 1, 1, 12), np.nan]),
+                        'B': [datetime(2013, 1, 2, 6), 'x']},
+                       index=date_range('2013-01-01', periods=2, freq='H'))
+        self.assertEqual(df['A'].dtype, np.dtype('M8[ns]'))
+        self.assertEqual(df['B'].dtype, np.object_)
+
+        buf = StringIO()
+        df.to_csv(buf, date_format='%Y%m%d %H')
+        expected = (',A,B\n'
+                    '20130101 00,20130101 12,20130102 06\n'
+                    '20130101 01,,x\n')
+        self.assertEqual(buf.getvalue(), expected)
+
     def test_info(self):
         io = StringIO()
         self.frame.info(buf=io)
@@ -23,6 +23,7 @@ from pandas.tools.merge import concat
 from collections import defaultdict
 import pandas.core.common as com
 import pandas.core.datetools as dt
+import pandas.core.groupby as groupby
 import numpy as np
 from numpy.testing import assert_equal
 
@@ -2696,6 +2697,496 @@ class TestGroupBy(unittest.TestCase):
         new_way = grouped.filter(lambda x: x['ints'].mean() > N/20)
         assert_frame_equal(new_way.sort_index(), old_way.sort_index())
 
+    def test_filter_boolean_series(self):
+        np.random.seed(0)
+        N = 1000
+        df = DataFrame({'key': np.random.randint(0, 50, N),
+                        'x': np.random.randn(N),
+                        'y': np.random.randn(N)})
+        df['key'][::17] = np.nan
+        grouped = df.groupby('key')
+
+        result = grouped.filter(grouped.size() > 20)
+        expected = grouped.filter(lambda g: len(g) > 20)
+        assert_frame_equal(result, expected.sort_index())
+
+        result = grouped.filter(grouped['x'].sum() > 0, dropna=False)
+        expected = grouped.filter(lambda g: g['x'].sum() > 0, dropna=False)
+        assert_frame_equal(result, expected)
+
+        sgrouped = df['y'].groupby(df['key'])
+        result = sgrouped.filter(sgrouped.mean() > 0)
+        expected = sgrouped.filter(lambda x: x.mean() > 0)
+        assert_series_equal(result, expected.sort_index())
+
+        # an ndarray with one value per group
+        mask = (grouped.size() > 20).values
+        result = grouped.filter(mask)
+        assert_frame_equal(result, grouped.filter(grouped.size() > 20))
+
+        # groups missing from the mask are dropped
+        mask = (grouped.size() > 20)[:10]
+        result = grouped.filter(mask)
+        keys = mask.index[mask.values]
+        assert_frame_equal(result, df[df['key'].isin(keys)])
+
+        self.assertRaises(TypeError, grouped.filter, grouped.size())
+        self.assertRaises(ValueError, grouped.filter, mask.values)
+
+    def test_streaming_groupby(self):
+        from pandas.core.groupby import StreamingGroupBy
+
+        df = DataFrame({'A': np.random.randint(0, 5, 100),
+                        'B': np.random.randint(0, 3, 100),
+                        'C': np.random.randn(100),
+                        'D': np.random.randn(100)})
+        df['C'][::7] = np.nan
+        chunks = [df[:30], df[30:45], df[45:]]
+
+        for how in ['sum', 'mean', 'var', 'std', 'min', 'max',
+                    'first', 'last']:
+            grouped = StreamingGroupBy('A', how)
+            for chunk in chunks:
+                grouped.update(chunk)
+            result = grouped.finalize()
+            expected = getattr(df.groupby('A'), how)()
+            assert_frame_equal(result, expected)
+
+        grouped = StreamingGroupBy(['A', 'B'], ['sum', 'count', 'mean'])
+        for chunk in chunks:
+            grouped.update(chunk)
+        self.assertEqual(grouped.nchunks, 3)
+        result = grouped.finalize()
+
+        expected = df.groupby(['A', 'B']).agg(['sum', 'mean'])
+        assert_frame_equal(result.xs('sum', axis=1, level=1),
+                           expected.xs('sum', axis=1, level=1))
+        assert_frame_equal(result.xs('mean', axis=1, level=1),
+                           expected.xs('mean', axis=1, level=1))
+
+        counts = df.groupby(['A', 'B'])['C'].agg(lambda x: x.count())
+        assert_series_equal(result['C', 'count'], counts.astype(np.int64))
+
+        # the variance of values with a large mean keeps its precision
+        df = DataFrame({'A': np.arange(1000) % 3,
+                        'C': 1e9 + np.random.randn(1000)})
+        grouped = StreamingGroupBy('A', 'var')
+        for i in range(0, 1000, 100):
+            grouped.update(df[i:i + 100])
+        result = grouped.finalize()
+        expected = df.groupby('A')['C'].agg(lambda x: np.var(x, ddof=1))
+        assert_almost_equal(result['C'].values, expected.values)
+
+    def test_streaming_groupby_raises(self):
+        from pandas.core.groupby import StreamingGroupBy
+
+        self.assertRaises(ValueError, StreamingGroupBy, 'A', 'median')
+        self.assertRaises(ValueError, StreamingGroupBy('A', 'sum').finalize)
+
+        grouped = StreamingGroupBy('A', 'sum')
+        grouped.update(DataFrame({'A': [1, 1, 2], 'B': ['a', 'b', 'c']}))
+        self.assertRaises(DataError, grouped.finalize)
+
+    def test_cython_agg_threaded(self):
+        from pandas.core.config import option_context
+
+        df = DataFrame(np.random.randn(1000, 10))
+        df[10] = np.random.randint(0, 10, 1000)
+        df[11] = np.random.randn(1000).astype('float32')
+        df[12] = 'foo'
+        df.ix[::3, 2] = np.nan
+        labels = np.random.randint(0, 50, 1000)
+
+        for how in ['sum', 'prod', 'mean', 'var', 'min', 'max', 'first',
+                    'last']:
+            expected = getattr(df.groupby(labels), how)()
+            for n_threads in [2, 3, 16]:
+                with option_context('compute.groupby_threads', n_threads):
+                    result = getattr(df.groupby(labels), how)()
+                assert_frame_equal(result, expected)
+
+    def test_cython_transform(self):
+        df = DataFrame({'A': np.random.randint(0, 5, 50),
+                        'B': np.random.randn(50),
+                        'C': np.random.randint(0, 3, 50)})
+        df['B'][::4] = np.nan
+        df['B'][1::9] = np.nan
+        grouped = df.groupby('A')
+
+        funcs = {'cumsum': lambda x: x.cumsum(),
+                 'cumprod': lambda x: x.cumprod(),
+                 'shift': lambda x: x.shift(),
+                 'rank': lambda x: x.rank(),
+                 'ffill': lambda x: x.fillna(method='ffill'),
+                 'bfill': lambda x: x.fillna(method='bfill')}
+
+        for how, f in compat.iteritems(funcs):
+            # the methods transform the group keys as well, transform does not
+            result = getattr(grouped, how)()
+            self.assert_(result.index.equals(df.index))
+            self.assert_(result.columns.equals(df.columns))
+            assert_frame_equal(grouped.transform(how), result[['B', 'C']])
+
+            for col in ['A', 'B', 'C']:
+                expected = grouped[col].apply(f)
+                assert_series_equal(result[col], expected)
+                assert_series_equal(grouped[col].transform(how), expected)
+
+        expected = grouped['B'].apply(lambda x: x.shift(-2))
+        assert_series_equal(grouped['B'].shift(-2), expected)
+
+        expected = grouped['B'].apply(lambda x: x.rank(method='min',
+                                                        ascending=False))
+        assert_series_equal(grouped['B'].rank(method='min', ascending=False),
+                            expected)
+
+        expected = grouped['B'].apply(lambda x: x.fillna(method='ffill',
+                                                         limit=1))
+        assert_series_equal(grouped['B'].ffill(limit=1), expected)
+
+        assert_series_equal(grouped['B'].transform(np.cumsum),
+                            grouped['B'].cumsum())
+        assert_frame_equal(grouped.transform('cumsum'),
+                           grouped.cumsum()[['B', 'C']])
+
+    def test_cython_transform_columns(self):
+        # the same columns as applying the method to each group
+        df = DataFrame({'A': np.random.randint(0, 5, 50),
+                        'B': np.random.randn(50),
+                        'C': np.random.randint(0, 3, 50),
+                        'D': tm.makeStringIndex(50)},
+                       index=bdate_range('1/1/2000', periods=50))
+        df['B'][::4] = np.nan
+        df['D'][1::5] = np.nan
+        grouped = df.groupby('A')
+
+        methods = [lambda g: g.fillna(value=0),
+                   lambda g: g.fillna(method='ffill'),
+                   lambda g: g.rank(),
+                   lambda g: g.rank(na_option='top'),
+                   lambda g: g.shift(),
+                   lambda g: g.shift(1, freq='D')]
+        for f in methods:
+            result = f(grouped)
+            self.assert_(result.columns.equals(df.columns))
+            assert_frame_equal(result, grouped.apply(f))
+
+        # the string column is kept out of the kernels, not dropped
+        result = grouped.rank()
+        assert_series_equal(result['D'], grouped['D'].rank())
+        assert_frame_equal(grouped.transform('rank'),
+                           result[['B', 'C', 'D']])
+
+        # as before, strings can not be summed
+        self.assertRaises(TypeError, grouped.cumsum)
+
+    def test_cython_transform_missing_keys(self):
+        s = Series([1., 2., 3., 4., 5.])
+        keys = np.array(['a', 'b', np.nan, 'a', 'b'], dtype=object)
+
+        result = s.groupby(keys).cumsum()
+        expected = Series([1., 2., np.nan, 5., 7.])
+        assert_series_equal(result, expected)
+
+        result = s.groupby(keys).shift()
+        expected = Series([np.nan, np.nan, np.nan, 1., 2.])
+        assert_series_equal(result, expected)
+
+    def test_group_info_cache(self):
+        from pandas.core.config import option_context
+        from pandas.core.groupby import _group_info_cache
+
+        df = DataFrame({'A': np.random.randint(0, 10, 100),
+                        'B': np.random.randint(0, 3, 100),
+                        'C': np.random.randn(100)})
+
+        expected = df.groupby(['A', 'B']).sum()
+        expected_single = df.groupby('A')['C'].mean()
+        expected_apply = df.groupby('A').apply(lambda x: x.sum())
+
+        with option_context('compute.groupby_cache_size', 2):
+            first = df.groupby(['A', 'B'])
+            assert_frame_equal(first.sum(), expected)
+
+            second = df.groupby(['A', 'B'])
+            self.assert_(second.grouper.group_info is
+                         first.grouper.group_info)
+            assert_frame_equal(second.sum(), expected)
+
+            assert_series_equal(df.groupby('A')['C'].mean(), expected_single)
+            assert_series_equal(df.groupby('A')['C'].mean(), expected_single)
+            assert_frame_equal(df.groupby('A').apply(lambda x: x.sum()),
+                               expected_apply)
+            self.assertEqual(len(_group_info_cache), 2)
+
+            # modifying the frame invalidates its column keys
+            df['A'] = df['A'] % 3
+            grouped = df.groupby(['A', 'B'])
+            self.assert_(grouped.grouper.group_info is not
+                         first.grouper.group_info)
+            assert_frame_equal(grouped.sum(),
+                               df.copy().groupby(['A', 'B']).sum())
+
+            # so do writes into a key column in place
+            for write in [lambda: df['A'].__setitem__(0, 100),
+                          lambda: df.set_value(1, 'A', 101),
+                          lambda: df.ix.__setitem__((2, 'A'), 102)]:
+                first = df.groupby(['A', 'B'])
+                first.sum()
+                write()
+                grouped = df.groupby(['A', 'B'])
+                self.assert_(grouped.grouper.group_info is not
+                             first.grouper.group_info)
+                assert_frame_equal(grouped.sum(),
+                                   df.copy().groupby(['A', 'B']).sum())
+
+            # other key arrays are not cached
+            keys = df['A'].values.copy()
+            self.assert_(df.groupby(keys).grouper.group_info is not
+                         df.groupby(keys).grouper.group_info)
+
+            # bounded
+            for col in ['B', 'C', 'A']:
+                df.groupby(col).size()
+            self.assertEqual(len(_group_info_cache), 2)
+
+        # disabling the cache drops the entries
+        df.groupby('A').size()
+        self.assertEqual(len(_group_info_cache), 0)
+
+    def test_groupby_sort_false_unsorted_groups(self):
+        df = DataFrame({'A': ['b', 'a', 'b', 'c', 'a', 'c', 'b'],
+                        'B': [2, 1, 1, 2, 1, 2, 2],
+                        'C': np.arange(7.)})
+
+        # groups come out in order of first appearance
+        result = df.groupby(['A', 'B'], sort=False).sum()
+        expected_index = MultiIndex.from_tuples([('b', 2), ('a', 1),
+                                                 ('b', 1), ('c', 2)],
+                                                names=['A', 'B'])
+        self.assert_(result.index.equals(expected_index))
+        assert_frame_equal(result,
+                           df.groupby(['A', 'B']).sum().ix[expected_index])
+
+        # groups are taken from the unsorted frame, keeping the row order
+        grouped = df.groupby('A', sort=False)
+        splitter = grouped.grouper._get_splitter(df)
+        self.assertFalse(splitter.sort)
+        for name, group in grouped:
+            assert_frame_equal(group, df[df['A'] == name])
+
+        # a batch of rows at a time, groups larger than a batch on their own
+        batch_rows = groupby._split_batch_rows
+        try:
+            for n in [1, 2, 4]:
+                groupby._split_batch_rows = n
+                for name, group in grouped:
+                    assert_frame_equal(group, df[df['A'] == name])
+                for name, group in grouped['C']:
+                    assert_series_equal(group, df['C'][df['A'] == name])
+        finally:
+            groupby._split_batch_rows = batch_rows
+
+        f = lambda x: x.max() - x.min()
+        result = grouped['C'].agg(f)
+        expected = df.groupby('A')['C'].agg(f)
+        assert_series_equal(result, expected.take([1, 0, 2]))
+
+        result = grouped.agg(lambda x: x.values.sum())
+        expected = df.groupby('A').agg(lambda x: x.values.sum())
+        assert_frame_equal(result, expected.take([1, 0, 2]))
+
+    def test_agg_multiple_fused(self):
+        df = DataFrame({'A': np.random.randint(0, 5, 100),
+                        'B': np.random.randint(0, 3, 100),
+                        'C': np.random.randn(100),
+                        'D': np.random.randint(0, 10, 100),
+                        'E': np.random.randn(100).astype('float32')})
+        df['C'][::7] = np.nan
+        df['C'][df['A'] == 4] = np.nan
+
+        funcs = ['sum', 'mean', 'std', 'var', 'min', 'max', 'prod', 'count']
+
+        for keys in ['A', ['A', 'B']]:
+            grouped = df.groupby(keys)
+            for col in ['C', 'D', 'E']:
+                result = grouped[col].agg(funcs)
+                for f in funcs:
+                    expected = grouped[col].agg(f)
+                    assert_series_equal(result[f], expected)
+
+            result = grouped.agg([np.sum, np.mean, np.std])
+            for col in ['C', 'D', 'E']:
+                for f in ['sum', 'mean', 'std']:
+                    assert_series_equal(result[col][f], grouped[col].agg(f))
+
+            result = grouped.agg({'C': ['min', 'max'], 'D': ['sum', 'mean']})
+            assert_series_equal(result['C']['min'], grouped['C'].min())
+            assert_series_equal(result['C']['max'], grouped['C'].max())
+            assert_series_equal(result['D']['sum'], grouped['D'].sum())
+            assert_series_equal(result['D']['mean'], grouped['D'].mean())
+
+            # fused and python functions mixed
+            result = grouped['C'].agg({'total': np.sum, 'avg': 'mean',
+                                       'spread': lambda x: x.max() - x.min()})
+            assert_series_equal(result['total'], grouped['C'].sum())
+            assert_series_equal(result['avg'], grouped['C'].mean())
+            assert_series_equal(result['spread'],
+                                grouped['C'].agg(lambda x: x.max() - x.min()))
+
+    def test_apply_n_jobs(self):
+        df = DataFrame({'A': np.random.randint(0, 7, 200),
+                        'B': np.random.randint(0, 3, 200),
+                        'C': np.random.randn(200),
+                        'D': np.random.randn(200)})
+
+        funcs = [lambda x: x.sum(),
+                 lambda x: x.describe(),
+                 lambda x: x - x.mean(),
+                 lambda x: x.sort_index(by='C')[:2],
+                 lambda x: x.name]
+
+        for keys in ['A', ['A', 'B']]:
+            for sort in [True, False]:
+                grouped = df.groupby(keys, sort=sort)
+                for f in funcs:
+                    expected = grouped.apply(f)
+                    for n_jobs in [2, 3, 16]:
+                        result = grouped.apply(f, apply_n_jobs=n_jobs)
+                        tm.assert_almost_equal(result, expected)
+                        self.assertEqual(type(result), type(expected))
+
+                result = grouped['C'].apply(np.mean, apply_n_jobs=2)
+                assert_series_equal(result, grouped['C'].apply(np.mean))
+
+        # extra arguments are still passed to the function
+        f = lambda x, n: x['C'].order()[-n:]
+        result = df.groupby('A').apply(f, 2, apply_n_jobs=2)
+        assert_series_equal(result, df.groupby('A').apply(f, 2))
+
+        # including an n_jobs argument of the function
+        f = lambda x, n_jobs: x['C'].sum() * n_jobs
+        result = df.groupby('A').apply(f, n_jobs=2)
+        tm.assert_almost_equal(result.values,
+                               df.groupby('A')['C'].sum().values * 2)
+
+        self.assertRaises(ValueError, df.groupby('A').apply, np.sum,
+                          apply_n_jobs=0)
+        self.assertRaises(ValueError, df.groupby('A').apply, np.sum,
+                          apply_n_jobs=1.5)
+
+        # bins are applied in this process
+        from pandas.tseries.resample import TimeGrouper
+        grouper = TimeGrouper('5D')
+        ts = Series(np.random.randn(20),
+                    index=bdate_range('1/1/2000', periods=20))
+        with tm.assert_produces_warning(UserWarning):
+            result = ts.groupby(grouper).apply(np.mean, apply_n_jobs=2)
+        assert_series_equal(result, ts.groupby(grouper).apply(np.mean))
+
+    def test_balanced_batches(self):
+        from pandas.core.groupby import _balanced_batches
+
+        self.assertEqual(_balanced_batches(np.array([5, 5, 5, 5]), 2),
+                         [(0, 2), (2, 4)])
+        self.assertEqual(_balanced_batches(np.array([10, 1, 1, 1, 1]), 2),
+                         [(0, 1), (1, 5)])
+        self.assertEqual(_balanced_batches(np.array([3, 3]), 8),
+                         [(0, 1), (1, 2)])
+
+    def test_cython_agg_datetimelike(self):
+        dates = Series([datetime(2013, 1, 1), np.nan, datetime(2013, 1, 3),
+                        datetime(2012, 12, 31), np.nan, np.nan],
+                       dtype='M8[ns]')
+        self.assertEqual(dates.dtype, np.dtype('M8[ns]'))
+        df = DataFrame({'key': ['a', 'a', 'a', 'b', 'b', 'c'],
+                        'ts': dates,
+                        'td': dates - datetime(2012, 12, 31)})
+        grouped = df.groupby('key')
+
+        # aggregated by the Cython kernels on the int64 view
+        for how in ['first', 'last', 'min', 'max']:
+            result, _ = grouped.grouper.aggregate(df['ts'].values, how)
+            self.assertEqual(result.dtype, np.dtype('M8[ns]'))
+            result, _ = grouped.grouper.aggregate(df['td'].values, how)
+            self.assertEqual(result.dtype, np.dtype('m8[ns]'))
+        self.assertRaises(NotImplementedError, grouped.grouper.aggregate,
+                          df['ts'].values, 'mean')
+
+        index = Index(['a', 'b', 'c'], name='key')
+        lo = Series([datetime(2013, 1, 1), datetime(2012, 12, 31), np.nan],
+                    index=index, dtype='M8[ns]')
+        hi = Series([datetime(2013, 1, 3), datetime(2012, 12, 31), np.nan],
+                    index=index, dtype='M8[ns]')
+        base = datetime(2012, 12, 31)
+
+        for how, expected in [('first', lo), ('last', hi), ('min', lo),
+                              ('max', hi)]:
+            assert_series_equal(getattr(grouped['ts'], how)(), expected)
+
+            result = getattr(grouped, how)()
+            assert_series_equal(result['ts'], expected)
+            assert_series_equal(result['td'], expected - base)
+            self.assertEqual(result['ts'].dtype, np.dtype('M8[ns]'))
+            self.assertEqual(result['td'].dtype, np.dtype('m8[ns]'))
+
+    def test_approx_quantile(self):
+        n = 10000
+        df = DataFrame({'key': np.random.randint(0, 5, n),
+                        'A': np.random.randn(n),
+                        'B': np.random.lognormal(size=n)})
+        df['A'][::13] = np.nan
+        grouped = df.groupby('key')
+
+        def check_rank(result, q, columns=['A', 'B']):
+            for key, group in grouped:
+                for col in columns:
+                    values = group[col].dropna().values
+                    bound = (2 * np.pi * np.sqrt(q * (1 - q)) / 100 +
+                             1. / len(values))
+                    rank = (values <= result[col][key]).mean()
+                    self.assert_(abs(rank - q) <= bound)
+
+        for q in [0.01, 0.5, 0.95, 0.99]:
+            check_rank(grouped.approx_quantile(q), q)
+            check_rank({'A': grouped['A'].approx_quantile(q)}, q, ['A'])
+
+        # merge the digests of chunks, which miss some of the groups
+        digest = grouped.tdigest()
+        for _, (labels, means, weights) in compat.iteritems(digest.centroids):
+            self.assert_(np.bincount(labels).max() <= 100)
+
+        middle = df[3000:6000]
+        chunks = [df[:3000], middle[middle['key'] != 2], df[6000:]]
+        merged = None
+        for chunk in chunks:
+            d = chunk.groupby('key').tdigest()
+            merged = d if merged is None else merged.merge(d)
+
+        result = merged.quantile([0.5, 0.99])
+        self.assert_(result.index.equals(digest.index))
+        self.assertEqual(list(result.columns),
+                         [('A', 0.5), ('A', 0.99), ('B', 0.5), ('B', 0.99)])
+        for q in [0.5, 0.99]:
+            check_rank(merged.quantile(q), q)
+
+        # the quantiles 0 and 1 are the group min and max
+        assert_frame_equal(grouped.approx_quantile(0), grouped.min())
+        assert_frame_equal(grouped.approx_quantile(1), grouped.max())
+        chunked = concat(chunks).groupby('key')
+        assert_frame_equal(merged.quantile(0), chunked.min())
+        assert_frame_equal(merged.quantile(1), chunked.max())
+
+        series_digest = grouped['B'].tdigest()
+        result = series_digest.quantile(0.5)
+        self.assert_(isinstance(result, Series))
+        result = series_digest.quantile([0.5, 0.9])
+        self.assertEqual(list(result.columns), [0.5, 0.9])
+
+        self.assertRaises(ValueError, grouped.approx_quantile, 1.5)
+        self.assertRaises(ValueError, merged.merge, series_digest)
+        self.assertRaises(DataError, df[['key']].groupby('key').tdigest)
+
 def assert_fp_equal(a, b):
     assert((np.abs(a - b) < 1e-12).all())
 
@@ -592,9 +592,19 @@ class DatetimeIndex(Int64Index):
     def _format_with_header(self, header, **kwargs):
         return header + self._format_native_types(**kwargs)
 
-    def _format_native_types(self, na_rep=u('NaT'), **kwargs):
+    def _format_native_types(self, na_rep=u('NaT'), date_format=None,
+                             **kwargs):
         data = list(self)
 
+        if date_format is not None:
+            values = np.array(data, dtype=object)
+            mask = isnull(self.values)
+            values[mask] = na_rep
+            imask = -mask
+            values[imask] = np.array([dt.strftime(date_format)
+                                      for dt in values[imask]])
+            return values.tolist()
+
         # tz formatter or time formatter
         zero_time = time(0, 0)
         for d in data:
@@ -381,7 +381,7 @@ else:
     cmdclass['build_src'] = DummyBuildSrc
     cmdclass['build_ext'] = CheckingBuildExt
 
-lib_depends = ['reduce', 'inference', 'properties']
+lib_depends = ['reduce', 'inference', 'properties', 'writers']
 
 
 def srcpath(name=None, suffix='.pyx', subdir='src'):
@@ -413,6 +413,52 @@ tseries_depends = ['pandas/src/datetime/np_datetime.h',
 # some linux distros require it
 libraries = ['m'] if 'win32' not in sys.platform else []
 
+
+def have_c_library(header, library, call):
+    """
+    Whether a program including header and making call compiles and links
+    against library with the default compiler
+    """
+    import tempfile
+    from distutils.ccompiler import new_compiler
+    from distutils.sysconfig import customize_compiler
+    from distutils.errors import CompileError, LinkError
+
+    compiler = new_compiler()
+    customize_compiler(compiler)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        src = pjoin(tmpdir, 'have_%s.c' % library)
+        with open(src, 'w') as f:
+            f.write('#include <%s>\n'
+                    'int main(void) { %s; return 0; }\n' % (header, call))
+        try:
+            objects = compiler.compile([src], output_dir=tmpdir)
+            compiler.link_executable(objects, pjoin(tmpdir, 'have_' + library),
+                                     libraries=[library])
+        except (CompileError, LinkError):
+            return False
+    finally:
+        shutil.rmtree(tmpdir)
+    return True
+
+
+# the C parser decompresses gzip and bz2 files itself where zlib and bzip2
+# are available, and leaves them to Python otherwise
+compression_libraries = []
+compression_macros = []
+if 'win32' not in sys.platform:
+    for header, library, call, macro in [
+            ('zlib.h', 'z', 'zlibVersion()', 'HAVE_ZLIB'),
+            ('bzlib.h', 'bz2', 'BZ2_bzlibVersion()', 'HAVE_BZLIB')]:
+        if have_c_library(header, library, call):
+            compression_libraries.append(library)
+            compression_macros.append((macro, None))
+        else:
+            print("%s not found, the C parser will not decompress "
+                  "these files itself" % header)
+
 ext_data = dict(
     lib={'pyxfile': 'lib',
          'pxdfiles': [],
@@ -432,9 +478,13 @@ ext_data = dict(
     parser=dict(pyxfile='parser',
                 depends=['pandas/src/parser/tokenizer.h',
                          'pandas/src/parser/io.h',
-                         'pandas/src/numpy_helper.h'],
+                         'pandas/src/numpy_helper.h'] + tseries_depends,
                 sources=['pandas/src/parser/tokenizer.c',
-                         'pandas/src/parser/io.c'])
+                         'pandas/src/parser/io.c',
+                         'pandas/src/datetime/np_datetime.c',
+                         'pandas/src/datetime/np_datetime_strings.c'],
+                libraries=compression_libraries,
+                macros=compression_macros)
 )
 
 extensions = []
@@ -452,7 +502,9 @@ for name, data in ext_data.items():
     obj = Extension('pandas.%s' % name,
                     sources=sources,
                     depends=data.get('depends', []),
-                    include_dirs=include)
+                    include_dirs=include,
+                    libraries=data.get('libraries', []),
+                    define_macros=data.get('macros', []))
 
     extensions.append(obj)
 
@@ -60,6 +60,40 @@ groupby_frame_cython_many_columns = Benchmark(
     start_date=datetime(2011, 8, 1),
     logy=True)
 
+#----------------------------------------------------------------------
+# wide frame, cython aggregation on a pool of threads
+
+setup = common_setup + """
+labels = np.random.randint(0, 1000, size=500000)
+df = DataFrame(randn(500000, 64))
+set_option('compute.groupby_threads', %d)
+"""
+
+groupby_frame_cython_wide_1_thread = Benchmark(
+    'df.groupby(labels).sum()', setup % 1,
+    cleanup="reset_option('compute.groupby_threads')",
+    start_date=datetime(2013, 10, 1))
+
+groupby_frame_cython_wide_2_threads = Benchmark(
+    'df.groupby(labels).sum()', setup % 2,
+    cleanup="reset_option('compute.groupby_threads')",
+    start_date=datetime(2013, 10, 1))
+
+groupby_frame_cython_wide_4_threads = Benchmark(
+    'df.groupby(labels).sum()', setup % 4,
+    cleanup="reset_option('compute.groupby_threads')",
+    start_date=datetime(2013, 10, 1))
+
+groupby_frame_cython_wide_8_threads = Benchmark(
+    'df.groupby(labels).sum()', setup % 8,
+    cleanup="reset_option('compute.groupby_threads')",
+    start_date=datetime(2013, 10, 1))
+
+groupby_frame_cython_wide_mean_8_threads = Benchmark(
+    'df.groupby(labels).mean()', setup % 8,
+    cleanup="reset_option('compute.groupby_threads')",
+    start_date=datetime(2013, 10, 1))
+
 #----------------------------------------------------------------------
 # single key, long, integer key
 
@@ -311,3 +345,168 @@ f_fillna = lambda x: x.fillna(method='pad')
 """
 
 groupby_transform = Benchmark("data.groupby(level='security_id').transform(f_fillna)", setup)
+
+groupby_transform_ffill_cython = \
+    Benchmark("data.groupby(level='security_id').ffill()", setup,
+              start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# single pass cython transforms
+
+setup = common_setup + """
+labels = np.random.randint(0, 100000, size=1000000)
+df = DataFrame({'key': labels,
+                'A': np.random.randn(1000000),
+                'B': np.random.randn(1000000)})
+grouped = df.groupby('key')
+"""
+
+groupby_transform_cumsum = \
+    Benchmark("grouped.cumsum()", setup, start_date=datetime(2013, 10, 1))
+
+groupby_transform_shift = \
+    Benchmark("grouped.shift()", setup, start_date=datetime(2013, 10, 1))
+
+groupby_transform_rank = \
+    Benchmark("grouped['A'].rank()", setup, start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# factorized key cache
+
+setup = common_setup + """
+set_option('compute.groupby_cache_size', 8)
+df = DataFrame({'key1': np.random.randint(0, 100000, size=1000000),
+                'key2': np.random.randint(0, 10, size=1000000),
+                'data': np.random.randn(1000000)})
+df.groupby(['key1', 'key2']).sum()
+"""
+
+groupby_multi_cached_keys = Benchmark(
+    "df.groupby(['key1', 'key2']).sum()", setup,
+    cleanup="reset_option('compute.groupby_cache_size')",
+    start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# sort=False groups taken from the unsorted frame
+
+setup = common_setup + """
+labels = np.random.randint(0, 100, size=100000)
+df = DataFrame(randn(100000, 50))
+f = lambda x: x.values.sum()
+"""
+
+groupby_frame_agg_python_sort = Benchmark(
+    'df.groupby(labels).agg(f)', setup,
+    start_date=datetime(2013, 10, 1))
+
+groupby_frame_agg_python_nosort = Benchmark(
+    'df.groupby(labels, sort=False).agg(f)', setup,
+    start_date=datetime(2013, 10, 1))
+
+# iterating over many small groups
+setup = common_setup + """
+labels = np.random.randint(0, 20000, size=200000)
+df = DataFrame(randn(200000, 20))
+
+def iterate(grouped):
+    for key, group in grouped:
+        pass
+"""
+
+groupby_frame_iter_many_groups = Benchmark(
+    'iterate(df.groupby(labels))', setup,
+    start_date=datetime(2013, 10, 1))
+
+groupby_frame_iter_many_groups_nosort = Benchmark(
+    'iterate(df.groupby(labels, sort=False))', setup,
+    start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# several built-in reductions in one pass
+
+setup = common_setup + """
+labels = np.random.randint(0, 1000, size=1000000)
+df = DataFrame({'key': labels,
+                'A': np.random.randn(1000000),
+                'B': np.random.randn(1000000)})
+grouped = df.groupby('key')
+"""
+
+groupby_agg_builtins_fused = Benchmark(
+    "grouped.agg(['sum', 'mean', 'std', 'min', 'max', 'count'])", setup,
+    start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# apply on a pool of processes
+
+setup = common_setup + """
+N = 100000
+df = DataFrame({'key': np.random.randint(0, 200, size=N),
+                'A': np.random.randn(N),
+                'B': np.random.randn(N)})
+
+def f(g):
+    return np.linalg.lstsq(np.c_[g['A'].values, np.ones(len(g))],
+                           g['B'].values)[0]
+"""
+
+groupby_apply_serial = Benchmark(
+    "df.groupby('key').apply(f)", setup,
+    start_date=datetime(2013, 10, 1))
+
+groupby_apply_4_jobs = Benchmark(
+    "df.groupby('key').apply(f, apply_n_jobs=4)", setup,
+    start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# datetime64 aggregation on the int64 view
+
+setup = common_setup + """
+N = 1000000
+df = DataFrame({'key': np.random.randint(0, 10000, size=N),
+                'ts': date_range('1/1/2000', periods=N, freq='s')})
+df['ts'][::10] = np.nan
+"""
+
+groupby_datetime_max = Benchmark(
+    "df.groupby('key')['ts'].max()", setup,
+    start_date=datetime(2013, 10, 1))
+
+groupby_datetime_first = Benchmark(
+    "df.groupby('key').first()", setup,
+    start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# approximate quantiles with t-digests
+
+setup = common_setup + """
+N = 1000000
+df = DataFrame({'key': np.random.randint(0, 1000, size=N),
+                'value': np.random.randn(N)})
+"""
+
+groupby_approx_quantile = Benchmark(
+    "df.groupby('key')['value'].approx_quantile(0.99)", setup,
+    start_date=datetime(2013, 10, 1))
+
+groupby_exact_quantile = Benchmark(
+    "df.groupby('key')['value'].quantile(0.99)", setup,
+    start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# filter with a boolean Series of groups
+
+setup = common_setup + """
+N = 1000000
+df = DataFrame({'key': np.random.randint(0, 10000, size=N),
+                'x': np.random.randn(N)})
+grouped = df.groupby('key')
+"""
+
+groupby_filter_lambda = Benchmark(
+    "grouped.filter(lambda g: len(g) > 100)", setup,
+    start_date=datetime(2013, 10, 1))
+
+groupby_filter_mask = Benchmark(
+    "grouped.filter(grouped.size() > 100)", setup,
+    start_date=datetime(2013, 10, 1))
@@ -276,3 +276,96 @@ write_store_table_dc = Benchmark(
     "store.append('df15',df,data_columns=True)", setup15, cleanup="store.close()",
     start_date=start_date)
 
+
+#----------------------------------------------------------------------
+# select columns and rows from a fixed store
+
+setup16 = common_setup + """
+df = DataFrame(np.random.randn(100000,20),columns = [ 'C%03d' % i for i in xrange(20) ])
+df['string'] = 'foo'
+
+remove(f)
+store = HDFStore(f)
+store.put('df16',df)
+"""
+
+read_store_fixed_columns = Benchmark(
+    "store.select('df16',columns=['C001','C002'],start=1000,stop=11000)",
+    setup16, cleanup="store.close()",
+    start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# select from multiple tables
+
+setup17 = common_setup + """
+index = date_range('1/1/2000', periods = 50000)
+remove(f)
+store = HDFStore(f)
+for i in range(8):
+    df = DataFrame(np.random.randn(50000,10),index=index,
+                   columns = [ 'C%d_%03d' % (i, j) for j in xrange(10) ])
+    store.append('df17_%d' % i,df,data_columns=(True if i == 0 else None))
+keys = [ 'df17_%d' % i for i in range(8) ]
+"""
+
+read_store_table_multiple = Benchmark(
+    "store.select_as_multiple(keys,where=['C0_000>0'],selector=keys[0])",
+    setup17, cleanup="store.close()",
+    start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# query a sorted data column of a table (zone maps)
+
+setup18 = common_setup + """
+df = DataFrame({'A' : np.arange(1000000), 'B' : np.random.randn(1000000)},
+               index=date_range('1/1/2000', periods=1000000, freq='s'))
+remove(f)
+store = HDFStore(f)
+store.append('df18',df,data_columns=['A'])
+"""
+
+query_store_table_sorted = Benchmark(
+    "store.select('df18',where='A>=500000 & A<510000')", setup18,
+    cleanup="store.close()", start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# repeated query with the select cache
+
+setup19 = common_setup + """
+df = DataFrame(np.random.randn(200000,4),columns=list('ABCD'),
+               index=date_range('1/1/2000', periods=200000, freq='s'))
+remove(f)
+store = HDFStore(f, cache_size=10)
+store.append('df19',df,data_columns=['A'])
+"""
+
+query_store_table_cached = Benchmark(
+    "store.select('df19',where='A>0.5')", setup19,
+    cleanup="store.close()", start_date=datetime(2013, 10, 1))
+
+#----------------------------------------------------------------------
+# write / read string columns to / from a table
+
+setup20 = common_setup + """
+index = date_range('1/1/2000', periods = 100000)
+df = DataFrame({'float1' : randn(100000),
+                'string1' : ['foo%d' % (i % 1000) for i in xrange(100000)],
+                'string2' : ['bar%d' % (i % 100) for i in xrange(100000)]},
+               index=index)
+df.ix[::10, 'string1'] = np.nan
+
+remove(f)
+store = HDFStore(f)
+"""
+
+write_store_table_strings = Benchmark(
+    "store.append('df20',df,data_columns=['string2'])", setup20,
+    cleanup="store.close()", start_date=datetime(2013, 10, 1))
+
+setup21 = setup20 + """
+store.append('df21',df,data_columns=['string2'])
+"""
+
+read_store_table_strings = Benchmark(
+    "store.select('df21')", setup21,
+    cleanup="store.close()", start_date=datetime(2013, 10, 1))
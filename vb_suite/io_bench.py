@@ -76,6 +76,15 @@ df        = concat([ df_float, df_int, df_bool, df_object, df_dt ], axis=1)
 frame_to_csv_mixed = Benchmark("df.to_csv('__test__.csv')", setup,
                                start_date=datetime(2012, 6, 1))
 
+#----------------------------------
+setup = common_setup + """
+df = DataFrame(np.random.randn(500000, 4), columns=list('abcd'),
+               index=date_range('1/1/2000', periods=500000, freq='T'))
+"""
+frame_to_csv_float_format = Benchmark("df.to_csv('__test__.csv', "
+                                      "float_format='%.4f')", setup,
+                                      start_date=datetime(2013, 10, 1))
+
 #----------------------------------------------------------------------
 # parse dates, ISO8601 format
 
@@ -88,3 +97,13 @@ stmt = ("read_csv(StringIO(data), header=None, names=['foo'], "
         "         parse_dates=['foo'])")
 read_parse_dates_iso8601 = Benchmark(stmt, setup,
                                      start_date=datetime(2012, 3, 1))
+
+setup = common_setup + """
+rng = date_range('1/1/2000', periods=1000)
+data = '\\n'.join(rng.map(lambda x: x.strftime("%d/%m/%Y %H:%M:%S")))
+"""
+
+stmt = ("read_csv(StringIO(data), header=None, names=['foo'], "
+        "         parse_dates=['foo'], date_format='%d/%m/%Y %H:%M:%S')")
+read_parse_dates_format = Benchmark(stmt, setup,
+                                    start_date=datetime(2013, 10, 1))
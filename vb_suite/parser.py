@@ -79,3 +79,128 @@ data = data * 200
 cmd = "read_table(StringIO(data), sep=',', header=None, parse_dates=[1])"
 sdate = datetime(2012, 5, 7)
 read_table_multiple_date_baseline = Benchmark(cmd, setup, start_date=sdate)
+
+setup = common_setup + """
+import os
+N = 1000000
+K = 8
+df = DataFrame(np.random.randn(N, K) * np.random.randint(100, 10000, (N, K)))
+df.to_csv('test_big.csv', sep='|')
+"""
+
+sdate = datetime(2013, 10, 1)
+read_csv_big_serial = Benchmark("read_csv('test_big.csv', sep='|')", setup,
+                                cleanup="os.remove('test_big.csv')",
+                                start_date=sdate)
+
+read_csv_big_threads = Benchmark("read_csv('test_big.csv', sep='|', "
+                                 "threads=4)", setup,
+                                 cleanup="os.remove('test_big.csv')",
+                                 start_date=sdate)
+
+setup = common_setup + """
+import os
+N = 10000
+K = 400
+df = DataFrame(np.random.randn(N, K))
+df.to_csv('test_wide.csv', sep='|')
+"""
+
+sdate = datetime(2013, 10, 1)
+read_csv_wide_usecols = Benchmark("read_csv('test_wide.csv', sep='|', "
+                                  "usecols=[1, 50, 100, 200, 300, 399])",
+                                  setup,
+                                  cleanup="os.remove('test_wide.csv')",
+                                  start_date=sdate)
+
+setup = common_setup + """
+import os
+N = 1000000
+df = DataFrame({'a': np.random.randn(N), 'b': np.random.randint(0, 100, N),
+                'c': np.random.randn(N)})
+df.to_csv('test_where.csv', index=False)
+"""
+
+sdate = datetime(2013, 10, 1)
+read_csv_where_chunks = Benchmark("concat(list(read_csv('test_where.csv', "
+                                  "chunksize=100000, "
+                                  "where='a > 2 and b < 10')))",
+                                  setup,
+                                  cleanup="os.remove('test_where.csv')",
+                                  start_date=sdate)
+
+setup = common_setup + """
+from pandas.compat import cStringIO as StringIO
+import random
+N = 100000
+levels = ['level_%d' % i for i in range(50)]
+data = 'a,b\\n' + '\\n'.join('%s,%d' % (random.choice(levels), i)
+                             for i in range(N))
+"""
+
+sdate = datetime(2013, 10, 1)
+read_csv_categorical = Benchmark("read_csv(StringIO(data), "
+                                 "dtype={'a': 'category'})", setup,
+                                 start_date=sdate)
+
+setup = common_setup + """
+import os
+import gzip
+N = 500000
+df = DataFrame({'a': np.random.randn(N), 'b': np.random.randint(0, 100, N)})
+f = gzip.GzipFile('test.csv.gz', 'wb')
+f.write(df.to_csv().encode('utf-8'))
+f.close()
+"""
+
+sdate = datetime(2013, 10, 1)
+read_csv_gzip = Benchmark("read_csv('test.csv.gz', compression='gzip')",
+                          setup, cleanup="os.remove('test.csv.gz')",
+                          start_date=sdate)
+
+setup = common_setup + """
+import os
+from pandas.io.parsers import CSVSchema
+N = 500000
+df = DataFrame({'a': np.random.randn(N), 'b': np.random.randn(N),
+                'c': ['foo_%d' % i for i in np.random.randint(0, 100, N)]})
+df.to_csv('test_schema.csv', index=False)
+schema = CSVSchema.infer('test_schema.csv', nrows=1000)
+"""
+
+sdate = datetime(2013, 10, 1)
+read_csv_schema_chunks = Benchmark("concat(list(read_csv('test_schema.csv', "
+                                   "chunksize=10000, schema=schema)))",
+                                   setup,
+                                   cleanup="os.remove('test_schema.csv')",
+                                   start_date=sdate)
+
+setup = common_setup + """
+from pandas import read_fwf
+N = 100000
+lines = ['%-10d%-12.4f%-8s' % (i, x, 'ab%d' % (i % 100))
+         for i, x in enumerate(np.random.randn(N))]
+data = '\\n'.join(lines)
+"""
+
+sdate = datetime(2013, 10, 1)
+read_fwf_widths = Benchmark("read_fwf(StringIO(data), widths=[10, 12, 8], "
+                            "header=None)", setup, start_date=sdate)
+
+setup = common_setup + """
+import os
+N = 100000
+df = DataFrame({'a': np.random.randn(N), 'b': np.random.randint(0, 100, N)})
+paths = ['test_multi_%d.csv' % i for i in range(8)]
+for path in paths:
+    df.to_csv(path, index=False)
+"""
+
+cleanup = """
+for path in paths:
+    os.remove(path)
+"""
+
+sdate = datetime(2013, 10, 1)
+read_csv_multiple_files = Benchmark("read_csv('test_multi_*.csv', threads=4)",
+                                    setup, cleanup=cleanup, start_date=sdate)